@@ -0,0 +1,72 @@
+"""Benchmark du modèle de document : éditions et formatage sur un document de plusieurs Mo.
+
+Compare la table de morceaux à un tampon contigu (bytearray + index de lignes
+reconstruit), l'approche utilisée avant son introduction.
+
+Usage : ``uv run python -m benchmarks.bench_document_model [taille_mo] [editions]``
+"""
+
+import random
+import sys
+import time
+from collections.abc import Callable
+
+from src.document import Document
+from src.line_index import LineIndex
+from src.text_styles import TextStyle
+
+
+def measure(label: str, iterations: int, operation: Callable[[int], object]) -> float:
+    start = time.perf_counter()
+    for i in range(iterations):
+        operation(i)
+    elapsed = time.perf_counter() - start
+    per_operation_us = elapsed / iterations * 1e6
+    print(f"{label:<45} {per_operation_us:10.1f} µs/op")
+    return per_operation_us
+
+
+def make_content(size_mib: int) -> bytes:
+    line = b"2024-01-01 12:00:00,000 INFO  [worker-07] requete traitee en 12 ms\n"
+    return line * (size_mib * 1024 * 1024 // len(line))
+
+
+def main(size_mib: int = 16, edits: int = 2000) -> None:
+    rng = random.Random(0)  # noqa: S311
+    content = make_content(size_mib)
+    print(f"Document de {len(content) / 2**20:.0f} Mio, {content.count(b'\n') + 1} lignes")
+
+    offsets = [rng.randrange(len(content)) for _ in range(edits)]
+
+    # Avant : tampon contigu, index de lignes reconstruit après chaque édition
+    buffer = bytearray(content)
+
+    def contiguous_insert(i: int) -> None:
+        buffer[offsets[i] : offsets[i]] = b"x\n"
+        index = LineIndex(len(buffer))
+        index.scan_chunk(buffer, 0)
+
+    before = measure("avant : insertion (bytearray + index)", max(1, edits // 100), contiguous_insert)
+
+    document = Document(content=content)
+    after = measure("après : insertion (table de morceaux)", edits, lambda i: document.insert(offsets[i], b"x\n"))
+    measure("après : suppression", edits, lambda i: document.delete(offsets[i], offsets[i] + 10))
+    measure("après : lecture d'une ligne", edits, lambda i: document.line_text(offsets[i] % document.line_count, 4096))
+    measure("après : ligne d'une position", edits, lambda i: document.position_of(offsets[i] % document.size))
+    print(f"Gain insertion : x{before / after:.0f} ({document.text.piece_count} morceaux)")
+
+    def toggle(i: int) -> None:
+        start = offsets[i] % document.size
+        end = min(document.size, start + rng.randrange(1, document.size // 2))
+        document.toggle_style(start, end, (TextStyle.BOLD, TextStyle.ITALIC)[i % 2])
+
+    measure("formatage d'une grande sélection", edits, toggle)
+    measure("gras sur tout le document", edits, lambda _: document.toggle_style(0, document.size, TextStyle.BOLD))
+    print(f"Runs de style : {len(document.styles)}")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 16,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 2000,
+    )
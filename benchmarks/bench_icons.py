@@ -0,0 +1,48 @@
+"""Benchmark du chargement des icônes de la barre d'outils.
+
+Compare des ``QIcon`` construits depuis un chemin relatif (décodés à chaque
+fenêtre) au registre d'icônes partagé.
+
+Usage : ``uv run python -m benchmarks.bench_icons [windows]``
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtGui import QIcon  # noqa: E402
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+
+from src.domain.constants import WORKSPACE_DIR  # noqa: E402
+from src.icons import IconRegistry  # noqa: E402
+
+ICON_NAMES = ("new", "open", "save")
+
+
+def main(windows: int = 200) -> None:
+    app = QApplication.instance() or QApplication(sys.argv)
+    os.chdir(WORKSPACE_DIR)
+
+    start = time.perf_counter()
+    for _ in range(windows):
+        for name in ICON_NAMES:
+            QIcon(f"icons/{name}.png").pixmap(32, 32)
+    before = (time.perf_counter() - start) / windows * 1000
+
+    registry = IconRegistry()
+    start = time.perf_counter()
+    for _ in range(windows):
+        for name in ICON_NAMES:
+            registry.icon(name).pixmap(32, 32)
+    after = (time.perf_counter() - start) / windows * 1000
+
+    print(f"Icônes de la barre d'outils, {windows} fenêtres ({registry.use_resources=})")
+    print(f"avant (QIcon par chemin relatif) {before:8.3f} ms/fenêtre")
+    print(f"après (IconRegistry)             {after:8.3f} ms/fenêtre")
+    app.quit()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
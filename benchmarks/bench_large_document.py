@@ -0,0 +1,92 @@
+"""Benchmark de l'ouverture d'un gros fichier texte/log.
+
+Mesure le temps jusqu'au premier écran, le temps d'indexation complète et la
+mémoire résidente (RSS), comparés à une lecture complète du fichier en mémoire.
+
+Usage : ``uv run python -m benchmarks.bench_large_document [taille_mo] [fichier]``
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+
+from src.instrumentation import PaintEventCounter  # noqa: E402
+from src.main_windows import MainWindow  # noqa: E402
+
+
+def rss_mib() -> float:
+    """Mémoire résidente courante du processus (Linux), en Mio"""
+    status = Path("/proc/self/status")
+    if not status.exists():
+        return float("nan")
+
+    for line in status.read_text().splitlines():
+        if line.startswith("VmRSS:"):
+            return int(line.split()[1]) / 1024
+    return float("nan")
+
+
+def generate_log(path: Path, size_mib: int) -> None:
+    line = b"2024-01-01 12:00:00,000 INFO  [worker-07] requete traitee en 12 ms pour /api/v1/documents\n"
+    block = line * (1024 * 1024 // len(line))
+    with open(path, "wb") as file:
+        for _ in range(size_mib):
+            file.write(block)
+
+
+def main(size_mib: int = 512, path: Path | None = None) -> None:
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        if path is None:
+            path = Path(directory) / "large.log"
+            print(f"Génération de {size_mib} Mio de log…")
+            generate_log(path, size_mib)
+
+        window = MainWindow()
+        window.show()
+        app.processEvents()
+        if (viewport := window.document_view.viewport()) is None:
+            return
+        counter = PaintEventCounter()
+        counter.watch(viewport)
+
+        rss_before = rss_mib()
+        start = time.perf_counter()
+        window.open_file(path)
+        while counter.count == 0:
+            app.processEvents()
+        first_screen = time.perf_counter() - start
+
+        while window.io_worker is not None:
+            app.processEvents()
+            time.sleep(0.001)
+        indexed = time.perf_counter() - start
+        rss_after = rss_mib()
+
+        print(f"Fichier : {path.stat().st_size / 2**20:.0f} Mio, {window.document.line_count} lignes")
+        print(f"Premier écran          : {first_screen * 1000:8.1f} ms")
+        print(f"Indexation complète    : {indexed * 1000:8.1f} ms")
+        print(f"RSS (mmap + index)     : +{rss_after - rss_before:.0f} Mio")
+        window.close()
+
+        rss_before = rss_mib()
+        start = time.perf_counter()
+        lines = path.read_bytes().splitlines()
+        naive = time.perf_counter() - start
+        print(
+            f"Lecture complète naïve : {naive * 1000:8.1f} ms, RSS +{rss_mib() - rss_before:.0f} Mio ({len(lines)} lignes)"
+        )
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 512,
+        Path(sys.argv[2]) if len(sys.argv) > 2 else None,
+    )
@@ -0,0 +1,80 @@
+"""Benchmark du passage à l'échelle du pool de processus.
+
+Calcule les statistiques d'un document de ``taille_mo`` Mio dans le thread
+appelant, puis réparties sur 1, 2, 4… processus, jusqu'au nombre de cœurs. Les processus sont démarrés avant la
+mesure : seuls la copie en mémoire partagée et le calcul sont comptés.
+
+Usage : ``uv run python -m benchmarks.bench_process_pool [taille_mo] [processus_max]``
+"""
+
+import os
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import Any
+
+from src.domain.constants import IO_CHUNK_SIZE
+from src.process_pool import ProcessPool, ProcessTask, ProcessTaskWorker
+from src.process_tasks import merge_statistics, text_statistics
+
+LINE = "2024-01-01 12:00:00,000 INFO  [worker-07] requête traitée en 12 ms pour /api/v1/documents\n".encode()
+Combine = Callable[[list[Any]], object]
+TASKS: list[tuple[str, ProcessTask, Combine, tuple[object, ...]]] = [
+    ("statistiques", text_statistics, merge_statistics, ()),
+]
+
+
+def run(pool: ProcessPool, text: bytes, task: ProcessTask, combine: Combine, args: tuple[object, ...]) -> float:
+    """Médiane (ms) de trois exécutions complètes : copie en mémoire partagée, calcul, assemblage"""
+    timings = []
+    for _ in range(3):
+        chunks = (text[start : start + IO_CHUNK_SIZE] for start in range(0, len(text), IO_CHUNK_SIZE))
+        worker = ProcessTaskWorker(Path(), pool, chunks, len(text), task, combine, args)
+        start = time.perf_counter()
+        worker.work()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def in_thread(text: bytes, task: ProcessTask, args: tuple[object, ...]) -> float:
+    """Durée (ms) du même calcul dans le thread appelant, sur une seule partie"""
+    shared = SharedMemory(create=True, size=len(text))
+    try:
+        if shared.buf is not None:
+            shared.buf[: len(text)] = text
+        start = time.perf_counter()
+        task(shared.name, 0, len(text), *args)
+        return (time.perf_counter() - start) * 1000
+    finally:
+        shared.close()
+        shared.unlink()
+
+
+def main(size_mib: int = 256, max_workers: int | None = None) -> None:
+    cores = os.process_cpu_count() or 1
+    max_workers = max_workers or cores
+    text = LINE * (size_mib * 1024 * 1024 // len(LINE))
+    print(f"Document : {len(text) / (1024 * 1024):.0f} Mio, {cores} cœurs disponibles")
+
+    counts = sorted({1, *(2**i for i in range(1, max_workers.bit_length()) if 2**i <= max_workers), max_workers})
+    print(f"{'tâche':<14} {'processus':>10} {'durée (ms)':>11} {'accélération':>13}")
+    for label, task, combine, args in TASKS:
+        reference = in_thread(text, task, args)
+        print(f"{label:<14} {'thread':>10} {reference:>11.1f} {1:>13.2f}")
+        for count in counts:
+            pool = ProcessPool(count)
+            # Démarrage des processus hors mesure
+            list(pool.executor().map(abs, range(count)))
+            elapsed = run(pool, text, task, combine, args)
+            pool.shutdown()
+            print(f"{label:<14} {count:>10} {elapsed:>11.1f} {reference / elapsed:>13.2f}")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 256,
+        int(sys.argv[2]) if len(sys.argv) > 2 else None,
+    )
@@ -0,0 +1,127 @@
+"""Benchmark de l'index de recherche plein texte.
+
+Génère un journal de ``taille_mo`` Mio (identifiants de requête variés,
+quelques lignes rares), puis mesure le temps de construction de l'index, son
+empreinte mémoire, et pour plusieurs requêtes le délai jusqu'au premier lot
+d'occurrences et la durée totale, comparés à un parcours complet du texte.
+
+Usage : ``uv run python -m benchmarks.bench_search [taille_mo] [fichier]``
+"""
+
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.bench_large_document import rss_mib
+from src.document import Document
+from src.search_index import TextSnapshot
+
+QUERIES = [
+    ("mot rare", b"segfault"),
+    ("fragment rare", b"egfaul"),
+    ("plusieurs mots", b"erreur fatale dans"),
+    ("mot fréquent", b"requete"),
+    ("identifiant", b"req-4242"),
+    ("sans mot", b" -> "),
+]
+
+
+def generate_log(path: Path, size_mib: int) -> None:
+    rng = random.Random(0)  # noqa: S311
+    levels = [b"INFO ", b"DEBUG", b"WARN "]
+    with open(path, "wb") as file:
+        written = 0
+        while written < size_mib * 1024 * 1024:
+            lines = []
+            for _ in range(10_000):
+                request = rng.randrange(1_000_000)
+                lines.append(
+                    b"2024-01-01 12:%02d:%02d,%03d %s [worker-%02d] requete req-%d traitee en %d ms -> /api/v1/%s\n"
+                    % (
+                        rng.randrange(60),
+                        rng.randrange(60),
+                        rng.randrange(1000),
+                        rng.choice(levels),
+                        rng.randrange(16),
+                        request,
+                        rng.randrange(500),
+                        rng.choice([b"documents", b"utilisateurs", b"sessions", b"recherche"]),
+                    )
+                )
+            if rng.random() < 0.05:
+                lines.append(b"2024-01-01 12:00:00,000 ERROR erreur fatale dans le worker : segfault\n")
+            chunk = b"".join(lines)
+            file.write(chunk)
+            written += len(chunk)
+
+
+def plain_scan(document: Document, query: bytes) -> int:
+    """Parcours complet du texte sans index, pour comparaison"""
+    buffer = document.content
+    count = 0
+    position = buffer.find(query)
+    while position != -1:
+        count += 1
+        position = buffer.find(query, position + 1)
+    return count
+
+
+def measure(document: Document, query: bytes, runs: int = 5) -> tuple[float, float, int]:
+    """Médianes (ms) du délai jusqu'au premier lot non vide et de la recherche complète, et nombre d'occurrences"""
+    firsts, totals = [], []
+    count = 0
+    for _ in range(runs):
+        start = time.perf_counter()
+        first = None
+        count = 0
+        for matches in document.search_index.search(query, TextSnapshot(document.text)):
+            if matches and first is None:
+                first = time.perf_counter() - start
+            count += len(matches)
+        total = time.perf_counter() - start
+        firsts.append((first if first is not None else total) * 1000)
+        totals.append(total * 1000)
+    return statistics.median(firsts), statistics.median(totals), count
+
+
+def main(size_mib: int = 128, path: Path | None = None) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        if path is None:
+            path = Path(directory) / "search.log"
+            print(f"Génération de {size_mib} Mio de log…")
+            generate_log(path, size_mib)
+
+        document = Document.open(path)
+        size = document.size / (1024 * 1024)
+        rss_before = rss_mib()
+        start = time.perf_counter()
+        document.search_index.index_original()
+        build = time.perf_counter() - start
+        rss_growth = rss_mib() - rss_before
+        memory = document.search_index.memory() / (1024 * 1024)
+        vocabulary = len(document.search_index.indexes[0])
+
+        print(f"Fichier : {size:.0f} Mio")
+        print(f"Construction de l'index : {build:.2f} s ({size / build:.0f} Mio/s)")
+        print(f"Index : {vocabulary} mots, {memory:.1f} Mio ({memory / size * 100:.1f} % du fichier)")
+        print(f"RSS : +{rss_growth:.1f} Mio (pages du fichier comprises)")
+        print()
+        print(f"{'requête':<16} {'occurrences':>12} {'1er lot (ms)':>13} {'total (ms)':>11} {'sans index (ms)':>16}")
+        for label, query in QUERIES:
+            first, total, count = measure(document, query)
+            start = time.perf_counter()
+            expected = plain_scan(document, query)
+            scan = (time.perf_counter() - start) * 1000
+            assert count == expected  # noqa: S101
+            print(f"{label:<16} {count:>12} {first:>13.2f} {total:>11.2f} {scan:>16.2f}")
+        document.close()
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 128,
+        Path(sys.argv[2]) if len(sys.argv) > 2 else None,
+    )
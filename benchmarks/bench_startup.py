@@ -0,0 +1,168 @@
+"""Benchmark du démarrage : création de QApplication jusqu'au premier show() terminé.
+
+Chaque mesure est faite dans un processus neuf (plateforme offscreen). Le
+mode ``session`` démarre comme ``lazy`` en restaurant une session de
+``documents`` onglets (seul l'onglet courant est rouvert), à comparer au
+démarrage à froid. Le mode ``paths`` démarre comme ``lazy`` avec les icônes
+chargées comme avant le registre (``QIcon`` sur un chemin relatif au
+répertoire courant), à comparer à ``lazy``. Le mode ``splash`` suit le chemin de ``main.py`` : écran
+de démarrage peint avant l'import de la fenêtre principale ; la médiane de
+son premier affichage est comparée à ``STARTUP_FIRST_FRAME_BUDGET`` (code de
+sortie 1 en cas de dépassement). Le rapport commence par les modules les plus
+longs à importer (``python -X importtime``) depuis le point d'entrée.
+
+Usage : ``uv run python -m benchmarks.bench_startup [runs] [documents]``
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from src.domain.constants import STARTUP_FIRST_FRAME_BUDGET, WORKSPACE_DIR
+
+
+def write_session(directory: Path, documents: int) -> Path:
+    """Session de ``documents`` fichiers d'environ 1 Mio, le premier étant l'onglet courant"""
+    from src.session import SessionState, SessionStore
+
+    paths = []
+    for index in range(documents):
+        path = directory / f"document_{index}.log"
+        path.write_bytes(b"2024-01-01 12:00:00,000 INFO requete traitee en 12 ms\n" * 20_000)
+        paths.append((path, (0, 0, 10_000, 0)))
+    session_path = directory / "session.bin"
+    SessionStore(session_path).save(SessionState(theme="dark", action_counter=12, documents=paths))
+    return session_path
+
+
+def measure_startup(lazy: bool, session_path: Path | None = None, icon_paths: bool = False) -> float:
+    """Mesure un démarrage dans le processus courant, en millisecondes"""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    start = time.perf_counter()
+    from PyQt6.QtGui import QIcon
+    from PyQt6.QtWidgets import QApplication
+
+    from src.icons import icon_registry
+    from src.main_windows import MainWindow
+    from src.session import SessionStore
+
+    if icon_paths:
+        # Chargement d'avant le registre : une QIcon par action, résolue depuis le répertoire courant
+        icon_registry.icon = lambda name: QIcon(f"icons/{name}.png")  # type: ignore[method-assign]
+    app = QApplication(sys.argv)
+    session = SessionStore(session_path) if session_path is not None else None
+    window = MainWindow(lazy=lazy, session=session)
+    window.show()
+    app.processEvents()
+    elapsed = (time.perf_counter() - start) * 1000
+
+    # Fermeture hors mesure, sans réécrire la session : l'indexation en cours est annulée et attendue
+    window.session = None
+    window.close()
+    window.thread_pool.waitForDone()
+    return elapsed
+
+
+def measure_first_frame() -> tuple[float, float]:
+    """Mesure le chemin de ``main.py`` : écran de démarrage peint, puis fenêtre affichée (ms)"""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    start = time.perf_counter()
+    from PyQt6.QtWidgets import QApplication
+
+    from src.splash import is_exposed, show_splash
+
+    app = QApplication(sys.argv)
+    splash = show_splash("pyqt_tp_chap2")
+    # Premier affichage : fenêtre exposée et peinte, la boucle d'événements ayant tourné ; infini si jamais exposée
+    first_frame = (time.perf_counter() - start) * 1000 if is_exposed(splash) else float("inf")
+
+    from src.main_windows import MainWindow
+
+    window = MainWindow(lazy=True)
+    window.show()
+    splash.close()
+    app.processEvents()
+    elapsed = (time.perf_counter() - start) * 1000
+    window.close()
+    return first_frame, elapsed
+
+
+def import_times(module: str, count: int = 10) -> tuple[float, list[tuple[float, str]]]:
+    """Durée d'import (ms) de ``module`` et ses ``count`` dépendances les plus longues, d'après ``-X importtime``"""
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=WORKSPACE_DIR,
+    )
+    imports = []
+    for line in output.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _self, cumulative, name = line.removeprefix("import time:").split("|")
+        if cumulative.strip().isdigit():
+            imports.append((int(cumulative) / 1000, name.strip()))
+    total = next((cumulative for cumulative, name in imports if name == module), 0.0)
+    return total, sorted((item for item in imports if item[1] != module), reverse=True)[:count]
+
+
+def run(mode: str, runs: int, *args: str) -> list[float]:
+    """Mesures de ``runs`` processus neufs ; en mode ``splash``, celles du premier affichage"""
+    timings = []
+    for _ in range(runs):
+        output = subprocess.run(  # noqa: S603
+            [sys.executable, "-m", "benchmarks.bench_startup", "--child", mode, *args],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=WORKSPACE_DIR,
+        )
+        timings.append(float(output.stdout.strip().splitlines()[-1].split()[0]))
+    return timings
+
+
+def main(runs: int = 10, documents: int = 10) -> bool:
+    """Affiche le rapport, False si le premier affichage dépasse son budget"""
+    total, imports = import_times("main")
+    print(f"Imports du point d'entrée : {total:.1f} ms")
+    for cumulative, name in imports:
+        print(f"  {cumulative:7.1f} ms  {name}")
+    print()
+
+    print(f"Démarrage (QApplication -> premier show()), {runs} processus par mode")
+    with tempfile.TemporaryDirectory() as directory:
+        session_path = write_session(Path(directory), documents)
+        for mode, args in (("eager", ()), ("lazy", ()), ("paths", ()), ("session", (str(session_path),))):
+            timings = run(mode, runs, *args)
+            print(f"{mode:<7} médiane {statistics.median(timings):7.1f} ms   min {min(timings):7.1f} ms")
+    print(f"(paths : icônes sans registre ; session : {documents} onglets restaurés)")
+
+    first_frames = run("splash", runs)
+    median = statistics.median(first_frames)
+    verdict = "ok" if median <= STARTUP_FIRST_FRAME_BUDGET else "DÉPASSÉ"
+    print(
+        f"Premier affichage (écran de démarrage) : médiane {median:.1f} ms, budget {STARTUP_FIRST_FRAME_BUDGET} ms, {verdict}"
+    )
+    return median <= STARTUP_FIRST_FRAME_BUDGET
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "--child":
+        if sys.argv[2] == "splash":
+            print(" ".join(f"{timing:.3f}" for timing in measure_first_frame()))
+        else:
+            session_path = Path(sys.argv[3]) if sys.argv[2] == "session" else None
+            print(f"{measure_startup(sys.argv[2] != 'eager', session_path, sys.argv[2] == 'paths'):.3f}")
+    else:
+        within_budget = main(
+            int(sys.argv[1]) if len(sys.argv) > 1 else 10,
+            int(sys.argv[2]) if len(sys.argv) > 2 else 10,
+        )
+        sys.exit(0 if within_budget else 1)
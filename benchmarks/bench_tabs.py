@@ -0,0 +1,86 @@
+"""Benchmark du passage à l'échelle des onglets.
+
+Ouvre jusqu'à ``nombre`` documents (fichiers projetés en mémoire) et relève,
+à chaque palier, la mémoire résidente (RSS) et la latence d'un changement
+d'onglet (affichage compris). Les onglets inactifs ne gardent que leur
+document : la mémoire doit croître avec les index de lignes, pas avec la
+taille des fichiers ouverts.
+
+Usage : ``uv run python -m benchmarks.bench_tabs [nombre] [taille_kio]``
+"""
+
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+
+from benchmarks.bench_large_document import rss_mib  # noqa: E402
+from src.main_windows import MainWindow  # noqa: E402
+
+STEPS = (1, 10, 50, 100, 200, 500)
+
+
+def generate_file(path: Path, size_kib: int) -> None:
+    line = b"2024-01-01 12:00:00,000 INFO  [worker-07] requete traitee en 12 ms pour /api/v1/documents\n"
+    path.write_bytes(line * (size_kib * 1024 // len(line)))
+
+
+def switch_latency(app: QApplication, window: MainWindow, switches: int = 200) -> float:
+    """Médiane (ms) d'un changement d'onglet vers un onglet tiré en alternance, affichage compris"""
+    timings = []
+    count = len(window.tabs)
+    for i in range(switches):
+        start = time.perf_counter()
+        window.tab_bar.setCurrentIndex((i * 7 + 1) % count)
+        if (viewport := window.document_view.viewport()) is not None:
+            viewport.repaint()
+        app.processEvents()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main(tab_count: int = 200, size_kib: int = 1024) -> None:
+    app = QApplication.instance() or QApplication(sys.argv)
+    assert isinstance(app, QApplication)  # noqa: S101
+
+    with tempfile.TemporaryDirectory() as directory:
+        print(f"Génération de {tab_count} fichiers de {size_kib} Kio…")
+        paths = [Path(directory) / f"document-{i}.log" for i in range(tab_count)]
+        for path in paths:
+            generate_file(path, size_kib)
+
+        window = MainWindow()
+        window.resize(1000, 800)
+        window.show()
+        app.processEvents()
+        rss_start = rss_mib()
+
+        print(f"{'onglets':>8} {'ouverts (Mio)':>14} {'RSS (Mio)':>10} {'Mio/onglet':>11} {'changement (ms)':>16}")
+        opened = 0
+        for step in (step for step in STEPS if step <= tab_count):
+            while opened < step:
+                window.open_file(paths[opened])
+                while window.io_worker is not None:
+                    app.processEvents()
+                    time.sleep(0.0005)
+                opened += 1
+
+            latency = switch_latency(app, window)
+            growth = rss_mib() - rss_start
+            print(
+                f"{opened:>8} {opened * size_kib / 1024:>14.0f} {growth:>10.1f} {growth / opened:>11.3f} {latency:>16.3f}"
+            )
+        window.close()
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 200,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 1024,
+    )
@@ -0,0 +1,71 @@
+"""Benchmark du changement de thème sur la plateforme Qt offscreen.
+
+Le changement complet est dominé par le repolish des widgets par Qt, identique
+avant et après ; la préparation de la feuille de style (lecture du fichier et
+concaténation des règles des notifications), seule partie évitable, est donc
+aussi mesurée séparément.
+
+Usage : ``uv run python -m benchmarks.bench_theme_switch [iterations]``
+"""
+
+import os
+import sys
+import time
+from collections.abc import Callable
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+
+from src.domain.constants import CSS_DARK_FILE_PATH, CSS_LIGHT_FILE_PATH  # noqa: E402
+from src.main_windows import MainWindow  # noqa: E402
+from src.notifications import notification_stylesheet  # noqa: E402
+from src.theme_manager import Theme, ThemeManager  # noqa: E402
+from src.utils import load_css  # noqa: E402
+
+
+def measure(label: str, iterations: int, switch: Callable[[int], object]) -> float:
+    start = time.perf_counter()
+    for i in range(iterations):
+        switch(i)
+    elapsed = time.perf_counter() - start
+    per_switch_us = elapsed / iterations * 1e6
+    print(f"{label:<40} {per_switch_us:10.1f} µs/switch")
+    return per_switch_us
+
+
+def main(iterations: int = 2000) -> None:
+    app = QApplication.instance() or QApplication(sys.argv)
+    window = MainWindow()
+    window.show()
+    app.processEvents()
+
+    paths = (CSS_LIGHT_FILE_PATH, CSS_DARK_FILE_PATH)
+    themes: tuple[Theme, Theme] = ("light", "dark")
+    manager = ThemeManager(extra_stylesheet=notification_stylesheet)
+
+    print(f"Préparation de la feuille de style : {iterations} itérations")
+    prepare_before = measure(
+        "avant (load_css + règles, alterné)", iterations, lambda i: load_css(paths[i % 2]) + notification_stylesheet()
+    )
+    prepare_after = measure(
+        "après (ThemeManager, alterné)", iterations, lambda i: manager.full_stylesheet(themes[i % 2])
+    )
+    print(f"Gain alterné : x{prepare_before / prepare_after:.1f}")
+    print()
+
+    print(f"Changements de thème : {iterations} itérations")
+    before = measure(
+        "avant (load_css + setStyleSheet)",
+        iterations,
+        lambda i: window.setStyleSheet(load_css(paths[i % 2]) + notification_stylesheet()),
+    )
+    after = measure("après (ThemeManager, alterné)", iterations, lambda i: manager.apply(window, themes[i % 2]))
+    same = measure("après (ThemeManager, thème déjà actif)", iterations, lambda _: manager.apply(window, "dark"))
+    print(f"Gain alterné : x{before / after:.2f} / thème déjà actif : x{before / same:.0f}")
+
+    window.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
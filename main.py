@@ -1,16 +1,41 @@
+import os
+from pathlib import Path
+
+from PyQt6.QtCore import QStandardPaths
 from PyQt6.QtWidgets import QApplication
 
-from src.main_windows import MainWindow
+from src.domain.constants import AUTOSAVE_DIR_NAME, INSTRUMENTATION_ENV_VAR, SESSION_FILE_NAME, TELEMETRY_DIR_NAME
+from src.splash import show_splash
 
 
 def main() -> None:
     """Entry point for pyqt_tp_chap2."""
 
     app = QApplication([])
-    window = MainWindow()
+    app.setApplicationName("pyqt_tp_chap2")
+    splash = show_splash(app.applicationName())
+
+    # Fenêtre principale et modules des documents importés après le premier affichage
+    from src.autosave import Autosave, AutosaveStore
+    from src.instrumentation import Instrumentation
+    from src.main_windows import MainWindow
+    from src.session import SessionStore
+    from src.telemetry import UsageLog, UsageRecorder
+
+    instrumentation = Instrumentation() if (dump_path := os.environ.get(INSTRUMENTATION_ENV_VAR)) else None
+    data_dir = Path(QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppDataLocation))
+    usage = UsageRecorder(UsageLog(data_dir / TELEMETRY_DIR_NAME))
+    autosave = Autosave(AutosaveStore(data_dir / AUTOSAVE_DIR_NAME))
+    session = SessionStore(data_dir / SESSION_FILE_NAME)
+    window = MainWindow(lazy=True, instrumentation=instrumentation, usage=usage, autosave=autosave, session=session)
     window.show()
+    splash.close()
     app.exec()
 
+    if instrumentation is not None and dump_path:
+        instrumentation.log_snapshot()
+        instrumentation.dump_json(Path(dump_path))
+
 
 if __name__ == "__main__":
     main()
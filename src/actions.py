@@ -0,0 +1,332 @@
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from src.notifications import NotificationType
+from src.text_styles import TextStyle
+
+if TYPE_CHECKING:
+    from src.main_windows import MainWindow
+
+
+class ActionFeedback:
+    """Retour d'une action : libellé du compteur, notification et message de statut"""
+
+    def __init__(
+        self,
+        action_name: str,
+        notification: str,
+        notification_type: NotificationType,
+        status_message: str | None = None,
+        status_timeout: int = 2000,
+    ) -> None:
+        self.action_name = action_name
+        self.notification = notification
+        self.notification_type = notification_type
+        self.status_message = status_message
+        self.status_timeout = status_timeout
+
+
+ActionHandler = Callable[["MainWindow"], ActionFeedback | None]
+
+
+class ActionSpec:
+    """Description déclarative d'une action de la fenêtre principale"""
+
+    def __init__(
+        self,
+        name: str,
+        text: str,
+        handler: ActionHandler,
+        shortcut: str | None = None,
+        icon: str | None = None,
+        status_tip: str | None = None,
+        checkable: bool = False,
+        checked: bool = False,
+    ) -> None:
+        self.name = name
+        self.text = text
+        self.handler = handler
+        self.shortcut = shortcut
+        self.icon = icon
+        self.status_tip = status_tip
+        self.checkable = checkable
+        self.checked = checked
+
+
+# === Mutations d'état des actions ===
+
+
+IO_BUSY_MESSAGE = "Une opération fichier est déjà en cours"
+NO_SELECTION_MESSAGE = "Aucun texte sélectionné"
+
+
+def new_document(window: "MainWindow") -> ActionFeedback:
+    if window.is_busy():
+        return ActionFeedback("Nouveau document", IO_BUSY_MESSAGE, "warning")
+
+    window.new_document()
+    return ActionFeedback(
+        "Nouveau document", "Nouveau document créé avec succès", "success", "Nouvel onglet ouvert", 1000
+    )
+
+
+def open_document(window: "MainWindow") -> ActionFeedback | None:
+    if window.is_busy():
+        return ActionFeedback("Ouvrir document", IO_BUSY_MESSAGE, "warning")
+
+    if (path := window.ask_open_path()) is None or not window.open_file(path):
+        return None
+    return ActionFeedback("Ouvrir document", f"Ouverture de {path.name}…", "info", f"Ouverture de {path.name}…", 1000)
+
+
+def save_document(window: "MainWindow") -> ActionFeedback | None:
+    if window.is_busy():
+        return ActionFeedback("Sauvegarder document", IO_BUSY_MESSAGE, "warning")
+
+    if (path := window.document.path or window.ask_save_path()) is None or not window.save_file(path):
+        return None
+    return ActionFeedback(
+        "Sauvegarder document", f"Sauvegarde de {path.name}…", "info", f"Sauvegarde de {path.name}…", 1000
+    )
+
+
+def close_tab(window: "MainWindow") -> ActionFeedback | None:
+    if window.is_busy():
+        return ActionFeedback("Fermer l'onglet", IO_BUSY_MESSAGE, "warning")
+
+    name = window.document.name
+    if not window.close_tab(window.tab_bar.currentIndex()):
+        return None
+    return ActionFeedback("Fermer l'onglet", f"{name} fermé", "info", f"{name} fermé", 1000)
+
+
+def cancel_io(window: "MainWindow") -> ActionFeedback | None:
+    if not window.cancel_io():
+        return None
+    return ActionFeedback("Annuler opération", "Annulation demandée", "warning")
+
+
+def quit_application(window: "MainWindow") -> None:
+    window.close()
+
+
+def apply_light_theme(window: "MainWindow") -> ActionFeedback:
+    window.theme_manager.apply(window, "light")
+    return ActionFeedback("Thème clair", "Thème clair appliqué", "info")
+
+
+def apply_dark_theme(window: "MainWindow") -> ActionFeedback:
+    window.theme_manager.apply(window, "dark")
+    return ActionFeedback("Thème sombre", "Thème sombre appliqué", "info")
+
+
+def undo_edit(window: "MainWindow") -> ActionFeedback:
+    if window.is_busy():
+        return ActionFeedback("Annuler", IO_BUSY_MESSAGE, "warning")
+
+    if not window.undo():
+        return ActionFeedback("Annuler", "Aucune modification à annuler", "warning")
+    return ActionFeedback("Annuler", "Modification annulée", "info", "Modification annulée")
+
+
+def redo_edit(window: "MainWindow") -> ActionFeedback:
+    if window.is_busy():
+        return ActionFeedback("Rétablir", IO_BUSY_MESSAGE, "warning")
+
+    if not window.redo():
+        return ActionFeedback("Rétablir", "Aucune modification à rétablir", "warning")
+    return ActionFeedback("Rétablir", "Modification rétablie", "info", "Modification rétablie")
+
+
+def copy_content(window: "MainWindow") -> ActionFeedback:
+    if not window.copy_selection():
+        return ActionFeedback("Copier", NO_SELECTION_MESSAGE, "warning", NO_SELECTION_MESSAGE)
+    return ActionFeedback("Copier", "Contenu copié dans le presse-papier", "success", "Contenu copié")
+
+
+def cut_content(window: "MainWindow") -> ActionFeedback:
+    if window.is_busy():
+        return ActionFeedback("Couper", IO_BUSY_MESSAGE, "warning")
+
+    if not window.cut_selection():
+        return ActionFeedback("Couper", NO_SELECTION_MESSAGE, "warning", NO_SELECTION_MESSAGE)
+    return ActionFeedback("Couper", "Contenu coupé et placé dans le presse-papier", "success", "Contenu coupé")
+
+
+def paste_content(window: "MainWindow") -> ActionFeedback:
+    if window.is_busy():
+        return ActionFeedback("Coller", IO_BUSY_MESSAGE, "warning")
+
+    if (job := window.paste_clipboard()) is None:
+        return ActionFeedback("Coller", "Aucun contenu à coller", "warning", "Aucun contenu à coller")
+    if job.is_running():
+        # Gros collage : la fin est notifiée par la fenêtre
+        size = len(job.data) / (1024 * 1024)
+        return ActionFeedback("Coller", f"Collage de {size:.1f} Mo…", "info", f"Collage de {size:.1f} Mo…", 1000)
+    return ActionFeedback("Coller", "Contenu collé avec succès", "success", "Contenu collé avec succès")
+
+
+def find_text(window: "MainWindow") -> ActionFeedback | None:
+    if (query := window.ask_search_text()) is None or not window.find_text(query):
+        return None
+    return ActionFeedback("Rechercher", f"Recherche de « {query} »…", "info", f"Recherche de « {query} »…", 1000)
+
+
+def find_next(window: "MainWindow") -> ActionFeedback:
+    if (index := window.find_next()) is not None:
+        status = f"Occurrence {index + 1} sur {len(window.search_results)}"
+        return ActionFeedback("Rechercher le suivant", status, "info", status, 1000)
+
+    if not window.search_query:
+        return find_text(window) or ActionFeedback("Rechercher le suivant", "Aucune recherche", "warning")
+    if window.search_worker is None:
+        # Occurrences abandonnées après une modification : la recherche est relancée
+        window.find_text(window.search_query)
+    return ActionFeedback(
+        "Rechercher le suivant", f"Recherche de « {window.search_query} »…", "info", "Recherche en cours…", 1000
+    )
+
+
+def document_statistics(window: "MainWindow") -> ActionFeedback:
+    window.compute_statistics()
+    return ActionFeedback(
+        "Statistiques", "Calcul des statistiques du document…", "info", "Calcul des statistiques…", 1000
+    )
+
+
+def toggle_bold(window: "MainWindow") -> ActionFeedback:
+    if window.is_busy():
+        # L'action cochable a déjà basculé : elle reprend l'état réel
+        window.bold_action.setChecked(window.is_bold)
+        return ActionFeedback("Gras", IO_BUSY_MESSAGE, "warning")
+
+    # Avec une sélection, le style s'applique à la plage ; sinon il vaut pour la suite de la saisie
+    if (enabled := window.toggle_selection_style(TextStyle.BOLD)) is None:
+        enabled = not window.is_bold
+    window.is_bold = enabled
+    if window.is_bold:
+        return ActionFeedback("Activer gras", "Formatage gras activé", "info", "Formatage gras activé")
+    return ActionFeedback("Désactiver gras", "Formatage gras désactivé", "info", "Formatage gras désactivé")
+
+
+def toggle_italic(window: "MainWindow") -> ActionFeedback:
+    if window.is_busy():
+        window.italic_action.setChecked(window.is_italic)
+        return ActionFeedback("Italique", IO_BUSY_MESSAGE, "warning")
+
+    if (enabled := window.toggle_selection_style(TextStyle.ITALIC)) is None:
+        enabled = not window.is_italic
+    window.is_italic = enabled
+    if window.is_italic:
+        return ActionFeedback("Activer italique", "Formatage italique activé", "info", "Formatage italique activé")
+    return ActionFeedback("Désactiver italique", "Formatage italique désactivé", "info", "Formatage italique désactivé")
+
+
+def toggle_toolbar_visibility(window: "MainWindow") -> ActionFeedback | None:
+    if window.toolbar is None:
+        return None
+
+    is_visible = not window.toolbar.isVisible()
+    window.toolbar.setVisible(is_visible)
+    # Synchroniser l'état de l'action avec la visibilité réelle
+    window.toolbar_view_action.setChecked(is_visible)
+
+    if is_visible:
+        return ActionFeedback("Afficher barre d'outils", "Barre d'outils affichée", "info", "Barre d'outils affichée")
+    return ActionFeedback("Masquer barre d'outils", "Barre d'outils masquée", "info", "Barre d'outils masquée")
+
+
+def toggle_statusbar_visibility(window: "MainWindow") -> ActionFeedback | None:
+    if (status_bar := window.statusBar()) is None:
+        return None
+
+    is_visible = not status_bar.isVisible()
+    status_bar.setVisible(is_visible)
+    # Synchroniser l'état de l'action avec la visibilité réelle
+    window.statusbar_view_action.setChecked(is_visible)
+
+    if is_visible:
+        return ActionFeedback(
+            "Afficher barre de statut", "Barre de statut affichée", "info", "Barre de statut affichée"
+        )
+    # Barre masquée : pas de message de statut
+    return ActionFeedback("Masquer barre de statut", "Barre de statut masquée", "warning")
+
+
+# === Registre des actions ===
+
+ACTIONS: dict[str, ActionSpec] = {}
+
+
+def register_action(spec: ActionSpec) -> ActionSpec:
+    """Enregistre (ou remplace) une action"""
+    ACTIONS[spec.name] = spec
+    return spec
+
+
+for _spec in (
+    # Actions principales
+    ActionSpec("new", "&Nouveau", new_document, "Ctrl+N", "new", "Créer un nouveau document"),
+    ActionSpec("open", "&Ouvrir", open_document, "Ctrl+O", "open", "Ouvrir un document existant"),
+    ActionSpec("close_tab", "&Fermer l'onglet", close_tab, "Ctrl+W", status_tip="Fermer le document courant"),
+    ActionSpec("save", "&Sauvegarder", save_document, "Ctrl+S", "save", "Sauvegarder le document actuel"),
+    ActionSpec("quit", "&Quitter", quit_application, "Ctrl+Q", status_tip="Fermer l'application"),
+    ActionSpec(
+        "cancel_io",
+        "&Annuler l'opération",
+        cancel_io,
+        "Esc",
+        status_tip="Annuler l'ouverture, la sauvegarde ou le collage",
+    ),
+    # Actions de thème
+    ActionSpec("light_theme", "&Thème clair", apply_light_theme),
+    ActionSpec("dark_theme", "&Thème sombre", apply_dark_theme),
+    # Actions d'édition
+    ActionSpec("undo", "&Annuler", undo_edit, "Ctrl+Z", status_tip="Annuler la dernière modification"),
+    ActionSpec("redo", "&Rétablir", redo_edit, "Ctrl+Y", status_tip="Rétablir la dernière modification annulée"),
+    ActionSpec("copy", "&Copier", copy_content, "Ctrl+C", status_tip="Copier le contenu sélectionné"),
+    ActionSpec("cut", "Co&uper", cut_content, "Ctrl+X", status_tip="Couper le contenu sélectionné"),
+    ActionSpec("paste", "C&oller", paste_content, "Ctrl+V", status_tip="Coller le contenu du presse-papier"),
+    ActionSpec("find", "&Rechercher…", find_text, "Ctrl+F", status_tip="Rechercher un texte dans le document"),
+    ActionSpec("find_next", "Rechercher le &suivant", find_next, "F3", status_tip="Aller à l'occurrence suivante"),
+    # Traitements lourds (pool de processus)
+    ActionSpec(
+        "statistics",
+        "S&tatistiques du document",
+        document_statistics,
+        status_tip="Compter lignes, mots et caractères (calcul dans des processus séparés)",
+    ),
+    # Actions de format
+    ActionSpec("bold", "Gras", toggle_bold, checkable=True),
+    ActionSpec("italic", "Italique", toggle_italic, checkable=True),
+    # Actions d'affichage (visibles par défaut)
+    ActionSpec(
+        "toolbar_view",
+        "&Barre d'outils",
+        toggle_toolbar_visibility,
+        status_tip="Afficher/Masquer la barre d'outils",
+        checkable=True,
+        checked=True,
+    ),
+    ActionSpec(
+        "statusbar_view",
+        "Barre de &statut",
+        toggle_statusbar_visibility,
+        status_tip="Afficher/Masquer la barre de statut",
+        checkable=True,
+        checked=True,
+    ),
+):
+    register_action(_spec)
+
+# Disposition des menus et de la barre d'outils (None = séparateur)
+MENU_LAYOUT: dict[str, list[str | None]] = {
+    "&Fichier": ["new", "open", "close_tab", None, "save", "cancel_io", None, "quit"],
+    "&Édition": ["undo", "redo", None, "copy", "cut", "paste", None, "find", "find_next"],
+    "&Affichage": ["toolbar_view", "statusbar_view"],
+    "&Outils": ["statistics"],
+    "&Quitter": ["quit"],
+    "&Thème": ["light_theme", "dark_theme"],
+}
+
+TOOLBAR_LAYOUT: list[str | None] = ["new", None, "open", None, "save", None, "quit"]
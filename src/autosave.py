@@ -0,0 +1,323 @@
+import hashlib
+import json
+import os
+import time
+import uuid
+from functools import partial
+from pathlib import Path
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from PyQt6.QtCore import QElapsedTimer, QObject, QThreadPool, QTimer, pyqtSignal
+
+from src.document import Document
+from src.domain.constants import AUTOSAVE_IDLE_INTERVAL, AUTOSAVE_MAX_DELAY
+from src.file_io import FileIOWorker, ReadableBuffer
+from src.piece_table import ADDED, ORIGINAL
+
+
+class AutosaveSnapshot:
+    """Ce qu'une sauvegarde automatique doit écrire, relevé sur le thread GUI
+
+    Seule la partie du tampon d'ajout écrite depuis la sauvegarde précédente
+    est copiée ; le tampon d'origine est transmis par référence et n'est écrit
+    qu'à la première sauvegarde, et seulement s'il ne peut pas être lié.
+    """
+
+    def __init__(self, key: str, document: Document, added_offset: int, first: bool) -> None:
+        self.key = key
+        self.first = first
+        self.path = document.path
+        self.source = document.source
+        self.original = document.content
+        self.added_offset = added_offset
+        self.added_tail = bytes(document.text.added[added_offset:])
+        self.added_size = len(document.text.added)
+        self.pieces = [value for piece in document.text.pieces() for value in (piece.buffer, piece.start, piece.length)]
+        self.styles = [value for pair in zip(document.styles.starts, document.styles.styles) for value in pair]
+
+
+class AutosaveStore:
+    """Sauvegardes automatiques d'un répertoire : trois fichiers par document
+
+    - ``<clé>.added`` : copie du tampon d'ajout, complétée à chaque sauvegarde
+      (le tampon n'est jamais modifié, seule sa fin nouvelle est écrite) ;
+    - ``<clé>.original`` : tampon d'origine, lien physique vers le fichier
+      ouvert quand c'est possible, sinon écrit une fois s'il est en mémoire ;
+    - ``<clé>.json`` : morceaux et styles, remplacé atomiquement (fichier
+      temporaire puis renommage) après l'écriture des données qu'il référence.
+
+    Un arrêt brutal laisse donc toujours un manifeste cohérent avec des
+    données complètes.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+
+    def manifest_path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def added_path(self, key: str) -> Path:
+        return self.directory / f"{key}.added"
+
+    def original_path(self, key: str) -> Path:
+        return self.directory / f"{key}.original"
+
+    def write(self, snapshot: AutosaveSnapshot) -> int:
+        """Écrit la sauvegarde et retourne le nombre d'octets écrits"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        original, written = self._store_original(snapshot)
+
+        mode = "r+b" if snapshot.added_offset and self.added_path(snapshot.key).exists() else "wb"
+        with open(self.added_path(snapshot.key), mode) as file:
+            file.seek(snapshot.added_offset)
+            file.write(snapshot.added_tail)
+            file.truncate()
+            file.flush()
+            os.fsync(file.fileno())
+        written += len(snapshot.added_tail)
+
+        manifest = {
+            "path": str(snapshot.path) if snapshot.path is not None else None,
+            "original": original,
+            "added_size": snapshot.added_size,
+            "pieces": snapshot.pieces,
+            "styles": snapshot.styles,
+        }
+        written += self._replace(self.manifest_path(snapshot.key), json.dumps(manifest).encode("utf-8"))
+        return written
+
+    def _store_original(self, snapshot: AutosaveSnapshot) -> tuple[dict[str, Any], int]:
+        """Référence au tampon d'origine et nombre d'octets écrits pour le conserver
+
+        Un fichier ouvert est lié physiquement (le lien survit au remplacement
+        du fichier par une sauvegarde), ou à défaut référencé par son chemin,
+        vérifié à la lecture ; un contenu en mémoire est écrit une fois.
+        """
+        target = self.original_path(snapshot.key)
+        if not snapshot.first and target.exists():
+            return {"file": target.name}, 0
+
+        if (source := snapshot.source) is not None:
+            path, device, inode = source
+            try:
+                stat = path.stat()
+            except OSError:
+                stat = None
+            # Sinon le fichier a été remplacé depuis l'ouverture : le contenu projeté n'est plus sur disque
+            if stat is not None and (stat.st_dev, stat.st_ino) == (device, inode):
+                try:
+                    target.unlink(missing_ok=True)
+                    target.hardlink_to(path)
+                except OSError:
+                    return {"path": str(path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}, 0
+                return {"file": target.name}, 0
+
+        return {"file": target.name}, self._replace(target, snapshot.original)
+
+    @staticmethod
+    def _replace(path: Path, data: ReadableBuffer) -> int:
+        temporary_path = path.with_name(f".{path.name}.tmp")
+        try:
+            with open(temporary_path, "wb") as file:
+                file.write(data)
+                file.flush()
+                os.fsync(file.fileno())
+        except BaseException:
+            # Quelle que soit l'erreur (y compris une interruption), pas de fichier temporaire orphelin
+            temporary_path.unlink(missing_ok=True)
+            raise
+        temporary_path.replace(path)
+        return len(data)
+
+    def read(self, key: str) -> bytes:
+        """Contenu du document tel qu'à la dernière sauvegarde automatique"""
+        manifest = json.loads(self.manifest_path(key).read_text(encoding="utf-8"))
+        if "file" in (original := manifest["original"]):
+            original_data = (self.directory / original["file"]).read_bytes()
+        else:
+            source = Path(original["path"])
+            stat = source.stat()
+            if (stat.st_size, stat.st_mtime_ns) != (original["size"], original["mtime_ns"]):
+                raise ValueError(f"Le fichier {source} a été modifié depuis la sauvegarde automatique")
+            original_data = source.read_bytes()
+        added = self.added_path(key).read_bytes()[: manifest["added_size"]]
+
+        buffers = {ORIGINAL: original_data, ADDED: added}
+        pieces = manifest["pieces"]
+        return b"".join(
+            buffers[pieces[i]][pieces[i + 1] : pieces[i + 1] + pieces[i + 2]] for i in range(0, len(pieces), 3)
+        )
+
+    def remove(self, key: str) -> None:
+        for path in (self.manifest_path(key), self.added_path(key), self.original_path(key)):
+            path.unlink(missing_ok=True)
+
+
+class AutosaveWorker(FileIOWorker):
+    """Écrit une sauvegarde automatique depuis le pool de threads ; retourne (octets écrits, durée en ms)"""
+
+    def __init__(self, store: AutosaveStore, snapshot: AutosaveSnapshot) -> None:
+        super().__init__(store.manifest_path(snapshot.key))
+        self.store = store
+        self.snapshot = snapshot
+
+    def work(self) -> tuple[int, float]:
+        start = time.perf_counter()
+        written = self.store.write(self.snapshot)
+        return written, (time.perf_counter() - start) * 1000
+
+
+class AutosaveState:
+    """Avancement des sauvegardes automatiques d'un document"""
+
+    def __init__(self, document: Document) -> None:
+        if document.path is not None:
+            self.key = hashlib.sha1(str(document.path.resolve()).encode("utf-8"), usedforsecurity=False).hexdigest()
+        else:
+            self.key = f"sans-titre-{uuid.uuid4().hex[:12]}"
+        # Octets du tampon d'ajout déjà sur disque, et si une sauvegarde complète a déjà réussi
+        self.added_written = 0
+        self.saved = False
+
+
+class Autosave(QObject):
+    """Sauvegarde automatique des documents modifiés, regroupée après un temps d'inactivité
+
+    Chaque modification relance le délai ``idle_interval`` : une rafale de
+    frappes ne produit qu'une écriture, au plus tard ``max_delay`` ms après
+    la première. L'écriture se fait dans le pool de threads, une seule à la
+    fois ; une demande arrivée pendant une écriture est servie à sa fin.
+    """
+
+    saved = pyqtSignal(int, float)  # (octets écrits, durée en ms)
+    failed = pyqtSignal(str)
+
+    def __init__(
+        self,
+        store: AutosaveStore,
+        thread_pool: QThreadPool | None = None,
+        idle_interval: int = AUTOSAVE_IDLE_INTERVAL,
+        max_delay: int = AUTOSAVE_MAX_DELAY,
+        parent: QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self.store = store
+        self.thread_pool = thread_pool or QThreadPool.globalInstance()
+        self.max_delay = max_delay
+        self.document: Document | None = None
+        self.states: WeakKeyDictionary[Document, AutosaveState] = WeakKeyDictionary()
+        self.worker: AutosaveWorker | None = None
+        self.requested = False
+        # Sauvegardes à supprimer une fois l'écriture en cours terminée
+        self.removals: list[str] = []
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(idle_interval)
+        self.timer.timeout.connect(self.save)
+        self.waiting = QElapsedTimer()
+
+    def key(self, document: Document) -> str | None:
+        return state.key if (state := self.states.get(document)) is not None else None
+
+    def schedule(self, document: Document) -> None:
+        """À appeler après chaque modification du document"""
+        if document is not self.document and self.timer.isActive():
+            # Changement de document : le précédent est sauvegardé sans attendre
+            self.save()
+        self.document = document
+
+        if not document.modified:
+            # Retour à l'état sauvegardé (annulation) : la sauvegarde automatique n'a plus d'objet
+            self.discard(document)
+            return
+
+        if not self.timer.isActive():
+            self.waiting.start()
+            self.timer.start()
+        elif self.waiting.elapsed() < self.max_delay:
+            self.timer.start()
+
+    def save(self) -> None:
+        """Lance la sauvegarde du document courant, ou la reporte à la fin de l'écriture en cours"""
+        self.timer.stop()
+        if (document := self.document) is None or not document.modified or self.thread_pool is None:
+            return
+        if self.worker is not None:
+            self.requested = True
+            return
+
+        state = self.state(document)
+        snapshot = AutosaveSnapshot(state.key, document, state.added_written, not state.saved)
+
+        worker = AutosaveWorker(self.store, snapshot)
+        # Projection du document gardée ouverte pendant l'écriture ; document déjà fermé : rien à écrire
+        worker.lease = document.lease
+        worker.signals.finished.connect(partial(self.on_saved, state, snapshot))
+        worker.signals.failed.connect(self.on_failed)
+        worker.signals.cancelled.connect(self.on_worker_done)
+        self.worker = worker
+        self.thread_pool.start(worker)
+
+    def state(self, document: Document) -> AutosaveState:
+        if (state := self.states.get(document)) is None:
+            state = AutosaveState(document)
+            self.states[document] = state
+        return state
+
+    def on_saved(self, state: AutosaveState, snapshot: AutosaveSnapshot, result: tuple[int, float]) -> None:
+        state.added_written = snapshot.added_size
+        state.saved = True
+        self.saved.emit(*result)
+        self.on_worker_done()
+
+    def on_failed(self, message: str) -> None:
+        self.failed.emit(message)
+        self.on_worker_done()
+
+    def on_worker_done(self) -> None:
+        self.worker = None
+        for key in self.removals:
+            self.store.remove(key)
+        self.removals.clear()
+        if self.requested:
+            self.requested = False
+            self.save()
+
+    def discard(self, document: Document) -> None:
+        """Supprime la sauvegarde automatique d'un document sauvegardé, revenu à l'état sauvegardé ou fermé"""
+        if document is self.document:
+            self.timer.stop()
+            self.requested = False
+        if (state := self.states.pop(document, None)) is None:
+            return
+        if self.worker is not None:
+            self.removals.append(state.key)
+        else:
+            self.store.remove(state.key)
+
+    def stop(self) -> None:
+        """Fermeture de l'application : plus de sauvegarde planifiée, la dernière est écrite sur le thread appelant
+
+        Les modifications encore dans le délai d'inactivité ne sont pas perdues ;
+        la sauvegarde du document modifié est conservée pour le prochain lancement.
+        """
+        pending = self.timer.isActive() or self.requested
+        self.timer.stop()
+        self.requested = False
+        if not pending or (document := self.document) is None or not document.modified:
+            return
+        if self.worker is not None and self.thread_pool is not None:
+            # L'écriture en cours se termine d'abord : la dernière la complète
+            self.thread_pool.waitForDone()
+        if not document.lease.acquire():
+            return
+
+        state = self.state(document)
+        try:
+            self.store.write(AutosaveSnapshot(state.key, document, state.added_written, not state.saved))
+        except OSError as e:
+            self.failed.emit(f"{type(e).__name__} : {e}")
+        finally:
+            document.lease.release()
@@ -0,0 +1,119 @@
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QClipboard
+
+from src.document import Document
+from src.domain.constants import PASTE_CHUNK_SIZE
+
+
+class ClipboardMonitor(QObject):
+    """Suit les changements du presse-papier pour savoir sans l'interroger s'il contient du texte
+
+    Le presse-papier n'est consulté qu'à la réception de ``dataChanged`` :
+    ``has_text`` est ensuite une simple lecture d'attribut (menus contextuels,
+    état de l'action Coller).
+    """
+
+    changed = pyqtSignal(bool)
+
+    def __init__(self, clipboard: QClipboard, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self.clipboard = clipboard
+        self.has_text = False
+        clipboard.dataChanged.connect(self.on_data_changed)
+        self.on_data_changed()
+
+    # Slot Qt : la connexion au presse-papier (global) disparaît avec le moniteur
+    @pyqtSlot()
+    def on_data_changed(self) -> None:
+        mime_data = self.clipboard.mimeData()
+        has_text = mime_data is not None and mime_data.hasText()
+        if has_text != self.has_text:
+            self.has_text = has_text
+            self.changed.emit(has_text)
+
+    def text(self) -> str:
+        return self.clipboard.text() if self.has_text else ""
+
+    def data(self) -> bytes:
+        """Texte du presse-papier encodé en UTF-8
+
+        La conversion est faite par Qt, sans passer par une chaîne Python
+        (environ trois fois plus rapide que ``text().encode()`` sur un gros
+        contenu). Elle reste synchrone : Qt n'autorise l'accès au presse-papier
+        que depuis le thread GUI.
+        """
+        if not self.has_text or (mime_data := self.clipboard.mimeData()) is None:
+            return b""
+        return mime_data.data("text/plain").data()
+
+    def set_text(self, text: str) -> None:
+        self.clipboard.setText(text)
+
+
+class IncrementalInsert(QObject):
+    """Insère un gros contenu dans le document par blocs, un bloc par tour de boucle d'événements
+
+    Les blocs sont coupés après un saut de ligne quand c'est possible, pour
+    que l'affichage ne montre jamais de caractère UTF-8 tronqué. Tous les
+    blocs forment une seule entrée de l'historique (fusionnée avec la
+    modification précédente si ``merge``) : une annulation la défait.
+    Interrompre l'insertion retire exactement les octets déjà insérés.
+    """
+
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal()
+    cancelled = pyqtSignal()
+
+    def __init__(
+        self,
+        document: Document,
+        offset: int,
+        data: bytes,
+        chunk_size: int = PASTE_CHUNK_SIZE,
+        merge: bool = False,
+        parent: QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self.document = document
+        self.offset = offset
+        self.data = data
+        self.chunk_size = chunk_size
+        self.merge = merge
+        self.inserted = 0
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(0)
+        self.timer.timeout.connect(self.step)
+
+    def is_running(self) -> bool:
+        return self.timer.isActive()
+
+    def start(self) -> None:
+        """Insère le premier bloc immédiatement, les suivants aux tours de boucle suivants"""
+        self.step()
+        if self.inserted < len(self.data):
+            self.timer.start()
+
+    def step(self) -> None:
+        end = min(len(self.data), self.inserted + self.chunk_size)
+        if end < len(self.data) and (newline := self.data.rfind(b"\n", self.inserted, end)) != -1:
+            end = newline + 1
+
+        self.document.insert(
+            self.offset + self.inserted, self.data[self.inserted : end], self.merge or self.inserted > 0
+        )
+        self.inserted = end
+        self.progress.emit(self.inserted, len(self.data))
+
+        if self.inserted == len(self.data):
+            self.timer.stop()
+            self.finished.emit()
+
+    def cancel(self) -> None:
+        if not self.is_running():
+            return
+
+        self.timer.stop()
+        # Suppression fusionnée dans l'entrée du collage : l'historique revient à son état d'avant le collage
+        self.document.delete(self.offset, self.offset + self.inserted, merge=True)
+        self.cancelled.emit()
@@ -0,0 +1,165 @@
+import mmap
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+from src.file_io import ReadableBuffer, ReadLease
+from src.history import EditCommand, EditHistory, StyleEdit, TextEdit
+from src.line_index import LineIndex
+from src.piece_table import PieceTable
+from src.search_index import SearchIndex
+from src.text_styles import StyleRuns, TextStyle
+
+
+class Document:
+    """Document ouvert dans la fenêtre principale
+
+    Le contenu d'un fichier ouvert est projeté en mémoire (mmap) : seules les
+    pages effectivement lues (lignes affichées, indexation) sont chargées.
+    Les modifications passent par une table de morceaux qui ne copie jamais
+    ce contenu d'origine, et les styles (gras, italique) sont stockés par
+    plages à part. Chaque modification est enregistrée dans l'historique
+    annuler/rétablir du document, et un index plein texte accélère la
+    recherche.
+    """
+
+    def __init__(self, path: Path | None = None, content: ReadableBuffer = b"") -> None:
+        self.path = path
+        self.content = content
+        # Fichier projeté dans ``content`` et son identité (périphérique, inode) à l'ouverture
+        self.source: tuple[Path, int, int] | None = None
+        self.index = LineIndex(len(content))
+
+        # Un contenu déjà en mémoire est indexé immédiatement
+        if isinstance(content, bytes | bytearray):
+            self.index.scan_chunk(content, 0)
+            self.index.complete = True
+
+        self.text = PieceTable(content, self.index)
+        self.styles = StyleRuns()
+        self.history = EditHistory()
+        # Index plein texte, construit en arrière-plan pour un fichier ouvert
+        self.search_index = SearchIndex(self.text)
+        # Lecteurs en arrière-plan : la projection n'est fermée qu'après le dernier
+        self.lease = ReadLease(self._close_content)
+
+    @classmethod
+    def open(cls, path: Path) -> "Document":
+        """Projette le fichier en mémoire sans le lire ; l'index de lignes reste à construire"""
+        with open(path, "rb") as file:
+            if (stat := os.fstat(file.fileno())).st_size == 0:
+                return cls(path)
+            # La projection reste valide après la fermeture du descripteur
+            document = cls(path, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+            document.source = (path, stat.st_dev, stat.st_ino)
+            return document
+
+    def close(self) -> None:
+        """Arrête l'indexation et ferme la projection, une fois les workers qui la lisent terminés"""
+        self.search_index.close()
+        self.lease.close()
+
+    def _close_content(self) -> None:
+        if isinstance(self.content, mmap.mmap) and not self.content.closed:
+            self.content.close()
+
+    def release(self) -> None:
+        """Rend au système les pages projetées (onglet inactif) : elles seront relues du fichier au besoin"""
+        if isinstance(self.content, mmap.mmap) and not self.content.closed and hasattr(mmap, "MADV_DONTNEED"):
+            self.content.madvise(mmap.MADV_DONTNEED)
+
+    @property
+    def name(self) -> str:
+        return self.path.name if self.path is not None else "Sans titre"
+
+    @property
+    def size(self) -> int:
+        return len(self.text)
+
+    @property
+    def line_count(self) -> int:
+        return self.text.line_count
+
+    @property
+    def edited(self) -> bool:
+        """Vrai dès la première modification (la table de morceaux est matérialisée)"""
+        return self.text.edited
+
+    @property
+    def modified(self) -> bool:
+        """Vrai si le document diffère de son dernier état sauvegardé"""
+        return not self.history.is_clean()
+
+    def line_range(self, line: int) -> tuple[int, int]:
+        """Positions (début, fin) de la ligne, sans le saut de ligne final"""
+        return self.text.line_range(line)
+
+    def read(self, start: int, end: int) -> bytes:
+        return self.text.read(start, end)
+
+    def insert(self, offset: int, data: bytes, merge: bool = False) -> None:
+        """Insère ``data`` à la position ``offset`` (l'index de lignes d'origine doit être complet)
+
+        Avec ``merge``, l'insertion est fusionnée dans l'historique avec la
+        modification précédente si elle la prolonge.
+        """
+        if (piece := self.text.insert(offset, data)) is None:
+            return
+        self.styles.insert(offset, len(data))
+        self.history.push(TextEdit(offset, [], [piece], []), merge)
+
+    def delete(self, start: int, end: int, merge: bool = False) -> None:
+        """Supprime les octets ``[start, end)``"""
+        if start >= end:
+            return
+
+        styles = [
+            (run_start - start, run_end - start, style)
+            for run_start, run_end, style in self.styles.runs(start, end)
+            if style
+        ]
+        removed = self.text.remove(start, end)
+        self.styles.delete(start, end)
+        self.history.push(TextEdit(start, removed, [], styles), merge)
+
+    def toggle_style(self, start: int, end: int, style: TextStyle) -> bool:
+        """Active ou retire un style sur une plage sans toucher au texte, retourne le nouvel état"""
+        previous = list(self.styles.runs(start, end))
+        enabled = self.styles.toggle(start, end, style)
+        self.history.push(StyleEdit(start, end, style, enabled, previous), merge=True)
+        return enabled
+
+    def undo(self) -> EditCommand | None:
+        """Annule la dernière modification et la retourne"""
+        if (command := self.history.undo()) is not None:
+            command.undo(self)
+        return command
+
+    def redo(self) -> EditCommand | None:
+        """Rétablit la dernière modification annulée et la retourne"""
+        if (command := self.history.redo()) is not None:
+            command.redo(self)
+        return command
+
+    def offset_at(self, line: int, column: int) -> int:
+        """Position en octets de la colonne (en caractères) d'une ligne"""
+        start, end = self.line_range(line)
+        text = self.read(start, end).decode("utf-8", errors="replace")
+        return min(end, start + len(text[:column].encode("utf-8")))
+
+    def position_of(self, offset: int) -> tuple[int, int]:
+        """Ligne et colonne (en caractères) d'une position en octets"""
+        line = self.text.line_of(offset)
+        start = self.text.line_start(line)
+        return line, len(self.read(start, offset).decode("utf-8", errors="replace"))
+
+    def line_text(self, line: int, max_bytes: int | None = None) -> str:
+        """Texte d'une ligne, éventuellement tronqué à ``max_bytes`` octets"""
+        start, end = self.line_range(line)
+        if max_bytes is not None:
+            end = min(end, start + max_bytes)
+        return self.read(start, end).decode("utf-8", errors="replace").rstrip("\r")
+
+    def chunks(self, chunk_size: int) -> Iterator[bytes]:
+        """Parcourt le contenu par blocs, sans copie complète en mémoire"""
+        return self.text.chunks(chunk_size)
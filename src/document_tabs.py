@@ -0,0 +1,37 @@
+from pathlib import Path
+
+from src.document import Document
+
+# Position de la vue dans un document : (ancre, curseur, première ligne, première colonne)
+ViewPosition = tuple[int, int, int, int]
+
+
+class DocumentTab:
+    """Onglet : un document et la position de la vue, sans aucun widget
+
+    Tous les onglets partagent la même vue, les mêmes actions et le même
+    système de notifications ; un onglet inactif ne coûte que son document.
+    Un onglet restauré d'une session précédente n'a que le chemin de son
+    fichier (``pending``) tant qu'il n'a pas été affiché.
+    """
+
+    def __init__(self, document: Document, pending: Path | None = None) -> None:
+        self.document = document
+        self.position: ViewPosition = (0, 0, 0, 0)
+        self.pending = pending
+
+    @property
+    def path(self) -> Path | None:
+        return self.pending if self.pending is not None else self.document.path
+
+    @property
+    def title(self) -> str:
+        if self.pending is not None:
+            return self.pending.name
+        return f"{self.document.name} *" if self.document.modified else self.document.name
+
+    def is_pristine(self) -> bool:
+        """Document vide jamais modifié ni enregistré, qu'une ouverture peut remplacer"""
+        return (
+            self.pending is None and self.document.path is None and not self.document.edited and not self.document.size
+        )
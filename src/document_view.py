@@ -0,0 +1,217 @@
+from PyQt6.QtCore import QPoint, Qt
+from PyQt6.QtGui import QFont, QFontDatabase, QMouseEvent, QPainter, QPaintEvent, QResizeEvent
+from PyQt6.QtWidgets import QAbstractScrollArea, QWidget
+
+from src.document import Document
+from src.document_tabs import ViewPosition
+from src.text_styles import TextStyle
+
+# Nombre d'octets lus au maximum par ligne affichée (lignes très longues)
+MAX_LINE_BYTES = 4096
+
+
+class DocumentView(QAbstractScrollArea):
+    """Vue virtualisée : seules les lignes visibles du document sont lues et dessinées"""
+
+    def __init__(self, document: Document, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.document = document
+        # Sélection en positions d'octets : de l'ancre au curseur
+        self.anchor = 0
+        self.caret = 0
+
+        font = QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont)
+        font.setStyleHint(QFont.StyleHint.Monospace)
+        self.setFont(font)
+        # Variantes de la police par style (gras, italique), créées à la demande
+        self.style_fonts: dict[TextStyle, QFont] = {}
+
+        if (scroll_bar := self.verticalScrollBar()) is not None:
+            scroll_bar.valueChanged.connect(self.refresh)
+        if (scroll_bar := self.horizontalScrollBar()) is not None:
+            scroll_bar.valueChanged.connect(self.refresh)
+
+    def set_document(self, document: Document, position: ViewPosition = (0, 0, 0, 0)) -> None:
+        """Affiche un document à une position (onglet réactivé) ou au début"""
+        self.document = document
+        self.anchor, self.caret, first_line, first_column = position
+        # Ligne d'abord : la plage horizontale dépend des lignes visibles
+        self.update_scroll_bars()
+        if (scroll_bar := self.verticalScrollBar()) is not None:
+            scroll_bar.setValue(first_line)
+        self.update_scroll_bars()
+        if (scroll_bar := self.horizontalScrollBar()) is not None:
+            scroll_bar.setValue(first_column)
+        self.refresh()
+
+    def position(self) -> ViewPosition:
+        scroll_bar = self.horizontalScrollBar()
+        first_column = scroll_bar.value() if scroll_bar is not None else 0
+        return self.anchor, self.caret, self.first_visible_line(), first_column
+
+    @property
+    def line_height(self) -> int:
+        return self.fontMetrics().height()
+
+    @property
+    def char_width(self) -> int:
+        return max(1, self.fontMetrics().horizontalAdvance("M"))
+
+    def visible_line_count(self) -> int:
+        viewport = self.viewport()
+        height = viewport.height() if viewport is not None else 0
+        return max(1, height // self.line_height)
+
+    def first_visible_line(self) -> int:
+        scroll_bar = self.verticalScrollBar()
+        return scroll_bar.value() if scroll_bar is not None else 0
+
+    def visible_lines(self) -> range:
+        first = self.first_visible_line()
+        return range(first, min(self.document.line_count, first + self.visible_line_count() + 1))
+
+    def selection(self) -> tuple[int, int]:
+        """Positions (début, fin) de la sélection"""
+        return min(self.anchor, self.caret), max(self.anchor, self.caret)
+
+    def has_selection(self) -> bool:
+        return self.anchor != self.caret
+
+    def set_selection(self, anchor: int, caret: int) -> None:
+        self.anchor = anchor
+        self.caret = caret
+        self.refresh()
+
+    def set_caret(self, offset: int) -> None:
+        self.set_selection(offset, offset)
+
+    def select_all(self) -> None:
+        self.set_selection(0, self.document.size)
+
+    def scroll_to(self, offset: int) -> None:
+        """Fait défiler la vue jusqu'à une position si elle n'est pas visible (ligne centrée)"""
+        line, column = self.document.position_of(offset)
+        if (scroll_bar := self.verticalScrollBar()) is not None and line not in self.visible_lines():
+            scroll_bar.setValue(max(0, line - self.visible_line_count() // 2))
+        self.update_scroll_bars()
+
+        if (scroll_bar := self.horizontalScrollBar()) is not None:
+            first_column = scroll_bar.value()
+            if not first_column <= column < first_column + scroll_bar.pageStep():
+                scroll_bar.setValue(max(0, column - scroll_bar.pageStep() // 2))
+
+    def offset_at_point(self, point: QPoint) -> int:
+        """Position en octets du caractère le plus proche d'un point de la zone d'affichage"""
+        line = min(self.document.line_count - 1, self.first_visible_line() + max(0, point.y()) // self.line_height)
+        scroll_bar = self.horizontalScrollBar()
+        first_column = scroll_bar.value() if scroll_bar is not None else 0
+        column = first_column + max(0, round(point.x() / self.char_width))
+        return self.document.offset_at(line, column)
+
+    def mousePressEvent(self, event: QMouseEvent | None) -> None:  # noqa: N802
+        if event is None or event.button() != Qt.MouseButton.LeftButton:
+            super().mousePressEvent(event)
+            return
+
+        offset = self.offset_at_point(event.position().toPoint())
+        if event.modifiers() & Qt.KeyboardModifier.ShiftModifier:
+            self.set_selection(self.anchor, offset)
+        else:
+            self.set_caret(offset)
+
+    def mouseMoveEvent(self, event: QMouseEvent | None) -> None:  # noqa: N802
+        if event is None or not event.buttons() & Qt.MouseButton.LeftButton:
+            super().mouseMoveEvent(event)
+            return
+
+        self.set_selection(self.anchor, self.offset_at_point(event.position().toPoint()))
+
+    def document_changed(self) -> None:
+        """À appeler quand le document grandit (indexation) ou est modifié"""
+        self.update_scroll_bars()
+        self.refresh()
+
+    def update_scroll_bars(self) -> None:
+        if (scroll_bar := self.verticalScrollBar()) is not None:
+            scroll_bar.setRange(0, max(0, self.document.line_count - self.visible_line_count()))
+            scroll_bar.setPageStep(self.visible_line_count())
+
+        if (scroll_bar := self.horizontalScrollBar()) is not None:
+            # Largeur estimée d'après les lignes visibles uniquement
+            viewport = self.viewport()
+            columns = (viewport.width() if viewport is not None else 0) // self.char_width
+            longest = max((self.line_length(line) for line in self.visible_lines()), default=0)
+            scroll_bar.setRange(0, max(0, longest - columns))
+            scroll_bar.setPageStep(columns)
+
+    def line_length(self, line: int) -> int:
+        start, end = self.document.line_range(line)
+        return min(end - start, MAX_LINE_BYTES)
+
+    def refresh(self) -> None:
+        if (viewport := self.viewport()) is not None:
+            viewport.update()
+
+    def resizeEvent(self, event: QResizeEvent | None) -> None:  # noqa: N802
+        super().resizeEvent(event)
+        self.update_scroll_bars()
+
+    def paintEvent(self, event: QPaintEvent | None) -> None:  # noqa: N802
+        if (viewport := self.viewport()) is None:
+            return
+
+        painter = QPainter(viewport)
+        line_height = self.line_height
+        # Ne redessiner que les lignes de la zone invalidée
+        if event is not None:
+            first_row = event.rect().top() // line_height
+            last_row = event.rect().bottom() // line_height
+        else:
+            first_row, last_row = 0, self.visible_line_count()
+
+        scroll_bar = self.horizontalScrollBar()
+        first_column = scroll_bar.value() if scroll_bar is not None else 0
+        ascent = self.fontMetrics().ascent()
+        palette = self.palette()
+        painter.setPen(palette.text().color())
+        selection_start, selection_end = self.selection()
+
+        for row, line in enumerate(self.visible_lines()):
+            if not first_row <= row <= last_row:
+                continue
+            top = row * line_height
+            start, end = self.document.line_range(line)
+
+            # Fond de la partie sélectionnée de la ligne (saut de ligne compris)
+            if selection_start <= end and selection_end > start:
+                left = self.document.position_of(max(start, selection_start))[1]
+                right = self.document.position_of(min(end, selection_end))[1] + (selection_end > end)
+                x = (left - first_column) * self.char_width
+                painter.fillRect(x, top, (right - left) * self.char_width, line_height, palette.highlight())
+
+            if start <= self.caret <= end:
+                x = (self.document.position_of(self.caret)[1] - first_column) * self.char_width
+                painter.drawLine(x, top, x, top + line_height - 1)
+
+            self.draw_line(painter, start, min(end, start + MAX_LINE_BYTES), top + ascent, first_column)
+
+        painter.end()
+
+    def draw_line(self, painter: QPainter, start: int, end: int, baseline: int, first_column: int) -> None:
+        """Dessine une ligne run de style par run de style, à partir de la colonne ``first_column``"""
+        column = 0
+        for run_start, run_end, style in self.document.styles.runs(start, end):
+            text = self.document.read(run_start, run_end).decode("utf-8", errors="replace").rstrip("\r")
+            if column + len(text) > first_column:
+                skipped = max(0, first_column - column)
+                painter.setFont(self.style_font(style))
+                painter.drawText((column + skipped - first_column) * self.char_width, baseline, text[skipped:])
+            column += len(text)
+
+    def style_font(self, style: TextStyle) -> QFont:
+        if (font := self.style_fonts.get(style)) is None:
+            font = QFont(self.font())
+            font.setBold(bool(style & TextStyle.BOLD))
+            font.setItalic(bool(style & TextStyle.ITALIC))
+            self.style_fonts[style] = font
+        return font
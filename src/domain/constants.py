@@ -8,3 +8,86 @@ SRC_DIR = WORKSPACE_DIR / "src"
 
 CSS_LIGHT_FILE_PATH = SRC_DIR / "styles_light.css"
 CSS_DARK_FILE_PATH = SRC_DIR / "styles_dark.css"
+
+ICONS_DIR = WORKSPACE_DIR / "icons"
+# Bundle de ressources Qt compilé (optionnel) : rcc -binary icons/icons.qrc -o icons/icons.rcc
+ICONS_RESOURCE_PATH = ICONS_DIR / "icons.rcc"
+# Variable d'environnement rendant fatale une icône manquante ou illisible (tests, débogage)
+ICONS_STRICT_ENV_VAR = "PYQT_TP_STRICT_ICONS"
+
+# Notifications
+
+NOTIFICATION_POOL_SIZE = 5
+
+# Instrumentation
+
+# Variable d'environnement activant l'instrumentation, sa valeur est le fichier JSON écrit à la fermeture
+INSTRUMENTATION_ENV_VAR = "PYQT_TP_INSTRUMENTATION"
+
+# Entrées/sorties fichiers
+
+# Taille des blocs lus/écrits par les workers d'entrées/sorties
+IO_CHUNK_SIZE = 1024 * 1024
+
+# Presse-papier
+
+# Taille des blocs insérés par tour de boucle d'événements lors d'un collage volumineux
+PASTE_CHUNK_SIZE = 256 * 1024
+
+# Historique annuler/rétablir
+
+# Empreinte mémoire maximale de l'historique d'un document, en octets
+UNDO_HISTORY_BUDGET = 8 * 1024 * 1024
+
+# Statistiques d'usage
+
+# Nom du répertoire des statistiques d'usage, dans le répertoire de données de l'application
+TELEMETRY_DIR_NAME = "telemetry"
+# Nombre d'événements en mémoire au-delà duquel un lot est écrit sans attendre
+TELEMETRY_BATCH_SIZE = 256
+# Délai maximal (ms) avant l'écriture d'un lot incomplet
+TELEMETRY_FLUSH_INTERVAL = 5000
+# Nombre maximal d'événements en attente d'écriture, les plus anciens sont abandonnés au-delà
+TELEMETRY_MAX_PENDING = 16 * TELEMETRY_BATCH_SIZE
+# Taille d'un segment du journal avant rotation, et nombre de segments conservés avant agrégation
+TELEMETRY_SEGMENT_SIZE = 1024 * 1024
+TELEMETRY_MAX_SEGMENTS = 4
+
+# Sauvegarde automatique
+
+# Nom du répertoire des sauvegardes automatiques, dans le répertoire de données de l'application
+AUTOSAVE_DIR_NAME = "autosave"
+# Délai d'inactivité (ms) après la dernière modification avant une sauvegarde automatique
+AUTOSAVE_IDLE_INTERVAL = 2000
+# Attente maximale (ms) pendant une saisie continue
+AUTOSAVE_MAX_DELAY = 30_000
+
+# Recherche
+
+# Taille des blocs de l'index de recherche : un mot est indexé par le bloc où il commence
+SEARCH_BLOCK_SIZE = 64 * 1024
+# Taille maximale des plages lues d'un coup lors de la vérification des blocs candidats
+SEARCH_SCAN_SIZE = 4 * 1024 * 1024
+# Intervalle minimal (ms) entre deux lots d'occurrences transmis à l'interface
+SEARCH_BATCH_INTERVAL = 50
+
+# Pool de processus
+
+# Taille minimale d'une partie du texte confiée à un processus
+PROCESS_MIN_PART_SIZE = 1024 * 1024
+# Nombre de parties par processus, pour équilibrer la charge entre processus
+PROCESS_PARTS_PER_WORKER = 4
+
+# Session
+
+# Nom du fichier de session (fenêtre, options, onglets ouverts), dans le répertoire de données de l'application
+SESSION_FILE_NAME = "session.bin"
+
+# Démarrage
+
+# Taille (largeur, hauteur) de l'écran de démarrage
+SPLASH_SIZE = (420, 180)
+# Attente maximale (ms) de l'exposition de l'écran de démarrage par le système de fenêtrage
+SPLASH_EXPOSE_TIMEOUT = 500
+# Budget (ms) du premier affichage, de l'import de PyQt à l'écran de démarrage exposé et peint (interpréteur démarré)
+STARTUP_FIRST_FRAME_BUDGET = 150
@@ -0,0 +1,173 @@
+import logging
+import mmap
+import threading
+from abc import ABCMeta, abstractmethod
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+from PyQt6.sip import wrappertype
+
+from src.domain.constants import IO_CHUNK_SIZE
+
+logger = logging.getLogger(__name__)
+
+# Tampons acceptés par les workers : contenu en mémoire ou fichier projeté (mmap)
+ReadableBuffer = bytes | bytearray | mmap.mmap
+
+
+class FileIOSignals(QObject):
+    """Signaux émis par les workers d'entrées/sorties (reçus sur le thread GUI)"""
+
+    progress = pyqtSignal(int, int)  # (octets traités, total)
+    finished = pyqtSignal(object)  # résultat du worker
+    failed = pyqtSignal(str)  # message d'erreur
+    cancelled = pyqtSignal()
+
+    def disconnect_all(self) -> None:
+        """Coupe les connexions de tous les signaux : les émissions encore en attente ne sont pas délivrées"""
+        for cls in type(self).__mro__:
+            for name, attribute in vars(cls).items():
+                if isinstance(attribute, pyqtSignal) and self.receivers(signal := getattr(self, name)):
+                    signal.disconnect()
+
+
+class FileIOCancelled(Exception):
+    """Levée dans le worker lorsque l'opération a été annulée"""
+
+
+class ReadLease:
+    """Fermeture différée d'une ressource lue par des workers (ex: projection d'un document)
+
+    ``close`` marque la ressource comme fermée, mais la fonction de fermeture
+    n'est appelée qu'au départ du dernier lecteur : un worker ne lit jamais
+    une projection fermée sous lui.
+    """
+
+    def __init__(self, close: Callable[[], None]) -> None:
+        self._close = close
+        self._lock = threading.Lock()
+        self._readers = 0
+        self.closed = False
+
+    def acquire(self) -> bool:
+        """Ajoute un lecteur, False si la ressource est déjà fermée"""
+        with self._lock:
+            if self.closed:
+                return False
+            self._readers += 1
+            return True
+
+    def release(self) -> None:
+        with self._lock:
+            self._readers -= 1
+            if not (self.closed and self._readers == 0):
+                return
+        self._close()
+
+    def close(self) -> None:
+        with self._lock:
+            if self.closed:
+                return
+            self.closed = True
+            if self._readers:
+                return
+        self._close()
+
+
+class FileIOWorkerMeta(wrappertype, ABCMeta):
+    """Métaclasse des workers : classe Qt (sip) et classe abstraite à la fois"""
+
+
+class FileIOWorker(QRunnable, metaclass=FileIOWorkerMeta):
+    """Opération fichier exécutée dans le QThreadPool, par blocs, annulable
+
+    Un worker qui lit un document reçoit son ``lease`` : la projection reste
+    ouverte jusqu'à la fin du worker, et sa fermeture vaut annulation.
+    """
+
+    def __init__(self, path: Path, chunk_size: int = IO_CHUNK_SIZE) -> None:
+        super().__init__()
+        self.path = path
+        self.chunk_size = chunk_size
+        self.signals = FileIOSignals()
+        self.lease: ReadLease | None = None
+        self._cancel_event = threading.Event()
+        self._last_percent = -1
+
+    def cancel(self) -> None:
+        self._cancel_event.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set() or (self.lease is not None and self.lease.closed)
+
+    def run(self) -> None:
+        if (lease := self.lease) is not None and not lease.acquire():
+            # Document fermé avant le démarrage du worker
+            self.signals.cancelled.emit()
+            return
+        try:
+            self._run()
+        finally:
+            if lease is not None:
+                lease.release()
+
+    def _run(self) -> None:
+        try:
+            result = self.work()
+        except FileIOCancelled:
+            self.signals.cancelled.emit()
+        except OSError as e:
+            self.signals.failed.emit(str(e))
+        except Exception as e:
+            # Erreur inattendue (bogue) : journalisée, et signalée pour que l'interface ne reste pas occupée
+            logger.exception("échec inattendu de %s sur %s", type(self).__name__, self.path)
+            self.signals.failed.emit(f"{type(e).__name__} : {e}")
+        else:
+            self.signals.finished.emit(result)
+
+    @abstractmethod
+    def work(self) -> object:
+        """Opération exécutée dans le pool de threads ; son résultat est émis par ``finished``"""
+
+    def check_cancelled(self) -> None:
+        if self.is_cancelled:
+            raise FileIOCancelled
+
+    def report_progress(self, done: int, total: int) -> None:
+        """Émet la progression uniquement quand le pourcentage change"""
+        percent = done * 100 // total if total else 100
+        if percent != self._last_percent:
+            self._last_percent = percent
+            self.signals.progress.emit(done, total)
+
+
+class FileWriteWorker(FileIOWorker):
+    """Écrit des blocs dans un fichier temporaire puis le renomme sur la destination
+
+    En cas d'annulation ou d'erreur, le fichier de destination reste intact.
+    """
+
+    def __init__(self, path: Path, chunks: Iterable[bytes], total: int, chunk_size: int = IO_CHUNK_SIZE) -> None:
+        super().__init__(path, chunk_size)
+        self.chunks = chunks
+        self.total = total
+
+    def work(self) -> Path:
+        temporary_path = self.path.with_name(f".{self.path.name}.tmp")
+        done = 0
+        try:
+            with open(temporary_path, "wb") as file:
+                for chunk in self.chunks:
+                    self.check_cancelled()
+                    file.write(chunk)
+                    done += len(chunk)
+                    self.report_progress(done, self.total)
+        except (FileIOCancelled, OSError):
+            temporary_path.unlink(missing_ok=True)
+            raise
+
+        temporary_path.replace(self.path)
+        self.report_progress(self.total, self.total)
+        return self.path
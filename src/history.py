@@ -0,0 +1,271 @@
+import sys
+from collections import deque
+from typing import TYPE_CHECKING
+
+from src.domain.constants import UNDO_HISTORY_BUDGET
+from src.piece_table import ADDED, Piece
+from src.text_styles import TextStyle
+
+if TYPE_CHECKING:
+    from src.document import Document
+
+# Plage de style relative au début d'une modification : (début, fin, style)
+StyleRun = tuple[int, int, TextStyle]
+
+# Taille d'une position ou d'une longueur (entier hors du cache des petits entiers)
+_INT_BYTES = sys.getsizeof(2**40)
+
+
+class TextEdit:
+    """Remplacement de texte à une position : morceaux retirés puis morceaux insérés
+
+    Les morceaux référencent les tampons immuables de la table de morceaux :
+    une entrée ne copie jamais le texte, quelle que soit sa taille. Seuls les
+    styles non vides du texte retiré sont conservés pour être restaurés.
+    """
+
+    __slots__ = ("inserted", "inserted_length", "offset", "removed", "removed_length", "removed_styles")
+
+    def __init__(
+        self, offset: int, removed: list[Piece], inserted: list[Piece], removed_styles: list[StyleRun]
+    ) -> None:
+        self.offset = offset
+        self.removed = removed
+        self.inserted = inserted
+        self.removed_styles = removed_styles
+        self.removed_length = sum(piece.length for piece in removed)
+        self.inserted_length = sum(piece.length for piece in inserted)
+
+    @property
+    def size(self) -> int:
+        return (
+            COMMAND_BYTES
+            + PIECE_BYTES * (len(self.removed) + len(self.inserted))
+            + RUN_BYTES * len(self.removed_styles)
+        )
+
+    def undo(self, document: "Document") -> None:
+        self._replace(document, self.inserted_length, self.removed)
+        for start, end, style in self.removed_styles:
+            document.styles.set_style(self.offset + start, self.offset + end, style)
+
+    def redo(self, document: "Document") -> None:
+        self._replace(document, self.removed_length, self.inserted)
+
+    def _replace(self, document: "Document", length: int, pieces: list[Piece]) -> None:
+        document.text.remove(self.offset, self.offset + length)
+        document.styles.delete(self.offset, self.offset + length)
+        document.text.insert_pieces(self.offset, pieces)
+        document.styles.insert(self.offset, sum(piece.length for piece in pieces))
+
+    @property
+    def empty(self) -> bool:
+        return not self.removed and not self.inserted
+
+    def merge(self, other: "EditCommand") -> bool:
+        """Absorbe une insertion qui prolonge celle-ci (collage par blocs, remplacement de sélection)
+
+        Absorbe aussi la suppression de la fin du texte inséré (collage
+        interrompu) : seuls les octets supprimés sont retirés de l'entrée.
+        """
+        if not isinstance(other, TextEdit):
+            return False
+        if not other.inserted and other.removed:
+            return self._trim(other)
+        if other.removed or other.offset != self.offset + self.inserted_length:
+            return False
+
+        for piece in other.inserted:
+            last = self.inserted[-1] if self.inserted else None
+            if last is not None and last.buffer == piece.buffer == ADDED and last.start + last.length == piece.start:
+                last.length += piece.length
+                last.line_feeds += piece.line_feeds
+            else:
+                self.inserted.append(piece)
+        self.inserted_length += other.inserted_length
+        return True
+
+    def _trim(self, other: "TextEdit") -> bool:
+        end = self.offset + self.inserted_length
+        if other.offset + other.removed_length != end or other.removed_length > self.inserted_length:
+            return False
+
+        # Les morceaux supprimés sont exactement la fin des morceaux insérés (éventuellement découpés autrement)
+        remaining = other.removed_length
+        line_feeds = sum(piece.line_feeds for piece in other.removed)
+        while remaining and self.inserted[-1].length <= remaining:
+            piece = self.inserted.pop()
+            remaining -= piece.length
+            line_feeds -= piece.line_feeds
+        if remaining:
+            last = self.inserted[-1] = self.inserted[-1].copy()
+            last.length -= remaining
+            last.line_feeds -= line_feeds
+        self.inserted_length -= other.removed_length
+        return True
+
+
+class StyleEdit:
+    """Ajout ou retrait d'un style sur une plage, avec les runs de la plage avant modification"""
+
+    __slots__ = ("enabled", "end", "offset", "previous", "style")
+
+    def __init__(self, start: int, end: int, style: TextStyle, enabled: bool, previous: list[StyleRun]) -> None:
+        self.offset = start
+        self.end = end
+        self.style = style
+        self.enabled = enabled
+        self.previous = previous
+
+    @property
+    def size(self) -> int:
+        return COMMAND_BYTES + RUN_BYTES * len(self.previous)
+
+    def undo(self, document: "Document") -> None:
+        for start, end, style in self.previous:
+            document.styles.set_style(start, end, style)
+
+    def redo(self, document: "Document") -> None:
+        document.styles.apply(self.offset, self.end, self.style, self.enabled)
+
+    def merge(self, other: "EditCommand") -> bool:
+        """Bascules répétées du même style sur la même plage : seul le dernier état compte"""
+        if not isinstance(other, StyleEdit) or (other.offset, other.end, other.style) != (
+            self.offset,
+            self.end,
+            self.style,
+        ):
+            return False
+
+        self.enabled = other.enabled
+        return True
+
+    @property
+    def empty(self) -> bool:
+        return False
+
+
+EditCommand = TextEdit | StyleEdit
+
+# Empreinte des objets conservés par une entrée : l'entrée et ses listes, puis
+# chaque morceau ou run avec ses entiers et sa place dans la liste
+COMMAND_BYTES = sys.getsizeof(TextEdit(0, [], [], [])) + 3 * (sys.getsizeof([]) + _INT_BYTES)
+PIECE_BYTES = sys.getsizeof(Piece(0, 0, 0, 0)) + 2 * _INT_BYTES + 8
+RUN_BYTES = sys.getsizeof((0, 0, TextStyle.NONE)) + 2 * _INT_BYTES + 8
+
+
+class EditHistory:
+    """Pile annuler/rétablir à la manière de QUndoStack, bornée en mémoire
+
+    Les entrées décrivent des différences (morceaux, runs de style) et non des
+    copies du document. Une modification peut fusionner avec la précédente ;
+    quand l'empreinte dépasse ``budget`` octets, les entrées les plus
+    anciennes sont oubliées (la plus récente est toujours conservée).
+
+    Comme l'index propre de QUndoStack, ``clean`` repère l'état sauvegardé par
+    sa position absolue (entrées oubliées comprises) : annuler jusqu'à cet
+    état rend le document de nouveau non modifié.
+    """
+
+    def __init__(self, budget: int = UNDO_HISTORY_BUDGET) -> None:
+        self.budget = budget
+        self.commands: deque[EditCommand] = deque()
+        # Nombre d'entrées appliquées : celles au-delà peuvent être rétablies
+        self.index = 0
+        self.memory = 0
+        self.evicted = 0
+        # Position de l'état sauvegardé (None s'il n'est plus atteignable) et d'une sauvegarde en cours
+        self.clean: int | None = 0
+        self.sealed: int | None = None
+
+    def __len__(self) -> int:
+        return len(self.commands)
+
+    def can_undo(self) -> bool:
+        return self.index > 0
+
+    def can_redo(self) -> bool:
+        return self.index < len(self.commands)
+
+    @property
+    def position(self) -> int:
+        """Position absolue de l'état courant"""
+        return self.evicted + self.index
+
+    def is_clean(self) -> bool:
+        return self.clean == self.position
+
+    def checkpoint(self) -> int:
+        """Position de l'état courant, protégée des fusions jusqu'à la fin de sa sauvegarde"""
+        self.sealed = self.position
+        return self.sealed
+
+    def set_clean(self, position: int) -> None:
+        """Marque comme sauvegardé l'état repéré par ``checkpoint`` (s'il n'a pas été abandonné depuis)"""
+        self.clean = position if position == self.sealed else None
+        self.sealed = None
+
+    def push(self, command: EditCommand, merge: bool = False) -> None:
+        """Ajoute une modification déjà appliquée, en la fusionnant si possible avec la précédente"""
+        self.drop_redo()
+
+        # Fusionner avec l'entrée de l'état sauvegardé modifierait cet état
+        if merge and self.commands and self.position not in (self.clean, self.sealed):
+            top = self.commands[-1]
+            size = top.size
+            if top.merge(command):
+                self.memory += top.size - size
+                # Modification entièrement défaite par la suivante : l'entrée disparaît
+                if top.empty:
+                    self.memory -= self.commands.pop().size
+                    self.index -= 1
+                self._evict()
+                return
+
+        self.commands.append(command)
+        self.index += 1
+        self.memory += command.size
+        self._evict()
+
+    def undo(self) -> EditCommand | None:
+        """Retourne l'entrée à annuler (à appliquer par l'appelant)"""
+        if not self.can_undo():
+            return None
+        self.index -= 1
+        return self.commands[self.index]
+
+    def redo(self) -> EditCommand | None:
+        if not self.can_redo():
+            return None
+        self.index += 1
+        return self.commands[self.index - 1]
+
+    def drop_redo(self) -> None:
+        """Oublie les entrées annulées, et l'état sauvegardé s'il en faisait partie"""
+        if len(self.commands) == self.index:
+            return
+
+        while len(self.commands) > self.index:
+            self.memory -= self.commands.pop().size
+        if self.clean is not None and self.clean > self.position:
+            self.clean = None
+        if self.sealed is not None and self.sealed > self.position:
+            self.sealed = None
+
+    def clear(self) -> None:
+        self.commands.clear()
+        self.index = 0
+        self.memory = 0
+        self.evicted = 0
+        self.clean = 0
+        self.sealed = None
+
+    def set_budget(self, budget: int) -> None:
+        self.budget = budget
+        self._evict()
+
+    def _evict(self) -> None:
+        while self.memory > self.budget and len(self.commands) > 1:
+            self.memory -= self.commands.popleft().size
+            self.index = max(0, self.index - 1)
+            self.evicted += 1
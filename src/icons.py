@@ -0,0 +1,96 @@
+import logging
+import os
+from pathlib import Path
+
+from PyQt6.QtCore import QResource, Qt
+from PyQt6.QtGui import QIcon, QPixmap
+
+from src.domain.constants import ICONS_DIR, ICONS_RESOURCE_PATH, ICONS_STRICT_ENV_VAR
+
+logger = logging.getLogger(__name__)
+
+RESOURCE_PREFIX = ":/icons"
+
+
+class IconRegistry:
+    """Résout, décode et met en cache les icônes de l'application
+
+    Les icônes sont lues depuis le bundle de ressources Qt compilé s'il existe,
+    sinon depuis ``ICONS_DIR``. Chaque image n'est décodée qu'une seule fois.
+
+    Une icône absente ou illisible est journalisée et remplacée par une icône
+    vide ; en mode ``strict`` (tests, débogage), elle lève une exception.
+    """
+
+    def __init__(
+        self, icons_dir: Path = ICONS_DIR, resource_file: Path = ICONS_RESOURCE_PATH, strict: bool = False
+    ) -> None:
+        self.icons_dir = icons_dir
+        self.resource_file = resource_file
+        self.strict = strict
+        self.use_resources: bool | None = None
+        self._icons: dict[str, QIcon] = {}
+        # Cache des pixmaps : (nom, taille) -> pixmap, taille None pour l'image d'origine
+        self._pixmaps: dict[tuple[str, int | None], QPixmap] = {}
+
+    def icon(self, name: str) -> QIcon:
+        """Retourne l'icône partagée associée au nom (ex: ``"new"``)"""
+        if (icon := self._icons.get(name)) is None:
+            icon = QIcon(self.pixmap(name))
+            self._icons[name] = icon
+        return icon
+
+    def pixmap(self, name: str, size: int | None = None) -> QPixmap:
+        """Retourne le pixmap de l'icône, redimensionné si une taille est donnée"""
+        if (pixmap := self._pixmaps.get((name, size))) is not None:
+            return pixmap
+
+        if size is None:
+            try:
+                pixmap = self.load(name)
+            except (OSError, ValueError) as e:
+                if self.strict:
+                    raise
+                # Un fichier manquant ne doit pas empêcher le démarrage : icône vide, mise en cache
+                logger.warning("icône %s indisponible : %s", name, e)
+                pixmap = QPixmap()
+        elif (original := self.pixmap(name)).isNull():
+            pixmap = original
+        else:
+            pixmap = original.scaled(
+                size,
+                size,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+
+        self._pixmaps[(name, size)] = pixmap
+        return pixmap
+
+    def load(self, name: str) -> QPixmap:
+        """Décode l'image d'origine de l'icône, sans cache"""
+        pixmap = QPixmap(self.resolve(name))
+        if pixmap.isNull():
+            raise ValueError(f"L'icône {name} n'a pas pu être décodée")
+        return pixmap
+
+    def resolve(self, name: str) -> str:
+        """Chemin de l'icône dans le bundle de ressources ou dans ``icons_dir``"""
+        if self.use_resources is None:
+            self.use_resources = self.resource_file.exists() and QResource.registerResource(str(self.resource_file))
+
+        if self.use_resources:
+            return f"{RESOURCE_PREFIX}/{name}.png"
+
+        path = self.icons_dir / f"{name}.png"
+        if not path.exists():
+            raise FileNotFoundError(f"Le fichier {path} n'existe pas")
+        return str(path)
+
+    def clear(self) -> None:
+        self._icons.clear()
+        self._pixmaps.clear()
+
+
+# Registre partagé par toute l'application
+icon_registry = IconRegistry(strict=bool(os.environ.get(ICONS_STRICT_ENV_VAR)))
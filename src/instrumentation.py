@@ -0,0 +1,195 @@
+import json
+import logging
+import time
+from collections import deque
+from collections.abc import Callable
+from functools import wraps
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from PyQt6.QtCore import QEvent, QObject, Qt, QTimer
+from PyQt6.QtWidgets import QDockWidget, QTableWidget, QTableWidgetItem, QWidget
+
+if TYPE_CHECKING:
+    from src.main_windows import MainWindow
+
+logger = logging.getLogger(__name__)
+
+# Méthodes de MainWindow chronométrées quand l'instrumentation est active
+INSTRUMENTED_SLOTS = [
+    "dispatch_action",
+    "display_notification",
+    "increment_action_counter",
+    "get_edit_context_menu",
+    "get_toolbar_context_menu",
+]
+
+PERCENTILES = (50, 95, 99)
+
+
+class PaintEventCounter(QObject):
+    """Compte les événements de peinture reçus par les widgets observés"""
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self.count = 0
+
+    def watch(self, *widgets: QWidget) -> None:
+        for widget in widgets:
+            widget.installEventFilter(self)
+
+    def reset(self) -> None:
+        self.count = 0
+
+    def eventFilter(self, watched: QObject | None, event: QEvent | None) -> bool:  # noqa: N802
+        if event is not None and event.type() == QEvent.Type.Paint:
+            self.count += 1
+        return super().eventFilter(watched, event)
+
+
+class LatencyHistogram:
+    """Échantillons de durées (ms) conservés dans une fenêtre glissante bornée"""
+
+    def __init__(self, max_samples: int = 10_000) -> None:
+        self.samples: deque[float] = deque(maxlen=max_samples)
+        self.count = 0
+        self.maximum = 0.0
+
+    def add(self, value: float) -> None:
+        self.samples.append(value)
+        self.count += 1
+        self.maximum = max(self.maximum, value)
+
+    def percentile(self, percent: float) -> float:
+        """Percentile par rang le plus proche sur la fenêtre d'échantillons"""
+        return self._percentile(sorted(self.samples), percent)
+
+    def summary(self) -> dict[str, float]:
+        ordered = sorted(self.samples)
+        summary: dict[str, float] = {"count": self.count, "max": self.maximum}
+        for percent in PERCENTILES:
+            summary[f"p{percent}"] = self._percentile(ordered, percent)
+        return summary
+
+    @staticmethod
+    def _percentile(ordered: list[float], percent: float) -> float:
+        if not ordered:
+            return 0.0
+
+        rank = max(0, min(len(ordered) - 1, round(percent / 100 * len(ordered)) - 1))
+        return ordered[rank]
+
+
+class Instrumentation(QObject):
+    """Instrumentation optionnelle du thread GUI : durée des slots et latence de la boucle d'événements
+
+    Rien n'est installé tant qu'aucune instance n'est passée à ``MainWindow`` :
+    l'instrumentation désactivée n'ajoute aucun coût.
+    """
+
+    def __init__(self, heartbeat_interval: int = 50, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self.histograms: dict[str, LatencyHistogram] = {}
+        self.counters: dict[str, int] = {}
+
+        # Battement régulier : tout retard sur l'intervalle attendu est du temps bloqué sur le thread GUI
+        self.heartbeat_interval = heartbeat_interval
+        self.heartbeat = QTimer(self)
+        self.heartbeat.setInterval(heartbeat_interval)
+        self.heartbeat.setTimerType(Qt.TimerType.PreciseTimer)
+        self.heartbeat.timeout.connect(self._on_heartbeat)
+        self._last_beat = 0.0
+
+    def histogram(self, name: str) -> LatencyHistogram:
+        if (histogram := self.histograms.get(name)) is None:
+            histogram = LatencyHistogram()
+            self.histograms[name] = histogram
+        return histogram
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def wrap(self, target: object, method_name: str, metric: str | None = None) -> None:
+        """Remplace la méthode de l'instance par une version chronométrée"""
+        original: Callable[..., Any] = getattr(target, method_name)
+        histogram = self.histogram(metric or method_name)
+
+        @wraps(original)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                histogram.add((time.perf_counter() - start) * 1000)
+
+        setattr(target, method_name, timed)
+
+    def attach(self, window: "MainWindow") -> None:
+        """Chronomètre les slots critiques de la fenêtre (avant toute connexion de signal)"""
+        for method_name in INSTRUMENTED_SLOTS:
+            self.wrap(window, method_name)
+        self.wrap(window.theme_manager, "apply", "theme_apply")
+        self.start()
+
+    def start(self) -> None:
+        self._last_beat = time.perf_counter()
+        self.heartbeat.start()
+
+    def stop(self) -> None:
+        self.heartbeat.stop()
+
+    def snapshot(self) -> dict[str, Any]:
+        """Compteurs et histogrammes (count, max, p50, p95, p99 en ms)"""
+        return {
+            "counters": dict(self.counters),
+            "histograms": {name: histogram.summary() for name, histogram in self.histograms.items()},
+        }
+
+    def dump_json(self, path: Path) -> None:
+        path.write_text(json.dumps(self.snapshot(), indent=2) + "\n")
+
+    def log_snapshot(self) -> None:
+        logger.info("instrumentation %s", json.dumps(self.snapshot()))
+
+    def _on_heartbeat(self) -> None:
+        now = time.perf_counter()
+        lag = (now - self._last_beat) * 1000 - self.heartbeat_interval
+        self._last_beat = now
+        self.histogram("event_loop_lag").add(max(lag, 0.0))
+        self.increment("heartbeats")
+
+
+class InstrumentationPanel(QDockWidget):
+    """Panneau de débogage ancrable affichant les histogrammes de latence"""
+
+    COLUMNS = ("Mesure", "Appels", "p50 (ms)", "p95 (ms)", "p99 (ms)", "max (ms)")
+
+    def __init__(self, instrumentation: Instrumentation, parent: QWidget | None = None) -> None:
+        super().__init__("Instrumentation", parent)
+        self.instrumentation = instrumentation
+
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.setWidget(self.table)
+
+        # Rafraîchi uniquement lorsque le panneau est visible
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(1000)
+        self.refresh_timer.timeout.connect(self.refresh)
+        self.visibilityChanged.connect(self._on_visibility_changed)
+
+    def refresh(self) -> None:
+        histograms = self.instrumentation.snapshot()["histograms"]
+        self.table.setRowCount(len(histograms))
+        for row, (name, summary) in enumerate(sorted(histograms.items())):
+            values = [name, str(summary["count"])]
+            values += [f"{summary[key]:.3f}" for key in ("p50", "p95", "p99", "max")]
+            for column, value in enumerate(values):
+                self.table.setItem(row, column, QTableWidgetItem(value))
+
+    def _on_visibility_changed(self, visible: bool) -> None:
+        if visible:
+            self.refresh()
+            self.refresh_timer.start()
+        else:
+            self.refresh_timer.stop()
@@ -0,0 +1,71 @@
+from array import array
+from bisect import bisect_right
+from pathlib import Path
+
+from src.domain.constants import IO_CHUNK_SIZE
+from src.file_io import FileIOWorker, ReadableBuffer
+
+
+def line_starts(chunk: bytes | bytearray, chunk_start: int) -> array[int]:
+    """Positions des débuts de ligne (après chaque saut de ligne) d'un bloc lu à ``chunk_start``"""
+    offsets = array("q")
+    position = chunk.find(b"\n")
+    while position != -1:
+        offsets.append(chunk_start + position + 1)
+        position = chunk.find(b"\n", position + 1)
+    return offsets
+
+
+class LineIndex:
+    """Positions de début de ligne d'un tampon, construites progressivement
+
+    Seul le worker d'indexation ajoute des positions tant que ``complete`` est
+    faux ; le thread GUI peut lire les lignes déjà indexées à tout moment.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.starts = array("q", [0])
+        # Position jusqu'à laquelle le tampon a été parcouru
+        self.scanned = 0
+        self.complete = size == 0
+
+    def __len__(self) -> int:
+        """Nombre de lignes connues (la dernière peut encore s'allonger tant que l'index est incomplet)"""
+        return len(self.starts)
+
+    def scan_chunk(self, chunk: bytes | bytearray, chunk_start: int) -> None:
+        """Ajoute les débuts de ligne trouvés dans un bloc lu à la position ``chunk_start``"""
+        self.starts.extend(line_starts(chunk, chunk_start))
+        self.scanned = chunk_start + len(chunk)
+
+    def line_of(self, offset: int) -> int:
+        """Numéro de la ligne contenant la position ``offset``"""
+        return bisect_right(self.starts, offset) - 1
+
+    def line_range(self, line: int) -> tuple[int, int]:
+        """Positions (début, fin) de la ligne, sans le saut de ligne final"""
+        start = self.starts[line]
+        if line + 1 < len(self.starts):
+            return start, self.starts[line + 1] - 1
+        return start, max(start, self.scanned)
+
+
+class LineIndexWorker(FileIOWorker):
+    """Parcourt un tampon (mmap) par blocs pour construire son index de lignes"""
+
+    def __init__(self, path: Path, buffer: ReadableBuffer, index: LineIndex, chunk_size: int = IO_CHUNK_SIZE) -> None:
+        super().__init__(path, chunk_size)
+        self.buffer = buffer
+        self.index = index
+
+    def work(self) -> LineIndex:
+        total = self.index.size
+
+        for chunk_start in range(0, total, self.chunk_size):
+            self.check_cancelled()
+            self.index.scan_chunk(self.buffer[chunk_start : chunk_start + self.chunk_size], chunk_start)
+            self.report_progress(self.index.scanned, total)
+
+        self.index.complete = True
+        return self.index
@@ -1,235 +1,329 @@
-from typing import Literal
-
-from PyQt6.QtCore import QPoint, Qt, QTimer, pyqtSignal
-from PyQt6.QtGui import QAction, QIcon
-from PyQt6.QtWidgets import QLabel, QMainWindow, QMenu, QPushButton
-
-from src.domain.constants import CSS_DARK_FILE_PATH, CSS_LIGHT_FILE_PATH
-from src.utils import load_css
+import time
+from bisect import bisect_left
+from collections.abc import Callable
+from typing import Any
+from functools import partial
+from pathlib import Path
+
+from PyQt6.QtCore import QByteArray, QPoint, Qt, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QAction, QCloseEvent, QGuiApplication
+from PyQt6.QtWidgets import (
+    QFileDialog,
+    QInputDialog,
+    QLabel,
+    QMainWindow,
+    QMenu,
+    QMenuBar,
+    QMessageBox,
+    QProgressBar,
+    QPushButton,
+    QTabBar,
+    QToolBar,
+    QVBoxLayout,
+    QWidget,
+)
+
+from src.actions import ACTIONS, MENU_LAYOUT, TOOLBAR_LAYOUT
+from src.autosave import Autosave
+from src.clipboard import ClipboardMonitor, IncrementalInsert
+from src.document import Document
+from src.domain.constants import IO_CHUNK_SIZE, NOTIFICATION_POOL_SIZE, UNDO_HISTORY_BUDGET
+from src.document_tabs import DocumentTab, ViewPosition
+from src.document_view import DocumentView
+from src.file_io import FileIOWorker, FileWriteWorker
+from src.icons import icon_registry
+from src.instrumentation import Instrumentation, InstrumentationPanel
+from src.line_index import LineIndexWorker
+from src.notifications import (
+    NotificationPool,
+    NotificationScheduler,
+    NotificationType,
+    PoolPolicy,
+    add_registry_listener,
+    notification_stylesheet,
+    remove_registry_listener,
+)
+from src.process_pool import ProcessPool, ProcessTask, ProcessTaskWorker
+from src.process_tasks import TextStatistics, merge_statistics, text_statistics
+from src.search_index import SearchIndexWorker, SearchWorker
+from src.session import SessionState, SessionStore
+from src.status_updates import StatusUpdateBatcher
+from src.telemetry import UsageRecorder, UsageStats
+from src.text_styles import TextStyle
+from src.theme_manager import Theme, ThemeManager
+from src.utils import format_size
 
 
 class MainWindow(QMainWindow):
     # Signal pour le système de notifications
     show_notification = pyqtSignal(str, str)  # (message, type)
 
-    def __init__(self) -> None:
+    # Actions créées à partir du registre (voir src.actions)
+    new_action: QAction
+    open_action: QAction
+    save_action: QAction
+    quit_action: QAction
+    cancel_io_action: QAction
+    close_tab_action: QAction
+    undo_action: QAction
+    redo_action: QAction
+    light_theme_action: QAction
+    dark_theme_action: QAction
+    copy_action: QAction
+    cut_action: QAction
+    paste_action: QAction
+    statistics_action: QAction
+    find_action: QAction
+    find_next_action: QAction
+    bold_action: QAction
+    italic_action: QAction
+    toolbar_view_action: QAction
+    statusbar_view_action: QAction
+
+    def __init__(
+        self,
+        notification_pool_size: int = NOTIFICATION_POOL_SIZE,
+        notification_policy: PoolPolicy = "drop_oldest",
+        lazy: bool = False,
+        instrumentation: Instrumentation | None = None,
+        undo_budget: int = UNDO_HISTORY_BUDGET,
+        usage: UsageRecorder | None = None,
+        autosave: Autosave | None = None,
+        process_pool: ProcessPool | None = None,
+        session: SessionStore | None = None,
+    ) -> None:
         super().__init__()
+        # Mode paresseux : menus et notifications ne sont construits qu'à la première utilisation
+        self.lazy = lazy
         self.setWindowTitle("TP21 : tp_interface_complete")
         self.setGeometry(100, 100, 800, 600)
 
-        label = QLabel("Hello, World!")
-        self.setCentralWidget(label)
+        # Document courant, affiché dans une vue virtualisée, avec un historique borné en mémoire
+        self.undo_budget = undo_budget
+        self.document = Document()
+        self.document.history.set_budget(undo_budget)
+        self.document_view = DocumentView(self.document)
+
+        # Onglets : une seule vue pour tous les documents, chaque onglet ne garde que son document et sa position
+        self.tabs = [DocumentTab(self.document)]
+        self.tab_bar = QTabBar()
+        self.tab_bar.setDocumentMode(True)
+        self.tab_bar.setExpanding(False)
+        self.tab_bar.setMovable(True)
+        self.tab_bar.setTabsClosable(True)
+        self.tab_bar.addTab(self.tabs[0].title)
+        self.tab_bar.currentChanged.connect(self.on_tab_changed)
+        self.tab_bar.tabCloseRequested.connect(self.close_tab)
+        self.tab_bar.tabMoved.connect(self.on_tab_moved)
+
+        central_widget = QWidget()
+        layout = QVBoxLayout(central_widget)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        layout.addWidget(self.tab_bar)
+        layout.addWidget(self.document_view)
+        self.setCentralWidget(central_widget)
+
+        # Entrées/sorties en arrière-plan
+        self.thread_pool = QThreadPool(self)
+        self.io_worker: FileIOWorker | None = None
+        self.io_save_enabled = False
+        # Fermeture de la fenêtre reportée à la fin d'une sauvegarde, et documents dont les modifications sont abandonnées
+        self.close_pending = False
+        self.close_discarded: list[Document] = []
+        # Collage volumineux en cours d'insertion
+        self.edit_job: IncrementalInsert | None = None
+        # Sauvegarde automatique des modifications (optionnelle)
+        self.autosave = autosave
+        # Recherche plein texte : index construits en arrière-plan, occurrences reçues par lots
+        self.index_workers: list[SearchIndexWorker] = []
+        self.search_worker: SearchWorker | None = None
+        self.search_query = ""
+        self.search_results: list[int] = []
+        self.search_selected = False
+        # Session précédente, lue d'un bloc et restaurée avant le premier affichage
+        self.session = session
+        session_state = session.load() if session is not None else None
+
+        # Traitements lourds dans des processus séparés (démarrés à la première tâche)
+        self.process_pool = process_pool or ProcessPool()
+        self.process_workers: list[ProcessTaskWorker] = []
+
+        # Presse-papier système, suivi par signal plutôt qu'interrogé
+        clipboard = QGuiApplication.clipboard()
+        self.clipboard = ClipboardMonitor(clipboard, self) if clipboard is not None else None
 
         # Initialiser les états de formatage
         self.is_bold = False
         self.is_italic = False
 
-        # Initialiser le compteur d'actions
+        # Initialiser le compteur d'actions (session) et les statistiques d'usage persistées (optionnelles)
         self.action_counter = 0
+        self.usage = usage
 
-        # Initialiser le système de notifications
-        self.notification_widgets: list[QLabel] = []  # Liste des widgets de notification actifs
-        self.notification_timers: list[QTimer] = []  # Liste des timers associés
+        # Mises à jour regroupées de la barre de statut (créées avec la barre de statut)
+        self.status_updates: StatusUpdateBatcher | None = None
+
+        # Gestionnaire de thèmes (feuilles de style mises en cache)
+        self.theme_manager = ThemeManager(extra_stylesheet=notification_stylesheet)
+        # Un type de notification enregistré après le démarrage reçoit aussitôt ses règles
+        add_registry_listener(self.on_notification_types_changed)
+
+        # Instrumentation optionnelle : les slots sont chronométrés avant toute connexion de signal
+        self.instrumentation = instrumentation
+        if self.instrumentation is not None:
+            self.instrumentation.attach(self)
+
+        # Initialiser le système de notifications (labels recyclés dans la barre de statut)
+        self.notification_pool_size = notification_pool_size
+        self.notification_policy: PoolPolicy = notification_policy
+        self.notification_pool: NotificationPool | None = None
+        self.notification_scheduler: NotificationScheduler | None = None
+        if not self.lazy:
+            self.setup_notifications()
 
         # Créer les actions partagées
         self.create_actions()
 
         # Connecter le signal de notification
-        self.show_notification.connect(self.display_notification)
+        self.show_notification.connect(self.submit_notification)
 
         self.setup_menu_bar()
         self.setup_toolbar()
         self.setup_status_bar()
         self.sync_view_actions_state()
         self.save_action.setEnabled(False)
-        self.content_to_copy = False
-        self.content_to_cut = False
-        self.setup_theme()
+        self.update_history_state()
+        self.setup_clipboard()
+        self.setup_theme(session_state.theme if session_state is not None else "light")
         self.setup_context_menu()
         self.setup_shortcuts()
+        self.setup_instrumentation_panel()
+        self.setup_usage()
+        self.setup_autosave()
+        if session_state is not None:
+            self.restore_session(session_state)
 
     def create_actions(self) -> None:
-        """Crée toutes les actions partagées entre menus et barres d'outils"""
-        # Actions principales
-        self.new_action = QAction("&Nouveau", self)
-        self.new_action.setShortcut("Ctrl+N")
-        self.new_action.setIcon(QIcon("icons/new.png"))
-        self.new_action.setStatusTip("Créer un nouveau document")
-        self.new_action.triggered.connect(self.action_nouveau)
-
-        self.open_action = QAction("&Ouvrir", self)
-        self.open_action.setShortcut("Ctrl+O")
-        self.open_action.setIcon(QIcon("icons/open.png"))
-        self.open_action.setStatusTip("Ouvrir un document existant")
-        self.open_action.triggered.connect(self.action_ouvrir)
-
-        self.save_action = QAction("&Sauvegarder", self)
-        self.save_action.setShortcut("Ctrl+S")
-        self.save_action.setIcon(QIcon("icons/save.png"))
-        self.save_action.setStatusTip("Sauvegarder le document actuel")
-        self.save_action.triggered.connect(self.action_sauvegarder)
-
-        self.quit_action = QAction("&Quitter", self)
-        self.quit_action.setShortcut("Ctrl+Q")
-        self.quit_action.setStatusTip("Fermer l'application")
-        self.quit_action.triggered.connect(self.close)
-
-        # Actions de thème
-        self.light_theme_action = QAction("&Thème clair", self)
-        self.light_theme_action.triggered.connect(self.apply_light_theme)
-
-        self.dark_theme_action = QAction("&Thème sombre", self)
-        self.dark_theme_action.triggered.connect(self.apply_dark_theme)
-
-        # Actions d'édition
-        self.copy_action = QAction("&Copier", self)
-        self.copy_action.setShortcut("Ctrl+C")
-        self.copy_action.setStatusTip("Copier le contenu sélectionné")
-        self.copy_action.triggered.connect(self.copy_content)
-
-        self.cut_action = QAction("Co&uper", self)
-        self.cut_action.setShortcut("Ctrl+X")
-        self.cut_action.setStatusTip("Couper le contenu sélectionné")
-        self.cut_action.triggered.connect(self.cut_content)
-
-        self.paste_action = QAction("C&oller", self)
-        self.paste_action.setShortcut("Ctrl+V")
-        self.paste_action.setStatusTip("Coller le contenu du presse-papier")
-        self.paste_action.triggered.connect(self.paste_content)
-
-        # Actions d'affichage
-        self.toolbar_view_action = QAction("&Barre d'outils", self)
-        self.toolbar_view_action.setCheckable(True)
-        self.toolbar_view_action.setChecked(True)  # Visible par défaut
-        self.toolbar_view_action.setStatusTip("Afficher/Masquer la barre d'outils")
-        self.toolbar_view_action.triggered.connect(self.toggle_toolbar_visibility)
-
-        self.statusbar_view_action = QAction("Barre de &statut", self)
-        self.statusbar_view_action.setCheckable(True)
-        self.statusbar_view_action.setChecked(True)  # Visible par défaut
-        self.statusbar_view_action.setStatusTip("Afficher/Masquer la barre de statut")
-        self.statusbar_view_action.triggered.connect(self.toggle_statusbar_visibility)
-
-    def setup_theme(self) -> None:
-        self.apply_light_theme()  # default theme
-
-        if (menu := self.menuBar()) is None:
-            return
-
-        if (theme_menu := menu.addMenu("&Thème")) is None:
+        """Crée toutes les actions partagées à partir du registre déclaratif"""
+        self.actions_by_name: dict[str, QAction] = {}
+
+        for spec in ACTIONS.values():
+            action = QAction(spec.text, self)
+            if spec.shortcut is not None:
+                action.setShortcut(spec.shortcut)
+            if spec.icon is not None:
+                action.setIcon(icon_registry.icon(spec.icon))
+            if spec.status_tip is not None:
+                action.setStatusTip(spec.status_tip)
+            if spec.checkable:
+                action.setCheckable(True)
+                action.setChecked(spec.checked)
+            action.triggered.connect(partial(self.dispatch_action, spec.name))
+
+            self.actions_by_name[spec.name] = action
+            setattr(self, f"{spec.name}_action", action)
+
+    def dispatch_action(self, name: str, _checked: bool = False) -> None:
+        """Chemin commun à toutes les actions : mutation d'état, compteur, notification et statut"""
+        start = time.perf_counter()
+        feedback = ACTIONS[name].handler(self)
+        if self.usage is not None:
+            self.usage.record(name, (time.perf_counter() - start) * 1000)
+        if feedback is None:
             return
 
-        theme_menu.addAction(self.light_theme_action)
-        theme_menu.addAction(self.dark_theme_action)
+        self.increment_action_counter(feedback.action_name)
+        self.show_notification.emit(feedback.notification, feedback.notification_type)
+        if feedback.status_message is not None:
+            self.show_status_message(feedback.status_message, feedback.status_timeout)
 
-    def apply_light_theme(self) -> None:
-        self.increment_action_counter("Thème clair")
-        self.show_notification.emit("Thème clair appliqué", "info")
-        self.setStyleSheet(load_css(CSS_LIGHT_FILE_PATH))
+    def setup_theme(self, theme: Theme = "light") -> None:
+        if self.lazy:
+            # Appliquer le thème initial sans compteur ni notification avant le premier affichage
+            self.theme_manager.apply(self, theme)
+        else:
+            self.dispatch_action(f"{theme}_theme")
 
-    def apply_dark_theme(self) -> None:
-        self.increment_action_counter("Thème sombre")
-        self.show_notification.emit("Thème sombre appliqué", "info")
-        self.setStyleSheet(load_css(CSS_DARK_FILE_PATH))
+    def setup_clipboard(self) -> None:
+        """L'action Coller suit l'état du presse-papier sans le consulter à chaque affichage"""
+        self.paste_action.setEnabled(self.has_clipboard_content())
+        if self.clipboard is not None:
+            self.clipboard.changed.connect(self.paste_action.setEnabled)
 
-    def toggle_toolbar_visibility(self) -> None:
-        """Bascule la visibilité de la barre d'outils"""
-        if self.toolbar is None:
+    def setup_instrumentation_panel(self) -> None:
+        """Ajoute le panneau de débogage et son entrée dans le menu Affichage"""
+        if self.instrumentation is None:
             return
 
-        is_visible = not self.toolbar.isVisible()
-        self.toolbar.setVisible(is_visible)
-        # Synchroniser l'état de l'action avec la visibilité réelle
-        self.toolbar_view_action.setChecked(is_visible)
+        self.instrumentation_panel = InstrumentationPanel(self.instrumentation, self)
+        self.addDockWidget(Qt.DockWidgetArea.BottomDockWidgetArea, self.instrumentation_panel)
+        self.instrumentation_panel.hide()
 
-        action_name = "Afficher barre d'outils" if is_visible else "Masquer barre d'outils"
-        self.increment_action_counter(action_name)
+        if (menu_bar := self.menuBar()) is None:
+            return
+        for menu in menu_bar.findChildren(QMenu):
+            if menu.title() == "&Affichage":
+                menu.addAction(self.instrumentation_panel.toggleViewAction())
 
-        # Notification d'information
-        message = "Barre d'outils affichée" if is_visible else "Barre d'outils masquée"
-        self.show_notification.emit(message, "info")
+    def setup_usage(self) -> None:
+        """Charge l'historique d'usage en arrière-plan : le premier affichage n'attend pas la lecture"""
+        if self.usage is None:
+            return
 
-        if (status_bar := self.statusBar()) is not None:
-            status_bar.showMessage(message, 2000)
+        self.usage.loaded.connect(self.on_usage_loaded)
+        self.usage.load()
 
-    def toggle_statusbar_visibility(self) -> None:
-        """Bascule la visibilité de la barre de statut"""
-        if (status_bar := self.statusBar()) is None:
-            return
+    def on_usage_loaded(self, stats: UsageStats) -> None:
+        most_used = sorted(stats.counts, key=stats.counts.__getitem__, reverse=True)[:5]
+        lines = [f"Actions (toutes sessions) : {stats.total}"]
+        lines += [f"{name} : {stats.counts[name]} ({stats.mean_latency(name):.1f} ms)" for name in most_used]
+        self.action_counter_label.setToolTip("\n".join(lines))
 
-        is_visible = not status_bar.isVisible()
-        action_name = "Afficher barre de statut" if is_visible else "Masquer barre de statut"
-        self.increment_action_counter(action_name)
+    def setup_autosave(self) -> None:
+        if self.autosave is None:
+            return
 
-        # Notification d'information (avant de masquer la barre de statut)
-        message = "Barre de statut affichée" if is_visible else "Barre de statut masquée"
-        if not is_visible:
-            # Si on va masquer la barre, montrer la notification avant
-            self.show_notification.emit(message, "warning")
+        self.autosave.saved.connect(self.on_autosaved)
+        self.autosave.failed.connect(self.on_autosave_failed)
 
-        status_bar.setVisible(is_visible)
-        # Synchroniser l'état de l'action avec la visibilité réelle
-        self.statusbar_view_action.setChecked(is_visible)
+    def on_autosaved(self, written: int, duration: float) -> None:
+        if self.status_updates is not None and self.autosave_label is not None:
+            self.status_updates.set_text(self.autosave_label, f"Auto : {format_size(written)} en {duration:.0f} ms")
 
-        # Si la barre est visible, afficher un message et notification
-        if is_visible:
-            status_bar.showMessage("Barre de statut affichée", 2000)
-            self.show_notification.emit(message, "info")
+    def on_autosave_failed(self, message: str) -> None:
+        self.show_status_message(f"Échec de la sauvegarde automatique : {message}", 5000)
 
     def setup_menu_bar(self) -> None:
         if (menu_bar := self.menuBar()) is None:
             return
 
-        # Menu Fichier
-        if (file_menu := menu_bar.addMenu("&Fichier")) is None:
-            return
-        file_menu.addAction(self.new_action)
-        file_menu.addAction(self.open_action)
-        file_menu.addSeparator()
-        file_menu.addAction(self.save_action)
-        file_menu.addSeparator()
-        file_menu.addAction(self.quit_action)
-
-        # Menu Édition
-        if (edit_menu := menu_bar.addMenu("&Édition")) is None:
-            return
-        edit_menu.addAction(self.copy_action)
-        edit_menu.addAction(self.cut_action)
-        edit_menu.addAction(self.paste_action)
+        for title, layout in MENU_LAYOUT.items():
+            self.add_menu(menu_bar, title, partial(self.populate_menu, layout))
 
-        # Menu Affichage
-        if (view_menu := menu_bar.addMenu("&Affichage")) is None:
-            return
-        view_menu.addAction(self.toolbar_view_action)
-        view_menu.addAction(self.statusbar_view_action)
+    def add_menu(self, menu_bar: QMenuBar, title: str, populate: Callable[[QMenu], None]) -> QMenu | None:
+        """Ajoute un menu, rempli immédiatement ou à sa première ouverture en mode paresseux"""
+        if (menu := menu_bar.addMenu(title)) is None:
+            return None
 
-        # Menu Quitter
-        if (quit_menu := menu_bar.addMenu("&Quitter")) is None:
-            return
-        quit_menu.addAction(self.quit_action)
+        if not self.lazy:
+            populate(menu)
+            return menu
 
-    def action_nouveau(self) -> None:
-        self.increment_action_counter("Nouveau document")
-        self.show_notification.emit("Nouveau document créé avec succès", "success")
-        if (status_bar := self.statusBar()) is not None:
-            status_bar.showMessage("Nouvelle fenêtre ouverte", 1000)
-        self.save_action.setEnabled(True)
+        def populate_once() -> None:
+            menu.aboutToShow.disconnect(populate_once)
+            populate(menu)
 
-    def action_ouvrir(self) -> None:
-        self.increment_action_counter("Ouvrir document")
-        self.show_notification.emit("Document ouvert avec succès", "success")
-        if (status_bar := self.statusBar()) is not None:
-            status_bar.showMessage("Fenêtre ouverte", 1000)
-        self.save_action.setEnabled(True)
+        menu.aboutToShow.connect(populate_once)
+        return menu
 
-    def action_sauvegarder(self) -> None:
-        self.increment_action_counter("Sauvegarder document")
-        self.show_notification.emit("Document sauvegardé avec succès", "success")
-        # Barre de statut
-        if (status_bar := self.statusBar()) is not None:
-            status_bar.showMessage("Fenêtre sauvegardée", 1000)
-
-        self.save_action.setEnabled(False)
+    def populate_menu(self, layout: list[str | None], container: QMenu | QToolBar) -> None:
+        """Ajoute les actions d'une disposition (None = séparateur) à un menu ou une barre d'outils"""
+        for name in layout:
+            if name is None:
+                container.addSeparator()
+            else:
+                container.addAction(self.actions_by_name[name])
 
     def setup_toolbar(self) -> None:
         self.toolbar = self.addToolBar("Principal")
@@ -239,18 +333,15 @@ class MainWindow(QMainWindow):
         self.toolbar.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextUnderIcon)
 
         # Utiliser les actions partagées
-        self.toolbar.addAction(self.new_action)
-        self.toolbar.addSeparator()
-        self.toolbar.addAction(self.open_action)
-        self.toolbar.addSeparator()
-        self.toolbar.addAction(self.save_action)
-        self.toolbar.addSeparator()
-        self.toolbar.addAction(self.quit_action)
+        self.populate_menu(TOOLBAR_LAYOUT, self.toolbar)
 
     def setup_status_bar(self) -> None:
         if (status_bar := self.statusBar()) is None:
             return
 
+        # Mises à jour de la barre de statut regroupées par tour de boucle d'événements
+        self.status_updates = StatusUpdateBatcher(status_bar)
+
         status_bar.showMessage("Application prête", 2000)
 
         # Widget d'état permanent (gauche)
@@ -262,6 +353,29 @@ class MainWindow(QMainWindow):
         self.action_counter_label.setStyleSheet("QLabel { margin: 0 10px; font-weight: bold; }")
         status_bar.addPermanentWidget(self.action_counter_label)
 
+        # Nombre de lignes du document
+        self.line_count_label = QLabel(f"Lignes: {self.document.line_count}")
+        status_bar.addPermanentWidget(self.line_count_label)
+
+        # Mémoire occupée par l'historique annuler/rétablir
+        self.history_label = QLabel(self.history_text())
+        self.history_label.setToolTip("Mémoire de l'historique annuler/rétablir (utilisée / budget)")
+        status_bar.addPermanentWidget(self.history_label)
+
+        # Dernière sauvegarde automatique : volume écrit et durée
+        self.autosave_label: QLabel | None = None
+        if self.autosave is not None:
+            self.autosave_label = QLabel("Auto : -")
+            self.autosave_label.setToolTip("Dernière sauvegarde automatique (octets écrits, durée)")
+            status_bar.addPermanentWidget(self.autosave_label)
+
+        # Progression des entrées/sorties (visible pendant une opération)
+        self.io_progress_bar = QProgressBar()
+        self.io_progress_bar.setMaximumWidth(150)
+        self.io_progress_bar.setRange(0, 100)
+        self.io_progress_bar.hide()
+        status_bar.addPermanentWidget(self.io_progress_bar)
+
         # Bouton de remise à zéro (droite)
         self.reset_counter_button = QPushButton("RAZ")
         self.reset_counter_button.setMaximumWidth(50)
@@ -279,299 +393,858 @@ class MainWindow(QMainWindow):
         if (status_bar := self.statusBar()) is not None:
             self.statusbar_view_action.setChecked(status_bar.isVisible())
 
+    def show_status_message(self, message: str, timeout: int = 0) -> None:
+        """Affiche un message temporaire dans la barre de statut (regroupé par tour de boucle)"""
+        if self.status_updates is not None:
+            self.status_updates.show_message(message, timeout)
+
     def increment_action_counter(self, action_name: str = "Action") -> None:
         """Incrémente le compteur d'actions et met à jour l'affichage"""
         self.action_counter += 1
-        self.action_counter_label.setText(f"Actions: {self.action_counter}")
+        if self.status_updates is not None:
+            self.status_updates.set_text(self.action_counter_label, f"Actions: {self.action_counter}")
 
         # Feedback optionnel dans la barre de statut
-        if (status_bar := self.statusBar()) is not None:
-            status_bar.showMessage(f"{action_name} effectuée (Total: {self.action_counter})", 1500)
+        self.show_status_message(f"{action_name} effectuée (Total: {self.action_counter})", 1500)
 
     def reset_action_counter(self) -> None:
         """Remet à zéro le compteur d'actions - Communication bidirectionnelle"""
         previous_count = self.action_counter
         self.action_counter = 0
-        self.action_counter_label.setText(f"Actions: {self.action_counter}")
+        if self.status_updates is not None:
+            self.status_updates.set_text(self.action_counter_label, f"Actions: {self.action_counter}")
 
         # Notification importante pour la remise à zéro
         self.show_notification.emit(f"Compteur remis à zéro ({previous_count} actions effacées)", "warning")
 
         # Feedback dans la barre de statut
+        self.show_status_message(f"Compteur remis à zéro (était: {previous_count})", 2000)
+
+        # Mettre à jour l'état permanent
+        if self.status_updates is not None:
+            self.status_updates.set_text(self.status_label_permanent, "État: Compteur remis à zéro")
+
+    def closeEvent(self, event: QCloseEvent | None) -> None:  # noqa: N802
+        """Enregistre la session, annule les opérations en arrière-plan et écrit les dernières statistiques d'usage
+
+        La fermeture attend d'abord la fin d'une sauvegarde en cours et l'accord
+        de l'utilisateur pour chaque document modifié (voir ``confirm_close``).
+        """
+        if not self.confirm_close():
+            if event is not None:
+                event.ignore()
+            return
+
+        if self.autosave is not None:
+            for document in self.close_discarded:
+                self.autosave.discard(document)
+        self.close_discarded.clear()
+        if self.session is not None:
+            self.session.save(self.session_state())
+        remove_registry_listener(self.on_notification_types_changed)
+        workers: list[FileIOWorker | None] = [
+            self.io_worker,
+            self.search_worker,
+            *self.index_workers,
+            *self.process_workers,
+        ]
+        # Aucune sauvegarde ne tourne plus ici (attendue par confirm_close) : seules lectures et collage sont annulés
+        self.cancel_io()
+        self.clear_search()
+        for worker in self.index_workers:
+            worker.cancel()
+        for process_worker in self.process_workers:
+            process_worker.cancel()
+        self.process_pool.shutdown()
+        # Workers annulés attendus, et leurs signaux encore en file d'attente abandonnés : la fenêtre
+        # peut être détruite (ramasse-miettes) sans qu'un slot ne soit appelé sur elle ensuite
+        self.thread_pool.waitForDone()
+        for pending in workers:
+            if pending is not None:
+                pending.signals.disconnect_all()
+        if self.usage is not None:
+            self.usage.close()
+        if self.autosave is not None:
+            self.autosave.stop()
+        super().closeEvent(event)
+
+    def confirm_close(self) -> bool:
+        """Vrai si la fenêtre peut se fermer tout de suite
+
+        Une sauvegarde en cours n'est jamais interrompue : la fenêtre se ferme à
+        sa fin. Pour chaque document modifié, l'utilisateur choisit d'enregistrer
+        (fermeture reportée de même), d'abandonner ses modifications ou de
+        garder la fenêtre ouverte.
+        """
+        if isinstance(self.io_worker, FileWriteWorker):
+            self.close_pending = True
+            return False
+
+        for tab in self.tabs:
+            if not (document := tab.document).modified or document in self.close_discarded:
+                continue
+            answer = self.ask_unsaved_changes(document)
+            if answer == QMessageBox.StandardButton.Discard:
+                self.close_discarded.append(document)
+                continue
+            if answer == QMessageBox.StandardButton.Save and (path := document.path or self.ask_save_path()):
+                self.close_pending = not self.is_busy() and self.save_file(path, document)
+                if not self.close_pending:
+                    self.show_notification.emit("Fermeture annulée : une opération est en cours", "warning")
+            # Fermeture annulée : les choix « abandonner » déjà faits ne valent plus
+            if not self.close_pending:
+                self.close_discarded.clear()
+            return False
+        return True
+
+    def ask_open_path(self) -> Path | None:
+        path, _ = QFileDialog.getOpenFileName(self, "Ouvrir un document")
+        return Path(path) if path else None
+
+    def ask_save_path(self) -> Path | None:
+        path, _ = QFileDialog.getSaveFileName(self, "Sauvegarder le document")
+        return Path(path) if path else None
+
+    def ask_unsaved_changes(self, document: Document) -> QMessageBox.StandardButton:
+        """Enregistrer, abandonner ou garder les modifications d'un document à fermer"""
+        buttons = QMessageBox.StandardButton
+        return QMessageBox.question(
+            self,
+            "Modifications non sauvegardées",
+            f"Enregistrer les modifications de {document.name} avant de le fermer ?",
+            buttons.Save | buttons.Discard | buttons.Cancel,
+            buttons.Save,
+        )
+
+    def ask_search_text(self) -> str | None:
+        text, accepted = QInputDialog.getText(self, "Rechercher", "Texte à rechercher :", text=self.search_query)
+        return text if accepted and text else None
+
+    def new_document(self) -> None:
+        self.add_tab(Document())
+
+    def close_document(self, document: Document) -> None:
+        """Ferme un document remplacé ; ses modifications non sauvegardées sont abandonnées"""
+        if self.autosave is not None:
+            self.autosave.discard(document)
+        document.close()
+
+    def set_document(self, document: Document) -> None:
+        """Remplace le document de l'onglet courant"""
+        self.tabs[self.tab_bar.currentIndex()].document = document
+        self.show_document(document)
+
+    def show_document(self, document: Document, position: ViewPosition = (0, 0, 0, 0)) -> None:
+        self.clear_search()
+        self.document = document
+        document.history.set_budget(self.undo_budget)
+        self.document_view.set_document(document, position)
+        self.update_line_count()
+        self.update_history_state()
+        self.update_save_state()
+        self.update_tab_title(document)
+
+    def tab_index(self, document: Document) -> int:
+        """Indice de l'onglet d'un document, -1 s'il n'en a pas"""
+        return next((index for index, tab in enumerate(self.tabs) if tab.document is document), -1)
+
+    def add_tab(self, document: Document) -> int:
+        """Ajoute un onglet pour le document et l'active"""
+        self.tabs.append(DocumentTab(document))
+        index = self.tab_bar.addTab(self.tabs[-1].title)
+        self.tab_bar.setCurrentIndex(index)
+        return index
+
+    def close_tab(self, index: int) -> bool:
+        """Ferme un onglet ; impossible pendant une opération
+
+        Pour un document modifié, l'utilisateur choisit : enregistrer (l'onglet
+        est fermé une fois la sauvegarde réussie), abandonner les modifications
+        et leur sauvegarde automatique, ou garder l'onglet.
+        """
+        if self.is_busy() or not 0 <= index < len(self.tabs):
+            return False
+
+        if (document := self.tabs[index].document).modified:
+            answer = self.ask_unsaved_changes(document)
+            if answer == QMessageBox.StandardButton.Save:
+                path = document.path or self.ask_save_path()
+                return path is not None and self.save_file(path, document, close=True)
+            if answer != QMessageBox.StandardButton.Discard:
+                return False
+        self.drop_tab(index)
+        return True
+
+    def drop_tab(self, index: int) -> None:
+        """Ferme un onglet sans confirmation (un onglet vide le remplace s'il était le dernier)"""
+        if len(self.tabs) == 1:
+            self.add_tab(Document())
+        self.remove_tab(index)
+
+    def remove_tab(self, index: int) -> None:
+        # Retiré de la liste avant la barre : le changement d'onglet qui suit voit déjà la liste à jour
+        tab = self.tabs.pop(index)
+        self.tab_bar.removeTab(index)
+        self.close_document(tab.document)
+
+    def on_tab_changed(self, index: int) -> None:
+        """Affiche le document de l'onglet ; l'onglet quitté ne garde que sa position et libère ses pages"""
+        if not 0 <= index < len(self.tabs) or (tab := self.tabs[index]).document is self.document:
+            return
+
+        if (previous := self.tab_index(self.document)) != -1:
+            self.tabs[previous].position = self.document_view.position()
+            self.document.release()
+        if tab.pending is not None:
+            self.load_tab(tab)
+        self.show_document(tab.document, tab.position)
+
+    def load_tab(self, tab: DocumentTab) -> None:
+        """Ouvre le fichier d'un onglet restauré à sa première activation ; la position est rétablie une fois indexé"""
+        if (path := tab.pending) is None or self.io_worker is not None:
+            return
+
+        try:
+            document = Document.open(path)
+        except OSError as e:
+            # L'onglet reste en attente : nouvel essai à sa prochaine activation
+            self.show_notification.emit(f"Impossible de rouvrir {path.name} : {e}", "error")
+            return
+
+        tab.pending = None
+        tab.document = document
+        worker = LineIndexWorker(path, document.content, document.index)
+        worker.lease = document.lease
+        worker.signals.progress.connect(self.on_document_indexed)
+        worker.signals.finished.connect(partial(self.on_tab_loaded, document, tab.position))
+        self.start_io(worker, "Indexation")
+
+    def on_tab_moved(self, source: int, target: int) -> None:
+        self.tabs.insert(target, self.tabs.pop(source))
+
+    def update_tab_title(self, document: Document) -> None:
+        # Un changement de texte recalcule la disposition de tous les onglets : seulement s'il change
+        if (index := self.tab_index(document)) != -1 and self.tab_bar.tabText(index) != (
+            title := self.tabs[index].title
+        ):
+            self.tab_bar.setTabText(index, title)
+            self.tab_bar.setTabToolTip(index, str(document.path) if document.path is not None else document.name)
+
+    def set_busy(self, busy: bool) -> None:
+        """Progression visible et onglets figés pendant une opération fichier ou un collage"""
+        if busy:
+            self.io_progress_bar.setValue(0)
+            self.io_progress_bar.show()
+        else:
+            self.io_progress_bar.hide()
+        self.tab_bar.setEnabled(not busy)
+
+    def update_line_count(self) -> None:
+        if self.status_updates is not None:
+            self.status_updates.set_text(self.line_count_label, f"Lignes: {self.document.line_count}")
+
+    def history_text(self) -> str:
+        history = self.document.history
+        return f"Historique: {format_size(history.memory)} / {format_size(history.budget)}"
+
+    def update_history_state(self) -> None:
+        """Met à jour les actions Annuler/Rétablir et l'empreinte de l'historique"""
+        self.undo_action.setEnabled(self.document.history.can_undo())
+        self.redo_action.setEnabled(self.document.history.can_redo())
+        if self.status_updates is not None:
+            self.status_updates.set_text(self.history_label, self.history_text())
+
+    def update_save_state(self) -> None:
+        """Sauvegarder n'est proposé que pour un document modifié, hors opération fichier"""
+        self.save_action.setEnabled(self.io_worker is None and self.document.modified)
+
+    def undo(self) -> bool:
+        """Annule la dernière modification du document, retourne False s'il n'y en a pas"""
+        if (command := self.document.undo()) is None:
+            return False
+
+        self.document_view.set_caret(command.offset)
+        self.on_document_edited()
+        return True
+
+    def redo(self) -> bool:
+        """Rétablit la dernière modification annulée, retourne False s'il n'y en a pas"""
+        if (command := self.document.redo()) is None:
+            return False
+
+        self.document_view.set_caret(command.offset)
+        self.on_document_edited()
+        return True
+
+    def open_file(self, path: Path) -> bool:
+        """Projette le fichier en mémoire et l'affiche aussitôt, l'index de lignes est construit en arrière-plan
+
+        Retourne False si l'ouverture n'a pas pu démarrer (opération en cours ou erreur).
+        """
+        if self.io_worker is not None:
+            return False
+
+        try:
+            document = Document.open(path)
+        except OSError as e:
+            self.show_notification.emit(f"Erreur d'entrée/sortie : {e}", "error")
+            return False
+
+        previous = self.document
+        worker = LineIndexWorker(path, document.content, document.index)
+        worker.lease = document.lease
+        worker.signals.progress.connect(self.on_document_indexed)
+        worker.signals.finished.connect(partial(self.on_file_opened, previous, document))
+        worker.signals.failed.connect(partial(self.on_open_aborted, previous, document))
+        worker.signals.cancelled.connect(partial(self.on_open_aborted, previous, document))
+
+        # Premier écran disponible dès les premiers blocs indexés
+        self.add_tab(document)
+        return self.start_io(worker, "Indexation")
+
+    def save_file(self, path: Path, document: Document | None = None, close: bool = False) -> bool:
+        """Lance l'écriture du document (courant par défaut) en arrière-plan
+
+        Avec ``close``, son onglet est fermé une fois la sauvegarde réussie.
+        Retourne False si une opération est en cours.
+        """
+        if self.io_worker is not None:
+            return False
+
+        document = document or self.document
+        # État sauvegardé : les modifications faites pendant l'écriture laisseront le document modifié
+        position = document.history.checkpoint()
+        worker = FileWriteWorker(path, document.chunks(IO_CHUNK_SIZE), document.size)
+        worker.lease = document.lease
+        worker.signals.finished.connect(partial(self.on_file_saved, document, position, close=close))
+        return self.start_io(worker, "Sauvegarde")
+
+    def is_busy(self) -> bool:
+        """Vrai pendant une opération fichier ou un collage en arrière-plan"""
+        return self.io_worker is not None or self.edit_job is not None
+
+    def copy_selection(self) -> bool:
+        """Copie la sélection dans le presse-papier, retourne False sans sélection"""
+        if self.clipboard is None or not self.document_view.has_selection():
+            return False
+
+        start, end = self.document_view.selection()
+        self.clipboard.set_text(self.document.read(start, end).decode("utf-8", errors="replace"))
+        return True
+
+    def cut_selection(self) -> bool:
+        """Copie puis supprime la sélection, retourne False sans sélection"""
+        if not self.copy_selection():
+            return False
+
+        start, end = self.document_view.selection()
+        self.document.delete(start, end)
+        self.document_view.set_caret(start)
+        self.on_document_edited()
+        return True
+
+    def paste_clipboard(self) -> IncrementalInsert | None:
+        """Remplace la sélection par le texte du presse-papier
+
+        Les gros contenus sont insérés par blocs sans bloquer la boucle
+        d'événements ; le collage en cours est alors dans ``edit_job``. Seule
+        la lecture du presse-papier reste d'un seul tenant, sur le thread GUI :
+        environ 30 ms pour 20 Mo de texte (voir ``ClipboardMonitor.data``).
+        """
+        if self.clipboard is None or not (data := self.clipboard.data()):
+            return None
+
+        # Le texte collé remplace la sélection : une seule entrée dans l'historique
+        start, end = self.document_view.selection()
+        self.document.delete(start, end)
+
+        job = IncrementalInsert(self.document, start, data, merge=start != end, parent=self)
+        job.progress.connect(self.on_paste_progress)
+        job.finished.connect(partial(self.on_paste_finished, job))
+        job.cancelled.connect(partial(self.on_paste_cancelled, job))
+        job.start()
+
+        if job.is_running():
+            self.edit_job = job
+            self.set_busy(True)
+        return job
+
+    def toggle_selection_style(self, style: TextStyle) -> bool | None:
+        """Bascule un style sur la sélection et retourne son nouvel état, None sans sélection"""
+        if not self.document_view.has_selection():
+            return None
+
+        enabled = self.document.toggle_style(*self.document_view.selection(), style)
+        self.document_view.refresh()
+        self.on_document_modified()
+        return enabled
+
+    def on_paste_progress(self, done: int, total: int) -> None:
+        self.on_document_edited()
+        if self.edit_job is not None:
+            self.on_io_progress("Collage", done, total)
+
+    def on_paste_finished(self, job: IncrementalInsert) -> None:
+        self.document_view.set_caret(job.offset + job.inserted)
+        if self.edit_job is job:
+            self.edit_job = None
+            self.set_busy(False)
+            self.show_notification.emit("Contenu collé avec succès", "success")
+            self.show_status_message("Collage terminé", 2000)
+
+    def on_paste_cancelled(self, job: IncrementalInsert) -> None:
+        self.edit_job = None
+        self.set_busy(False)
+        self.document_view.set_caret(job.offset)
+        self.on_document_edited()
+        self.show_notification.emit("Collage annulé", "warning")
+
+    def on_document_edited(self) -> None:
+        self.document_view.document_changed()
+        self.update_line_count()
+        self.on_document_modified()
+
+    def on_document_modified(self) -> None:
+        """Historique, état de sauvegarde et sauvegarde automatique après une modification du texte ou des styles"""
+        self.update_history_state()
+        self.update_save_state()
+        self.update_tab_title(self.document)
+        # Positions des occurrences périmées : la prochaine recherche repart du texte modifié
+        self.clear_search()
+        if self.autosave is not None:
+            self.autosave.schedule(self.document)
+
+    def start_io(self, worker: FileIOWorker, label: str) -> bool:
+        if self.io_worker is not None:
+            return False
+
+        self.io_worker = worker
+        self.io_save_enabled = self.save_action.isEnabled()
+        self.save_action.setEnabled(False)
+
+        worker.signals.progress.connect(partial(self.on_io_progress, label))
+        worker.signals.failed.connect(self.on_io_failed)
+        worker.signals.cancelled.connect(self.on_io_cancelled)
+        self.set_busy(True)
+        self.thread_pool.start(worker)
+        return True
+
+    def cancel_io(self) -> bool:
+        """Demande l'annulation de l'opération en cours"""
+        if self.edit_job is not None:
+            self.edit_job.cancel()
+            return True
+
+        if self.io_worker is None:
+            return False
+
+        self.io_worker.cancel()
+        return True
+
+    def finish_io(self) -> None:
+        self.io_worker = None
+        self.set_busy(False)
+
+    def on_io_progress(self, label: str, done: int, total: int) -> None:
+        percent = done * 100 // total if total else 100
+        self.io_progress_bar.setValue(percent)
+        self.show_status_message(f"{label} : {percent}%")
+
+    def on_document_indexed(self) -> None:
+        self.document_view.document_changed()
+        self.update_line_count()
+
+    def on_file_opened(self, previous: Document, document: Document) -> None:
+        self.finish_io()
+        # Le document vide de départ est remplacé plutôt que gardé dans un onglet
+        if (index := self.tab_index(previous)) != -1 and self.tabs[index].is_pristine():
+            self.remove_tab(index)
+        self.on_document_loaded(document)
+        self.show_notification.emit("Document ouvert avec succès", "success")
+
+    def on_tab_loaded(self, document: Document, position: ViewPosition) -> None:
+        self.finish_io()
+        # Position de la session rétablie si la vue n'a pas bougé pendant l'indexation
+        if document is self.document and self.document_view.position()[:2] == position[:2]:
+            self.document_view.set_document(document, position)
+        self.on_document_loaded(document)
+
+    def on_document_loaded(self, document: Document) -> None:
+        self.on_document_indexed()
+        self.update_save_state()
+        self.index_document(document)
+        self.show_status_message(f"{document.name} ouvert ({document.line_count} lignes)", 2000)
+
+    def on_open_aborted(self, previous: Document, document: Document) -> None:
+        """Ferme l'onglet ouvert et revient au document précédent si l'ouverture échoue ou est annulée"""
+        if (index := self.tab_index(document)) != -1:
+            self.remove_tab(index)
+        if (index := self.tab_index(previous)) != -1:
+            self.tab_bar.setCurrentIndex(index)
+
+    def on_file_saved(self, document: Document, position: int, path: Path, close: bool = False) -> None:
+        self.finish_io()
+        document.path = path
+        document.history.set_clean(position)
+        self.update_save_state()
+        self.update_tab_title(document)
+        if self.autosave is not None and not document.modified:
+            self.autosave.discard(document)
+        self.show_notification.emit("Document sauvegardé avec succès", "success")
+        self.show_status_message(f"{path.name} sauvegardé", 2000)
+        if close and not document.modified and (index := self.tab_index(document)) != -1:
+            self.drop_tab(index)
+        if self.close_pending:
+            self.close_pending = False
+            self.close()
+
+    def on_io_failed(self, message: str) -> None:
+        self.finish_io()
+        # Sauvegarde échouée : la fenêtre reste ouverte, sans rien perdre
+        self.close_pending = False
+        self.close_discarded.clear()
+        self.save_action.setEnabled(self.io_save_enabled)
+        self.show_notification.emit(f"Erreur d'entrée/sortie : {message}", "error")
+
+    def on_io_cancelled(self) -> None:
+        self.finish_io()
+        self.close_pending = False
+        self.close_discarded.clear()
+        self.save_action.setEnabled(self.io_save_enabled)
+        self.show_notification.emit("Opération annulée", "warning")
+        self.show_status_message("Opération annulée", 2000)
+
+    def session_state(self) -> SessionState:
+        """État à restaurer au prochain lancement : fenêtre, options et onglets ouverts depuis un fichier"""
+        if (index := self.tab_index(self.document)) != -1:
+            self.tabs[index].position = self.document_view.position()
+
+        documents: list[tuple[Path, ViewPosition]] = []
+        current = 0
+        for index, tab in enumerate(self.tabs):
+            if (path := tab.path) is None:
+                continue
+            if index == self.tab_bar.currentIndex():
+                current = len(documents)
+            documents.append((path, tab.position))
+
+        return SessionState(
+            geometry=bytes(self.saveGeometry().data()),
+            theme=self.theme_manager.current_theme or "light",
+            toolbar_visible=self.toolbar_view_action.isChecked(),
+            statusbar_visible=self.statusbar_view_action.isChecked(),
+            bold=self.is_bold,
+            italic=self.is_italic,
+            action_counter=self.action_counter,
+            documents=documents,
+            current=current,
+        )
+
+    def restore_session(self, state: SessionState) -> None:
+        """Rétablit la session précédente avant le premier affichage
+
+        Seul l'onglet courant est rouvert ; les autres ne le sont qu'à leur
+        première activation.
+        """
+        if state.geometry:
+            self.restoreGeometry(QByteArray(state.geometry))
+        if self.toolbar is not None:
+            self.toolbar.setVisible(state.toolbar_visible)
+        self.toolbar_view_action.setChecked(state.toolbar_visible)
         if (status_bar := self.statusBar()) is not None:
-            status_bar.showMessage(f"Compteur remis à zéro (était: {previous_count})", 2000)
+            status_bar.setVisible(state.statusbar_visible)
+        self.statusbar_view_action.setChecked(state.statusbar_visible)
+
+        self.is_bold = state.bold
+        self.is_italic = state.italic
+        self.bold_action.setChecked(state.bold)
+        self.italic_action.setChecked(state.italic)
+        self.action_counter = state.action_counter
+        if self.status_updates is not None:
+            self.status_updates.set_text(self.action_counter_label, f"Actions: {self.action_counter}")
+
+        if not state.documents:
+            return
+        for path, position in state.documents:
+            tab = DocumentTab(Document(), pending=path)
+            tab.position = position
+            self.tabs.append(tab)
+            self.tab_bar.addTab(tab.title)
+        # L'onglet vide de départ est remplacé par les onglets restaurés
+        self.tab_bar.setCurrentIndex(1 + state.current)
+        self.remove_tab(0)
+
+    def index_document(self, document: Document) -> None:
+        """Construit l'index de recherche du contenu d'origine en arrière-plan (arrêté à la fermeture du document)"""
+        if document.search_index.complete or document.path is None:
+            return
 
-        # Communication bidirectionnelle : affecter le comportement de l'application
-        # Par exemple, remettre à zéro certains états
-        self.content_to_copy = False
-        self.content_to_cut = False
+        worker = SearchIndexWorker(document.path, document.search_index)
+        worker.lease = document.lease
+        for signal in (worker.signals.finished, worker.signals.failed, worker.signals.cancelled):
+            signal.connect(partial(self.on_index_worker_done, worker))
+        self.index_workers.append(worker)
+        self.thread_pool.start(worker)
+
+    def on_index_worker_done(self, worker: SearchIndexWorker, *_args: object) -> None:
+        if worker in self.index_workers:
+            self.index_workers.remove(worker)
+
+    def find_text(self, query: str) -> bool:
+        """Recherche ``query`` dans le document courant en arrière-plan, retourne False pour une requête vide
+
+        Les occurrences arrivent par lots : la première à partir du curseur
+        est sélectionnée dès qu'elle est trouvée.
+        """
+        self.clear_search()
+        if not query:
+            return False
+
+        self.search_query = query
+        worker = SearchWorker(
+            self.document.path or Path(self.document.name), self.document.search_index, query.encode("utf-8")
+        )
+        worker.lease = self.document.lease
+        worker.signals.found.connect(partial(self.on_search_found, worker))
+        worker.signals.finished.connect(partial(self.on_search_finished, worker))
+        worker.signals.failed.connect(partial(self.on_search_failed, worker))
+        self.search_worker = worker
+        self.thread_pool.start(worker)
+        return True
 
-        # Mettre à jour l'état permanent
-        self.status_label_permanent.setText("État: Compteur remis à zéro")
+    def find_next(self) -> int | None:
+        """Sélectionne l'occurrence qui suit la sélection (la première après la dernière)
+
+        Retourne son rang parmi les occurrences déjà trouvées, None s'il n'y en a pas.
+        """
+        if not self.search_results:
+            return None
+
+        start, _ = self.document_view.selection()
+        index = bisect_left(self.search_results, start + 1) % len(self.search_results)
+        self.select_search_result(index)
+        return index
+
+    def select_search_result(self, index: int) -> None:
+        offset = self.search_results[index]
+        self.search_selected = True
+        self.document_view.set_selection(offset, offset + len(self.search_query.encode("utf-8")))
+        self.document_view.scroll_to(offset)
+
+    def clear_search(self) -> None:
+        """Abandonne la recherche en cours et ses occurrences (la requête est gardée pour « Suivant »)"""
+        if self.search_worker is not None:
+            self.search_worker.cancel()
+            self.search_worker = None
+        self.search_results = []
+        self.search_selected = False
+
+    def on_search_found(self, worker: SearchWorker, matches: list[int]) -> None:
+        if worker is not self.search_worker:
+            return
+
+        first = len(self.search_results)
+        self.search_results.extend(matches)
+        # Première occurrence à partir du curseur, dès qu'elle est reçue
+        start, _ = self.document_view.selection()
+        if not self.search_selected and (index := bisect_left(self.search_results, start, first)) < len(
+            self.search_results
+        ):
+            self.select_search_result(index)
+        self.show_status_message(f"Recherche de « {self.search_query} » : {len(self.search_results)} occurrences…")
+
+    def on_search_finished(self, worker: SearchWorker, count: int) -> None:
+        if worker is not self.search_worker:
+            return
+
+        self.search_worker = None
+        if not count:
+            self.show_notification.emit(f"Aucune occurrence de « {self.search_query} »", "warning")
+            self.show_status_message("Aucune occurrence", 2000)
+            return
+
+        if not self.search_selected:
+            self.select_search_result(0)
+        self.show_notification.emit(f"{count} occurrence(s) de « {self.search_query} »", "info")
+        self.show_status_message(f"Recherche de « {self.search_query} » : {count} occurrences", 3000)
 
-    def display_notification(
+    def on_search_failed(self, worker: SearchWorker, message: str) -> None:
+        if worker is self.search_worker:
+            self.search_worker = None
+            self.show_notification.emit(f"Erreur de recherche : {message}", "error")
+
+    def run_process_task(
         self,
-        message: str,
-        notification_type: Literal["info", "success", "warning", "error"],
-    ) -> None:
-        """Affiche une notification colorée dans la barre de statut"""
-        if (status_bar := self.statusBar()) is None:
+        label: str,
+        task: ProcessTask,
+        combine: Callable[[list[Any]], object],
+        report: Callable[[Any], str],
+        *args: object,
+    ) -> ProcessTaskWorker:
+        """Applique ``task`` au texte du document courant dans le pool de processus
+
+        L'édition reste possible pendant le traitement, qui porte sur le texte
+        au lancement ; ``report`` met en forme le résultat, notifié et affiché
+        dans la barre de statut.
+        """
+        document = self.document
+        worker = ProcessTaskWorker(
+            document.path or Path(document.name),
+            self.process_pool,
+            document.chunks(IO_CHUNK_SIZE),
+            document.size,
+            task,
+            combine,
+            args,
+        )
+        worker.lease = document.lease
+        worker.signals.progress.connect(partial(self.on_process_progress, label))
+        worker.signals.finished.connect(partial(self.on_process_finished, worker, report))
+        worker.signals.failed.connect(partial(self.on_process_failed, worker, label))
+        worker.signals.cancelled.connect(partial(self.on_process_done, worker))
+        self.process_workers.append(worker)
+        self.thread_pool.start(worker)
+        return worker
+
+    def compute_statistics(self) -> ProcessTaskWorker:
+        return self.run_process_task("Statistiques", text_statistics, merge_statistics, self.statistics_text)
+
+    @staticmethod
+    def statistics_text(statistics: TextStatistics) -> str:
+        return (
+            f"{statistics.line_feeds + 1} lignes, {statistics.words} mots, "
+            f"{statistics.characters} caractères ({format_size(statistics.size)})"
+        )
+
+    def on_process_progress(self, label: str, done: int, total: int) -> None:
+        percent = done * 100 // total if total else 100
+        self.show_status_message(f"{label} : {percent}%")
+
+    def on_process_finished(self, worker: ProcessTaskWorker, report: Callable[[Any], str], result: object) -> None:
+        self.on_process_done(worker)
+        message = report(result)
+        self.show_notification.emit(message, "success")
+        self.show_status_message(message, 5000)
+
+    def on_process_failed(self, worker: ProcessTaskWorker, label: str, message: str) -> None:
+        self.on_process_done(worker)
+        self.show_notification.emit(f"{label} : échec ({message})", "error")
+
+    def on_process_done(self, worker: ProcessTaskWorker) -> None:
+        if worker in self.process_workers:
+            self.process_workers.remove(worker)
+
+    def on_notification_types_changed(self) -> None:
+        self.theme_manager.refresh(self)
+
+    def setup_notifications(self) -> None:
+        """Crée le pool de notifications et le planificateur (une seule fois)"""
+        if self.notification_scheduler is not None:
             return
 
-        # Définir les styles pour chaque type de notification avec !important pour écraser le CSS global
-        styles: dict[Literal["info", "success", "warning", "error"], str] = {
-            "info": """
-                QLabel {
-                    background-color: #e3f2fd !important;
-                    color: #1565c0 !important;
-                    border: 2px solid #90caf9 !important;
-                    padding: 8px 12px !important;
-                    border-radius: 4px !important;
-                    font-weight: bold !important;
-                    margin: 2px !important;
-                }
-            """,
-            "success": """
-                QLabel {
-                    background-color: #e8f5e8 !important;
-                    color: #2e7d32 !important;
-                    border: 2px solid #81c784 !important;
-                    padding: 8px 12px !important;
-                    border-radius: 4px !important;
-                    font-weight: bold !important;
-                    margin: 2px !important;
-                }
-            """,
-            "warning": """
-                QLabel {
-                    background-color: #fff8e1 !important;
-                    color: #f57c00 !important;
-                    border: 2px solid #ffb74d !important;
-                    padding: 8px 12px !important;
-                    border-radius: 4px !important;
-                    font-weight: bold !important;
-                    margin: 2px !important;
-                }
-            """,
-            "error": """
-                QLabel {
-                    background-color: #ffebee !important;
-                    color: #c62828 !important;
-                    border: 2px solid #e57373 !important;
-                    padding: 8px 12px !important;
-                    border-radius: 4px !important;
-                    font-weight: bold !important;
-                    margin: 2px !important;
-                }
-            """,
-        }
-
-        # Créer le widget de notification
-        notification_label = QLabel(message)
-        notification_label.setStyleSheet(styles[notification_type])
-        notification_label.setMaximumWidth(250)
-        notification_label.setMinimumWidth(150)
-        notification_label.setWordWrap(True)
-
-        # Propriétés pour forcer la visibilité
-        notification_label.setVisible(True)
-        notification_label.setAttribute(Qt.WidgetAttribute.WA_ForceUpdatesDisabled, False)
-        notification_label.setEnabled(True)
-
-        # Insérer au début de la barre de statut (index 0) pour être sûr qu'elle soit visible
-        status_bar.insertWidget(0, notification_label)
-
-        # Forcer l'affichage
-        notification_label.show()
-        notification_label.repaint()
-        status_bar.repaint()
-
-        # Ajouter à la liste des widgets actifs
-        self.notification_widgets.append(notification_label)
-
-        # Créer un timer pour l'auto-suppression
-        timer = QTimer()
-        timer.setSingleShot(True)
-        timer.timeout.connect(lambda: self.remove_notification(notification_label, timer))
-
-        # Durée basée sur le type de notification
-        durations: dict[Literal["info", "success", "warning", "error"], int] = {
-            "info": 3000,  # 3 secondes
-            "success": 2500,  # 2.5 secondes
-            "warning": 4000,  # 4 secondes
-            "error": 5000,  # 5 secondes
-        }
-
-        timer.start(durations[notification_type])
-        self.notification_timers.append(timer)
-
-    def remove_notification(self, notification_widget: QLabel, timer: QTimer | None) -> None:
-        """Supprime une notification de la barre de statut"""
-        try:
-            # Cacher d'abord le widget
-            notification_widget.hide()
+        if (status_bar := self.statusBar()) is None:
+            return
 
-            # Supprimer de la barre de statut
-            if (status_bar := self.statusBar()) is not None:
-                status_bar.removeWidget(notification_widget)
-                status_bar.repaint()
+        self.notification_pool = NotificationPool(status_bar, self.notification_pool_size, self.notification_policy)
+        self.notification_scheduler = NotificationScheduler(self.notification_pool, self.display_notification)
 
-            # Supprimer le widget
-            notification_widget.deleteLater()
+    def submit_notification(self, message: str, notification_type: NotificationType) -> None:
+        """Transmet une notification au planificateur qui fusionne les répétitions"""
+        self.setup_notifications()
+        if self.notification_scheduler is not None:
+            self.notification_scheduler.submit(message, notification_type)
 
-            # Nettoyer les listes
-            if notification_widget in self.notification_widgets:
-                self.notification_widgets.remove(notification_widget)
-            if timer is not None and timer in self.notification_timers:
-                self.notification_timers.remove(timer)
+    def display_notification(self, message: str, notification_type: NotificationType) -> None:
+        """Affiche une notification colorée dans la barre de statut"""
+        if self.notification_pool is None:
+            return
 
-        except Exception as e:
-            # Gestion d'erreur silencieuse pour éviter les crashes
-            print(f"Erreur lors de la suppression de la notification: {e}")
+        self.notification_pool.show(message, notification_type)
 
     def clear_all_notifications(self) -> None:
         """Supprime toutes les notifications actives"""
-        # Arrêter tous les timers
-        for timer in self.notification_timers.copy():
-            timer.stop()
-
-        # Supprimer tous les widgets
-        for widget in self.notification_widgets.copy():
-            self.remove_notification(widget, None)
+        if self.notification_pool is not None:
+            self.notification_pool.clear()
 
     def setup_context_menu(self) -> None:
         """Configure les menus contextuels"""
+        # Menus construits à la première ouverture puis réutilisés
+        self.toolbar_context_menu: QMenu | None = None
+        self.edit_context_menu: QMenu | None = None
+
         # Activer les menus contextuels
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.customContextMenuRequested.connect(self.show_context_menu)
 
     def setup_shortcuts(self) -> None:
         """Configure les raccourcis clavier globaux"""
-        # Les raccourcis sont déjà définis dans create_actions()
-        # On ajoute les actions à la fenêtre pour qu'elles soient globales
-        self.addAction(self.copy_action)
-        self.addAction(self.cut_action)
-        self.addAction(self.paste_action)
-        self.addAction(self.new_action)
-        self.addAction(self.open_action)
-        self.addAction(self.save_action)
-        self.addAction(self.quit_action)
+        # On ajoute les actions avec raccourci à la fenêtre pour qu'elles soient globales
+        for spec in ACTIONS.values():
+            if spec.shortcut is not None:
+                self.addAction(self.actions_by_name[spec.name])
 
     def show_context_menu(self, position: QPoint) -> None:
         """Affiche le menu contextuel"""
         widget_clicked = self.childAt(position)
-        context_menu = QMenu(self)
 
         if widget_clicked == self.toolbar:
-            # === AFFICHAGE === (actions les plus courantes)
-            context_menu.addAction("Masquer la barre d'outils")
+            context_menu = self.get_toolbar_context_menu()
+        else:
+            context_menu = self.get_edit_context_menu()
 
-            context_menu.addSeparator()
+        # Afficher le menu à la position du clic
+        context_menu.popup(self.mapToGlobal(position))
 
-            # === PERSONNALISATION ===
-            context_menu.addAction("Personnaliser la barre d'outils")
-            context_menu.addAction("Réinitialiser la barre d'outils")
-        else:
-            # === ÉDITION === (actions les plus courantes)
-            context_menu.addAction(self.copy_action)
-            context_menu.addAction(self.cut_action)
-            context_menu.addSeparator()
+    def get_toolbar_context_menu(self) -> QMenu:
+        """Retourne le menu contextuel de la barre d'outils, construit une seule fois"""
+        if self.toolbar_context_menu is None:
+            self.toolbar_context_menu = QMenu(self)
 
-            # === COLLAGE ===
-            # Mettre à jour l'état de paste_action avant de l'afficher
-            self.paste_action.setEnabled(self.has_clipboard_content())
-            context_menu.addAction(self.paste_action)
+            # === AFFICHAGE === (actions les plus courantes)
+            self.toolbar_context_menu.addAction("Masquer la barre d'outils")
 
-            context_menu.addSeparator()
+            self.toolbar_context_menu.addSeparator()
 
-            # === FORMAT ===
-            if (format_menu := context_menu.addMenu("Format")) is None:
-                return
+            # === PERSONNALISATION ===
+            self.toolbar_context_menu.addAction("Personnaliser la barre d'outils")
+            self.toolbar_context_menu.addAction("Réinitialiser la barre d'outils")
 
-            # Action Gras - checkable
-            action_gras = QAction("Gras", self)
-            action_gras.setCheckable(True)
-            action_gras.setChecked(self.is_bold)
-            action_gras.triggered.connect(self.toggle_bold)
-            format_menu.addAction(action_gras)
+        return self.toolbar_context_menu
 
-            # Action Italique - checkable
-            action_italique = QAction("Italique", self)
-            action_italique.setCheckable(True)
-            action_italique.setChecked(self.is_italic)
-            action_italique.triggered.connect(self.toggle_italic)
-            format_menu.addAction(action_italique)
+    def get_edit_context_menu(self) -> QMenu:
+        """Retourne le menu contextuel d'édition, construit une seule fois puis rafraîchi"""
+        if self.edit_context_menu is None:
+            self.edit_context_menu = QMenu(self)
 
-            format_menu.addAction("Couleur du texte")
+            # === ÉDITION === (actions les plus courantes)
+            self.edit_context_menu.addAction(self.undo_action)
+            self.edit_context_menu.addAction(self.redo_action)
+            self.edit_context_menu.addSeparator()
+            self.edit_context_menu.addAction(self.copy_action)
+            self.edit_context_menu.addAction(self.cut_action)
+            self.edit_context_menu.addSeparator()
 
-        # Afficher le menu à la position du clic
-        context_menu.exec(self.mapToGlobal(position))
+            # === COLLAGE ===
+            self.edit_context_menu.addAction(self.paste_action)
 
-    def copy_content(self) -> None:
-        """Gestionnaire copier"""
-        self.increment_action_counter("Copier")
-        self.content_to_copy = True
-        self.show_notification.emit("Contenu copié dans le presse-papier", "success")
-        if (status_bar := self.statusBar()) is not None:
-            status_bar.showMessage("Contenu copié", 2000)
+            self.edit_context_menu.addSeparator()
 
-    def paste_content(self) -> None:
-        """Gestionnaire coller"""
-        self.increment_action_counter("Coller")
-        if self.content_to_cut is True:
-            self.content_to_cut = False
+            # === FORMAT ===
+            if (format_menu := self.edit_context_menu.addMenu("Format")) is not None:
+                format_menu.addAction(self.bold_action)
+                format_menu.addAction(self.italic_action)
+                format_menu.addAction("Couleur du texte")
 
-        if self.has_clipboard_content():
-            message = "Contenu collé avec succès"
-            self.show_notification.emit(message, "success")
-        else:
-            message = "Aucun contenu à coller"
-            self.show_notification.emit(message, "warning")
+        # Rafraîchir uniquement les états avant l'affichage (Coller suit le presse-papier)
+        self.bold_action.setChecked(self.is_bold)
+        self.italic_action.setChecked(self.is_italic)
 
-        if (status_bar := self.statusBar()) is not None:
-            status_bar.showMessage(message, 2000)
-
-    def cut_content(self) -> None:
-        """Gestionnaire couper"""
-        self.increment_action_counter("Couper")
-        self.content_to_cut = True
-        self.content_to_copy = False
-        self.show_notification.emit("Contenu coupé et placé dans le presse-papier", "success")
-        if (status_bar := self.statusBar()) is not None:
-            status_bar.showMessage("Contenu coupé", 2000)
+        return self.edit_context_menu
 
     def has_text_selected(self) -> bool:
         """Vérifie si du texte est sélectionné"""
-        return True
+        return self.document_view.has_selection()
 
     def has_clipboard_content(self) -> bool:
-        """Vérifie si le presse-papier contient du contenu"""
-        return self.content_to_copy or self.content_to_cut
-
-    def toggle_bold(self) -> None:
-        """Bascule l'état gras du texte"""
-        self.is_bold = not self.is_bold
-
-        action_name = "Activer gras" if self.is_bold else "Désactiver gras"
-        self.increment_action_counter(action_name)
-
-        # Notification de formatage
-        message = "Formatage gras activé" if self.is_bold else "Formatage gras désactivé"
-        self.show_notification.emit(message, "info")
-
-        if (status_bar := self.statusBar()) is not None:
-            status_bar.showMessage(message, 2000)
-
-    def toggle_italic(self) -> None:
-        """Bascule l'état italique du texte"""
-        self.is_italic = not self.is_italic
-
-        action_name = "Activer italique" if self.is_italic else "Désactiver italique"
-        self.increment_action_counter(action_name)
-
-        # Notification de formatage
-        message = "Formatage italique activé" if self.is_italic else "Formatage italique désactivé"
-        self.show_notification.emit(message, "info")
-
-        if (status_bar := self.statusBar()) is not None:
-            status_bar.showMessage(message, 2000)
+        """Vérifie si le presse-papier contient du texte (état mis en cache, sans requête)"""
+        return self.clipboard is not None and self.clipboard.has_text
@@ -0,0 +1,301 @@
+import weakref
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from functools import partial
+from typing import Literal
+
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QLabel, QStatusBar
+
+from src.instrumentation import PaintEventCounter
+
+NotificationType = str
+PoolPolicy = Literal["drop_oldest", "coalesce", "queue"]
+
+# Nom de la propriété dynamique portée par les labels de notification
+NOTIFICATION_PROPERTY = "notificationType"
+
+
+class NotificationStyle:
+    """Description d'un type de notification : couleurs, durée d'affichage et priorité"""
+
+    def __init__(
+        self,
+        name: NotificationType,
+        background_color: str,
+        color: str,
+        border_color: str,
+        duration: int,
+        priority: int,
+    ) -> None:
+        self.name = name
+        self.background_color = background_color
+        self.color = color
+        self.border_color = border_color
+        self.duration = duration
+        self.priority = priority
+
+    def stylesheet_rule(self) -> str:
+        """Règle CSS ciblant les labels dont la propriété dynamique vaut ce type"""
+        return f"""
+QLabel[{NOTIFICATION_PROPERTY}="{self.name}"] {{
+    background-color: {self.background_color};
+    color: {self.color};
+    border: 2px solid {self.border_color};
+    padding: 8px 12px;
+    border-radius: 4px;
+    font-weight: bold;
+    margin: 2px;
+}}
+"""
+
+
+# Registre des types de notification, construit une seule fois à l'import
+NOTIFICATION_TYPES: dict[NotificationType, NotificationStyle] = {}
+_stylesheet_cache: str | None = None
+# Appelés quand le registre change (fenêtres à restyler), gardés par référence faible
+_registry_listeners: list[weakref.WeakMethod[Callable[[], None]]] = []
+
+
+def add_registry_listener(callback: Callable[[], None]) -> None:
+    """Appelle la méthode ``callback`` à chaque ajout, remplacement ou retrait d'un type"""
+    _registry_listeners.append(weakref.WeakMethod(callback))
+
+
+def remove_registry_listener(callback: Callable[[], None]) -> None:
+    _registry_listeners[:] = [listener for listener in _registry_listeners if listener() not in (None, callback)]
+
+
+def _registry_changed() -> None:
+    global _stylesheet_cache
+
+    _stylesheet_cache = None
+    # Copie : un abonné peut se désabonner pendant la notification
+    callbacks = [callback for listener in _registry_listeners if (callback := listener()) is not None]
+    for callback in callbacks:
+        callback()
+
+
+def register_notification_type(
+    name: NotificationType,
+    background_color: str,
+    color: str,
+    border_color: str,
+    duration: int,
+    priority: int = 0,
+) -> NotificationStyle:
+    """Enregistre (ou remplace) un type de notification ; les fenêtres abonnées sont restylées"""
+    style = NotificationStyle(name, background_color, color, border_color, duration, priority)
+    NOTIFICATION_TYPES[name] = style
+    _registry_changed()
+    return style
+
+
+def unregister_notification_type(name: NotificationType) -> None:
+    """Retire un type de notification du registre"""
+    if NOTIFICATION_TYPES.pop(name, None) is not None:
+        _registry_changed()
+
+
+def notification_stylesheet() -> str:
+    """Règles CSS de tous les types enregistrés, à ajouter à la feuille de style globale"""
+    global _stylesheet_cache
+
+    if _stylesheet_cache is None:
+        _stylesheet_cache = "".join(style.stylesheet_rule() for style in NOTIFICATION_TYPES.values())
+    return _stylesheet_cache
+
+
+register_notification_type("info", "#e3f2fd", "#1565c0", "#90caf9", duration=3000, priority=0)
+register_notification_type("success", "#e8f5e8", "#2e7d32", "#81c784", duration=2500, priority=1)
+register_notification_type("warning", "#fff8e1", "#f57c00", "#ffb74d", duration=4000, priority=2)
+register_notification_type("error", "#ffebee", "#c62828", "#e57373", duration=5000, priority=3)
+
+
+class NotificationSlot:
+    """Emplacement réutilisable : un label et son timer d'expiration"""
+
+    def __init__(self, label: QLabel, timer: QTimer) -> None:
+        self.label = label
+        self.timer = timer
+        self.message = ""
+        self.notification_type: NotificationType | None = None
+
+
+class NotificationPool:
+    """Pool de taille fixe de labels de notification recyclés dans la barre de statut
+
+    Quand tous les emplacements sont occupés, la politique choisie s'applique :
+    - ``drop_oldest`` : la plus ancienne des notifications de plus faible priorité est remplacée
+    - ``coalesce`` : une notification identique déjà visible est prolongée,
+      sinon on procède comme pour ``drop_oldest``
+    - ``queue`` : la notification attend qu'un emplacement se libère
+    """
+
+    def __init__(self, status_bar: QStatusBar, size: int = 5, policy: PoolPolicy = "drop_oldest") -> None:
+        if size < 1:
+            raise ValueError(f"La taille du pool doit être positive (reçu: {size})")
+
+        self.status_bar = status_bar
+        self.policy: PoolPolicy = policy
+        self.slots: list[NotificationSlot] = []
+        self.free_slots: deque[NotificationSlot] = deque()
+        # Emplacements visibles, du plus ancien au plus récent
+        self.active_slots: OrderedDict[int, NotificationSlot] = OrderedDict()
+        self.pending: deque[tuple[str, NotificationType]] = deque()
+        # Nombre de notifications affichées (instrumentation)
+        self.shown_count = 0
+
+        # Mise à jour différée et unique de la barre de statut par tour de boucle d'événements
+        self.update_timer = QTimer(status_bar)
+        self.update_timer.setSingleShot(True)
+        self.update_timer.setInterval(0)
+        self.update_timer.timeout.connect(status_bar.update)
+
+        for _ in range(size):
+            label = QLabel()
+            label.setMaximumWidth(250)
+            label.setMinimumWidth(150)
+            label.setWordWrap(True)
+            label.hide()
+            status_bar.insertWidget(0, label)
+
+            timer = QTimer(label)
+            timer.setSingleShot(True)
+            slot = NotificationSlot(label, timer)
+            timer.timeout.connect(partial(self.release, slot))
+
+            self.slots.append(slot)
+            self.free_slots.append(slot)
+
+    def show(self, message: str, notification_type: NotificationType) -> None:
+        """Affiche une notification dans un emplacement libre ou selon la politique du pool"""
+        if self.free_slots:
+            self._fill(self.free_slots.popleft(), message, notification_type)
+            return
+
+        if self.policy == "queue":
+            self.pending.append((message, notification_type))
+            return
+
+        if self.policy == "coalesce":
+            for slot in self.active_slots.values():
+                if slot.message == message and slot.notification_type == notification_type:
+                    self._fill(slot, message, notification_type)
+                    return
+
+        # Remplacer la plus ancienne notification parmi celles de plus faible priorité
+        slot = min(self.active_slots.values(), key=lambda active: self._style(active.notification_type).priority)
+        self.active_slots.pop(id(slot))
+        self._fill(slot, message, notification_type)
+
+    def release(self, slot: NotificationSlot) -> None:
+        """Libère un emplacement et affiche la prochaine notification en attente"""
+        slot.timer.stop()
+        if self.active_slots.pop(id(slot), None) is None:
+            return
+
+        if self.pending:
+            message, notification_type = self.pending.popleft()
+            self._fill(slot, message, notification_type)
+            return
+
+        slot.label.hide()
+        slot.message = ""
+        self.free_slots.append(slot)
+        self._schedule_update()
+
+    def clear(self) -> None:
+        """Masque toutes les notifications et vide la file d'attente"""
+        self.pending.clear()
+        for slot in list(self.active_slots.values()):
+            self.release(slot)
+
+    def visible_count(self) -> int:
+        return len(self.active_slots)
+
+    def latest(self) -> NotificationSlot | None:
+        """Retourne l'emplacement affiché le plus récemment"""
+        if not self.active_slots:
+            return None
+        return next(reversed(self.active_slots.values()))
+
+    def update(self, slot: NotificationSlot, message: str) -> None:
+        """Change le texte d'une notification visible et relance son timer"""
+        if id(slot) not in self.active_slots:
+            return
+
+        slot.message = message
+        slot.label.setText(message)
+        self.active_slots.move_to_end(id(slot))
+        slot.timer.start(self._style(slot.notification_type).duration)
+
+    @staticmethod
+    def _style(notification_type: NotificationType | None) -> NotificationStyle:
+        if notification_type is None or notification_type not in NOTIFICATION_TYPES:
+            return NOTIFICATION_TYPES["info"]
+        return NOTIFICATION_TYPES[notification_type]
+
+    def _fill(self, slot: NotificationSlot, message: str, notification_type: NotificationType) -> None:
+        style = self._style(notification_type)
+
+        # Seule la propriété dynamique change : les règles sont déjà dans la feuille de style globale
+        if slot.notification_type != style.name:
+            slot.label.setProperty(NOTIFICATION_PROPERTY, style.name)
+            if (widget_style := slot.label.style()) is not None:
+                widget_style.unpolish(slot.label)
+                widget_style.polish(slot.label)
+            slot.notification_type = style.name
+
+        slot.message = message
+        slot.label.setText(message)
+        slot.label.show()
+
+        # Le plus récent en dernier dans l'ordre des emplacements actifs
+        self.active_slots.pop(id(slot), None)
+        self.active_slots[id(slot)] = slot
+        slot.timer.start(style.duration)
+        self.shown_count += 1
+        self._schedule_update()
+
+    def watch_paint_events(self, counter: PaintEventCounter) -> None:
+        """Branche un compteur d'événements de peinture sur la barre de statut et les labels"""
+        counter.watch(self.status_bar, *(slot.label for slot in self.slots))
+
+    def _schedule_update(self) -> None:
+        # Les ajouts/retraits d'un même tour de boucle ne déclenchent qu'un seul update()
+        if not self.update_timer.isActive():
+            self.update_timer.start()
+
+
+class NotificationScheduler:
+    """Filtre les notifications avant affichage en fusionnant les répétitions consécutives
+
+    Un message identique au dernier encore visible ne crée pas de nouvelle
+    notification : son compteur est incrémenté (« Contenu copié ×37 ») et son
+    timer relancé. Le nombre de notifications visibles est borné par le pool.
+    """
+
+    def __init__(self, pool: NotificationPool, display: Callable[[str, NotificationType], None]) -> None:
+        self.pool = pool
+        self.display = display
+        self.last_notification: tuple[str, NotificationType] | None = None
+        self.last_text = ""
+        self.repeat_count = 0
+
+    def submit(self, message: str, notification_type: NotificationType) -> None:
+        latest = self.pool.latest()
+        if (
+            latest is not None
+            and self.last_notification == (message, notification_type)
+            and latest.message == self.last_text
+        ):
+            self.repeat_count += 1
+            self.last_text = f"{message} ×{self.repeat_count}"
+            self.pool.update(latest, self.last_text)
+            return
+
+        self.last_notification = (message, notification_type)
+        self.last_text = message
+        self.repeat_count = 1
+        self.display(message, notification_type)
@@ -0,0 +1,318 @@
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
+from itertools import accumulate
+
+from src.file_io import ReadableBuffer
+from src.line_index import LineIndex
+
+ORIGINAL = 0
+ADDED = 1
+
+# Nombre de morceaux par bloc ; un bloc est recoupé quand il dépasse le double
+BLOCK_SIZE = 64
+
+
+class Piece:
+    """Morceau du document : ``length`` octets du tampon ``buffer`` à partir de ``start``"""
+
+    __slots__ = ("buffer", "length", "line_feeds", "start")
+
+    def __init__(self, buffer: int, start: int, length: int, line_feeds: int) -> None:
+        self.buffer = buffer
+        self.start = start
+        self.length = length
+        self.line_feeds = line_feeds
+
+    def copy(self) -> "Piece":
+        return Piece(self.buffer, self.start, self.length, self.line_feeds)
+
+
+class PieceTable:
+    """Table de morceaux : le tampon d'origine (souvent un mmap) n'est jamais copié ni modifié
+
+    Le texte inséré est ajouté à la fin d'un tampon d'ajout ; le document est
+    la suite des morceaux qui référencent ces deux tampons. Chaque tampon a
+    son index de lignes, ce qui permet de compter les sauts de ligne d'un
+    morceau par recherche dichotomique.
+
+    Les morceaux sont rangés en blocs d'environ ``BLOCK_SIZE`` dont on garde
+    la longueur et le nombre de sauts de ligne : une édition ne parcourt que
+    son bloc et les totaux des blocs, jamais tous les morceaux.
+
+    Tant qu'aucune modification n'a eu lieu, toutes les requêtes passent
+    directement par l'index du tampon d'origine, qui peut encore être en
+    construction.
+    """
+
+    def __init__(self, original: ReadableBuffer, original_index: LineIndex) -> None:
+        self.added = bytearray()
+        self.buffers: list[ReadableBuffer] = [original, self.added]
+        self.indexes = [original_index, LineIndex(0)]
+        self.blocks: list[list[Piece]] | None = None
+        # Totaux par bloc, puis position et nombre de lignes cumulés (recalculés après chaque édition)
+        self._block_lengths: list[int] = []
+        self._block_feeds: list[int] = []
+        self._block_offsets: list[int] = []
+        self._block_line_ends: list[int] = []
+        self._size = len(original)
+
+    @property
+    def edited(self) -> bool:
+        return self.blocks is not None
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def piece_count(self) -> int:
+        if self.blocks is None:
+            return 1 if self._size else 0
+        return sum(len(block) for block in self.blocks)
+
+    def pieces(self) -> Iterator[Piece]:
+        if self.blocks is None:
+            if self._size:
+                yield Piece(ORIGINAL, 0, self._size, len(self.indexes[ORIGINAL]) - 1)
+            return
+        for block in self.blocks:
+            yield from block
+
+    @property
+    def line_count(self) -> int:
+        if self.blocks is None:
+            return len(self.indexes[ORIGINAL])
+        return 1 + (self._block_line_ends[-1] if self._block_line_ends else 0)
+
+    def _materialize(self) -> list[list[Piece]]:
+        """Crée le morceau initial à la première modification (l'index d'origine doit être complet)"""
+        if self.blocks is None:
+            self.blocks = [list(self.pieces())]
+            self._recount(0)
+            self._update()
+        return self.blocks
+
+    def _recount(self, block: int) -> None:
+        pieces = self._materialize()[block]
+        length = sum(piece.length for piece in pieces)
+        line_feeds = sum(piece.line_feeds for piece in pieces)
+        if block < len(self._block_lengths):
+            self._block_lengths[block] = length
+            self._block_feeds[block] = line_feeds
+        else:
+            self._block_lengths.append(length)
+            self._block_feeds.append(line_feeds)
+
+    def _balance(self, block: int) -> None:
+        """Recoupe un bloc devenu trop grand, retire un bloc vide"""
+        blocks = self._materialize()
+        pieces = blocks[block]
+        if not pieces and len(blocks) > 1:
+            del blocks[block]
+            del self._block_lengths[block]
+            del self._block_feeds[block]
+        elif len(pieces) > 2 * BLOCK_SIZE:
+            parts = [pieces[start : start + BLOCK_SIZE] for start in range(0, len(pieces), BLOCK_SIZE)]
+            blocks[block : block + 1] = parts
+            self._block_lengths[block : block + 1] = [sum(piece.length for piece in part) for part in parts]
+            self._block_feeds[block : block + 1] = [sum(piece.line_feeds for piece in part) for part in parts]
+
+    def _update(self) -> None:
+        self._block_offsets = [0, *accumulate(self._block_lengths)]
+        self._size = self._block_offsets.pop()
+        self._block_line_ends = list(accumulate(self._block_feeds))
+
+    def _line_feeds(self, buffer: int, start: int, end: int) -> int:
+        """Nombre de sauts de ligne dans ``[start, end)`` d'un tampon"""
+        starts = self.indexes[buffer].starts
+        return bisect_right(starts, end) - bisect_right(starts, start)
+
+    def _locate(self, offset: int) -> tuple[int, int, int]:
+        """Bloc, morceau et décalage dans ce morceau d'une position (la fin du document est la fin du dernier)"""
+        blocks = self._materialize()
+        block = max(0, bisect_right(self._block_offsets, offset) - 1)
+        delta = offset - self._block_offsets[block]
+        for index, piece in enumerate(blocks[block]):
+            if delta < piece.length:
+                return block, index, delta
+            delta -= piece.length
+        last = len(blocks[block]) - 1
+        return block, last, delta + blocks[block][last].length
+
+    def _split(self, offset: int) -> tuple[int, int]:
+        """Coupe le morceau contenant ``offset`` ; retourne (bloc, indice) du point d'insertion à ``offset``"""
+        blocks = self._materialize()
+        if not self._size:
+            return 0, 0
+        if offset >= self._size:
+            return len(blocks) - 1, len(blocks[-1])
+
+        block, index, delta = self._locate(offset)
+        if delta == 0:
+            return block, index
+
+        # Une coupe ne change ni la longueur ni le nombre de lignes du bloc
+        piece = blocks[block][index]
+        head_feeds = self._line_feeds(piece.buffer, piece.start, piece.start + delta)
+        tail = Piece(piece.buffer, piece.start + delta, piece.length - delta, piece.line_feeds - head_feeds)
+        piece.length = delta
+        piece.line_feeds = head_feeds
+        blocks[block].insert(index + 1, tail)
+        return block, index + 1
+
+    def insert(self, offset: int, data: bytes) -> Piece | None:
+        """Insère ``data`` et retourne le morceau qui le décrit dans le tampon d'ajout"""
+        if not data:
+            return None
+
+        start = len(self.added)
+        self.added += data
+        self.indexes[ADDED].scan_chunk(data, start)
+        inserted = Piece(ADDED, start, len(data), data.count(b"\n"))
+
+        block, index = self._split(offset)
+        pieces = self._materialize()[block]
+        # Saisie ou collage à la suite du dernier ajout : on allonge le morceau précédent
+        if index > 0 and (previous := pieces[index - 1]).buffer == ADDED and previous.start + previous.length == start:
+            previous.length += inserted.length
+            previous.line_feeds += inserted.line_feeds
+        else:
+            pieces.insert(index, inserted.copy())
+        self._block_lengths[block] += inserted.length
+        self._block_feeds[block] += inserted.line_feeds
+        self._balance(block)
+        self._update()
+        return inserted
+
+    def delete(self, start: int, end: int) -> bytes:
+        """Supprime les octets ``[start, end)`` et les retourne"""
+        removed = self.read(start, end)
+        self.remove(start, end)
+        return removed
+
+    def remove(self, start: int, end: int) -> list[Piece]:
+        """Retire la plage ``[start, end)`` et retourne ses morceaux, sans copier le texte"""
+        end = min(end, self._size)
+        if start >= end:
+            return []
+
+        first_block, first = self._split(start)
+        last_block, last = self._split(end)
+        blocks = self._materialize()
+
+        if first_block == last_block:
+            removed = blocks[first_block][first:last]
+            del blocks[first_block][first:last]
+        else:
+            removed = blocks[first_block][first:]
+            del blocks[first_block][first:]
+            for block in blocks[first_block + 1 : last_block]:
+                removed.extend(block)
+            removed.extend(blocks[last_block][:last])
+            del blocks[last_block][:last]
+            # Blocs entièrement retirés
+            del blocks[first_block + 1 : last_block]
+            del self._block_lengths[first_block + 1 : last_block]
+            del self._block_feeds[first_block + 1 : last_block]
+            self._recount(first_block + 1)
+            self._balance(first_block + 1)
+
+        self._recount(first_block)
+        self._balance(first_block)
+        self._update()
+        return removed
+
+    def insert_pieces(self, offset: int, pieces: list[Piece]) -> None:
+        """Réinsère des morceaux retirés (annuler/rétablir) ; les tampons étant immuables, ils sont toujours valides"""
+        if not pieces:
+            return
+
+        block, index = self._split(offset)
+        # Copies : les morceaux de la table peuvent être coupés par la suite
+        self._materialize()[block][index:index] = [piece.copy() for piece in pieces]
+        self._recount(block)
+        self._balance(block)
+        self._update()
+
+    def _pieces_from(self, offset: int) -> Iterator[tuple[Piece, int]]:
+        """Morceaux à partir de celui qui contient ``offset``, avec le décalage de départ dans chacun"""
+        block, index, delta = self._locate(offset)
+        blocks = self._materialize()
+        for position in range(block, len(blocks)):
+            for piece in blocks[position][index:]:
+                yield piece, delta
+                delta = 0
+            index = 0
+
+    def read(self, start: int, end: int) -> bytes:
+        end = min(end, self._size)
+        if start >= end:
+            return b""
+        if self.blocks is None:
+            return bytes(self.buffers[ORIGINAL][start:end])
+
+        parts = []
+        remaining = end - start
+        for piece, delta in self._pieces_from(start):
+            length = min(piece.length - delta, remaining)
+            parts.append(self.buffers[piece.buffer][piece.start + delta : piece.start + delta + length])
+            remaining -= length
+            if remaining == 0:
+                break
+        return b"".join(parts)
+
+    def chunks(self, chunk_size: int) -> Iterator[bytes]:
+        """Parcourt le contenu par blocs d'au plus ``chunk_size`` octets
+
+        La liste des morceaux est figée à l'appel : le parcours peut se faire
+        dans un autre thread.
+        """
+        return self._iter_chunks([piece.copy() for piece in self.pieces()], chunk_size)
+
+    def _iter_chunks(self, pieces: list[Piece], chunk_size: int) -> Iterator[bytes]:
+        for piece in pieces:
+            buffer = self.buffers[piece.buffer]
+            for start in range(piece.start, piece.start + piece.length, chunk_size):
+                yield bytes(buffer[start : min(start + chunk_size, piece.start + piece.length)])
+
+    def line_start(self, line: int) -> int:
+        if self.blocks is None:
+            return self.indexes[ORIGINAL].starts[line]
+        if line == 0:
+            return 0
+
+        # Bloc puis morceau contenant le saut de ligne qui précède la ligne demandée
+        block = bisect_left(self._block_line_ends, line)
+        before = self._block_line_ends[block] - self._block_feeds[block]
+        offset = self._block_offsets[block]
+        for piece in self.blocks[block]:
+            if before + piece.line_feeds >= line:
+                starts = self.indexes[piece.buffer].starts
+                position = starts[bisect_right(starts, piece.start) + line - before - 1]
+                return offset + position - piece.start
+            before += piece.line_feeds
+            offset += piece.length
+        raise IndexError(line)
+
+    def line_range(self, line: int) -> tuple[int, int]:
+        """Positions (début, fin) de la ligne, sans le saut de ligne final"""
+        if self.blocks is None:
+            return self.indexes[ORIGINAL].line_range(line)
+
+        start = self.line_start(line)
+        if line + 1 < self.line_count:
+            return start, self.line_start(line + 1) - 1
+        return start, self._size
+
+    def line_of(self, offset: int) -> int:
+        """Numéro de la ligne contenant la position ``offset``"""
+        if self.blocks is None:
+            return self.indexes[ORIGINAL].line_of(offset)
+        if not self._size:
+            return 0
+
+        block, index, delta = self._locate(offset)
+        pieces = self.blocks[block]
+        before = self._block_line_ends[block] - self._block_feeds[block]
+        before += sum(piece.line_feeds for piece in pieces[:index])
+        piece = pieces[index]
+        return before + self._line_feeds(piece.buffer, piece.start, piece.start + delta)
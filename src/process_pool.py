@@ -0,0 +1,130 @@
+import os
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, wait
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from src.domain.constants import PROCESS_MIN_PART_SIZE, PROCESS_PARTS_PER_WORKER
+from src.file_io import FileIOCancelled, FileIOWorker
+
+# multiprocessing (≈ 30 ms d'imports) n'est chargé qu'à la première tâche, hors du chemin de démarrage
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing.shared_memory import SharedMemory
+
+# Tâche exécutée dans un processus : (nom du segment partagé, début, fin, *arguments) -> résultat partiel
+ProcessTask = Callable[..., Any]
+
+
+class ProcessPool:
+    """Pool de processus pour les traitements lourds, qui échappent ainsi au GIL du thread GUI
+
+    Les processus sont démarrés à la première tâche, par ``spawn`` : pas de
+    fork d'un processus Qt multithreadé, et chaque processus n'importe que le
+    module de sa tâche, sans Qt.
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        self.max_workers = max_workers or os.process_cpu_count() or 1
+        self.pool: ProcessPoolExecutor | None = None
+        self.lock = threading.Lock()
+
+    def executor(self) -> "ProcessPoolExecutor":
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        with self.lock:
+            if self.pool is None:
+                self.pool = ProcessPoolExecutor(self.max_workers, mp_context=multiprocessing.get_context("spawn"))
+            return self.pool
+
+    def shutdown(self) -> None:
+        """Abandonne les tâches en attente ; les processus finissent leur tâche en cours sans être attendus"""
+        with self.lock:
+            if self.pool is not None:
+                self.pool.shutdown(wait=False, cancel_futures=True)
+                self.pool = None
+
+
+class ProcessTaskWorker(FileIOWorker):
+    """Traitement lourd réparti sur le pool de processus, piloté depuis le pool de threads
+
+    Le texte (des blocs relevés sur le thread GUI, voir ``Document.chunks``)
+    est copié une fois dans un segment de mémoire partagée, que chaque
+    processus lit sans sérialisation ; ``task`` est appliquée à des parties
+    du texte et ``combine`` assemble leurs résultats, dans l'ordre du texte.
+    L'annulation abandonne les parties en attente ; le segment est libéré
+    dans tous les cas.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        pool: ProcessPool,
+        chunks: Iterable[bytes],
+        size: int,
+        task: ProcessTask,
+        combine: Callable[[list[Any]], object],
+        args: tuple[object, ...] = (),
+    ) -> None:
+        super().__init__(path)
+        self.pool = pool
+        self.chunks = chunks
+        self.size = size
+        self.task = task
+        self.combine = combine
+        self.args = args
+
+    def parts(self) -> list[tuple[int, int]]:
+        """Parties ``[début, fin)`` de tailles égales, quelques-unes par processus"""
+        count = max(1, min(-(-self.size // PROCESS_MIN_PART_SIZE), PROCESS_PARTS_PER_WORKER * self.pool.max_workers))
+        bounds = [self.size * i // count for i in range(count + 1)]
+        return list(zip(bounds, bounds[1:], strict=False))
+
+    def work(self) -> object:
+        from concurrent.futures.process import BrokenProcessPool
+        from multiprocessing.shared_memory import SharedMemory
+
+        shared = SharedMemory(create=True, size=max(1, self.size))
+        try:
+            return self.run_parts(shared)
+        except BrokenProcessPool as e:
+            raise OSError(f"Pool de processus interrompu : {e}") from e
+        finally:
+            shared.close()
+            shared.unlink()
+
+    def run_parts(self, shared: "SharedMemory") -> object:
+        if (buffer := shared.buf) is None:
+            raise FileIOCancelled
+        # Progression : copie du texte, puis parties traitées
+        total = 2 * self.size
+        done = 0
+        for chunk in self.chunks:
+            self.check_cancelled()
+            buffer[done : done + len(chunk)] = chunk
+            done += len(chunk)
+            self.report_progress(done, total)
+
+        try:
+            executor = self.pool.executor()
+            futures: dict[Future[Any], int] = {
+                executor.submit(self.task, shared.name, start, end, *self.args): end - start
+                for start, end in self.parts()
+            }
+        except RuntimeError as e:
+            # Pool arrêté entre-temps (fermeture de la fenêtre)
+            raise FileIOCancelled from e
+
+        pending = set(futures)
+        try:
+            while pending:
+                finished, pending = wait(pending, timeout=0.05)
+                self.check_cancelled()
+                done += sum(futures[future] for future in finished)
+                self.report_progress(done, total)
+        finally:
+            for future in pending:
+                future.cancel()
+        return self.combine([future.result() for future in futures])
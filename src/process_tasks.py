@@ -0,0 +1,72 @@
+# Octets d'espacement, séparateurs de mots
+WHITESPACE = b" \t\n\r\x0b\x0c"
+# Espacement -> espace, tout autre octet -> « x » : un début de mot est alors la suite « x »
+WORD_TABLE = bytes(0x20 if byte in WHITESPACE else 0x78 for byte in range(256))
+# Octets de continuation UTF-8 (10xxxxxx), qui ne commencent pas de caractère
+CONTINUATION_BYTES = bytes(range(0x80, 0xC0))
+
+
+class TextStatistics:
+    """Statistiques d'une partie du texte, additionnables d'une partie à l'autre"""
+
+    __slots__ = ("characters", "line_feeds", "size", "words")
+
+    def __init__(self, size: int = 0, line_feeds: int = 0, words: int = 0, characters: int = 0) -> None:
+        self.size = size
+        self.line_feeds = line_feeds
+        self.words = words
+        self.characters = characters
+
+    def __add__(self, other: "TextStatistics") -> "TextStatistics":
+        return TextStatistics(
+            self.size + other.size,
+            self.line_feeds + other.line_feeds,
+            self.words + other.words,
+            self.characters + other.characters,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TextStatistics):
+            return NotImplemented
+        return (self.size, self.line_feeds, self.words, self.characters) == (
+            other.size,
+            other.line_feeds,
+            other.words,
+            other.characters,
+        )
+
+
+def read_shared(name: str, start: int, end: int) -> bytes:
+    """Copie ``[start, end)`` du segment de mémoire partagée ``name``
+
+    Le segment appartient au processus qui l'a créé : il n'est pas suivi ici
+    par le resource_tracker, qui le supprimerait à la fin du processus.
+    """
+    from multiprocessing.shared_memory import SharedMemory
+
+    shared = SharedMemory(name, track=False)
+    try:
+        if (buffer := shared.buf) is None:
+            raise FileNotFoundError(f"Segment de mémoire partagée {name} fermé")
+        return bytes(buffer[start:end])
+    finally:
+        shared.close()
+
+
+def text_statistics(name: str, start: int, end: int) -> TextStatistics:
+    """Octets, sauts de ligne, mots et caractères UTF-8 de ``[start, end)`` du texte partagé ``name``"""
+    # L'octet précédent dit si le premier mot de la partie commence un mot ou en prolonge un
+    skipped = 1 if start else 0
+    data = read_shared(name, start - skipped, end)
+    words = data.translate(WORD_TABLE)
+    return TextStatistics(
+        size=len(data) - skipped,
+        line_feeds=data.count(b"\n", skipped),
+        words=words.count(b" x") + (0 if skipped else words.startswith(b"x")),
+        characters=len(data.translate(None, CONTINUATION_BYTES))
+        - len(data[:skipped].translate(None, CONTINUATION_BYTES)),
+    )
+
+
+def merge_statistics(parts: list[TextStatistics]) -> TextStatistics:
+    return sum(parts, TextStatistics())
@@ -0,0 +1,319 @@
+import re
+import sys
+import threading
+import time
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterator
+from pathlib import Path
+
+from PyQt6.QtCore import pyqtSignal
+
+from src.domain.constants import SEARCH_BATCH_INTERVAL, SEARCH_BLOCK_SIZE, SEARCH_SCAN_SIZE
+from src.file_io import FileIOCancelled, FileIOSignals, FileIOWorker, ReadableBuffer
+from src.piece_table import ADDED, ORIGINAL, PieceTable
+
+# Mots indexés : suites de lettres ASCII ; chiffres, ponctuation et octets UTF-8 non ASCII les séparent,
+# pour que numéros et identifiants n'agrandissent pas le vocabulaire
+WORD = re.compile(rb"[A-Za-z_]+")
+WORD_TAIL = re.compile(rb"[A-Za-z_]*")
+# Longueur maximale des clés de l'index : un mot plus long est tronqué et son bloc marqué à part
+MAX_TOKEN_LENGTH = 64
+# Fragment de mot minimal pour filtrer par le vocabulaire (plus court, il ne filtre presque rien)
+MIN_PARTIAL_LENGTH = 3
+
+# Mot de la requête et s'il peut n'être qu'un fragment de mot du document (début ou fin de requête)
+QueryTerm = tuple[bytes, bool]
+
+
+def query_terms(query: bytes) -> list[QueryTerm]:
+    """Mots d'une requête ; ceux qui touchent un bord de la requête peuvent être des fragments"""
+    return [
+        (match.group(), match.start() == 0 or match.end() == len(query) or len(match.group()) > MAX_TOKEN_LENGTH)
+        for match in WORD.finditer(query)
+    ]
+
+
+def block_tokens(buffer: ReadableBuffer, start: int, end: int) -> set[bytes]:
+    """Mots qui commencent dans ``buffer[start:end]``, le dernier lu en entier au-delà de ``end``"""
+    data = bytes(buffer[start : end + MAX_TOKEN_LENGTH])
+    limit = end - start
+    if (tail := WORD_TAIL.match(data, limit)) is not None:
+        limit = tail.end()
+    return set(WORD.findall(data, 0, limit))
+
+
+class BufferIndex:
+    """Index inversé d'un tampon : pour chaque mot, les blocs de ``block_size`` octets où il commence
+
+    Les blocs d'un mot sont rangés par ordre croissant dans un tableau
+    compact ; ``indexed`` est le nombre d'octets du tampon déjà parcourus.
+    """
+
+    def __init__(self, block_size: int = SEARCH_BLOCK_SIZE) -> None:
+        self.block_size = block_size
+        self.postings: dict[bytes, array[int]] = {}
+        # Blocs contenant un mot plus long que MAX_TOKEN_LENGTH, candidats de toute recherche de fragment
+        self.long_blocks: array[int] = array("I")
+        self.indexed = 0
+
+    def __len__(self) -> int:
+        return len(self.postings)
+
+    def add(self, block: int, tokens: set[bytes], end: int) -> None:
+        """Ajoute les mots d'un bloc parcouru jusqu'à la position ``end`` du tampon"""
+        if tokens and max(map(len, tokens)) > MAX_TOKEN_LENGTH:
+            if not self.long_blocks or self.long_blocks[-1] != block:
+                self.long_blocks.append(block)
+            tokens = {token[:MAX_TOKEN_LENGTH] for token in tokens}
+
+        postings = self.postings
+        for token in tokens:
+            if (blocks := postings.get(token)) is None:
+                postings[token] = array("I", (block,))
+            elif blocks[-1] != block:
+                blocks.append(block)
+        self.indexed = max(self.indexed, end)
+
+    def candidate_blocks(self, terms: list[QueryTerm]) -> set[int] | None:
+        """Blocs indexés où une occurrence peut commencer, None si aucun mot de la requête ne filtre
+
+        Un mot de l'occurrence commence dans son bloc ou dans un voisin : une
+        occurrence peut déborder sur le bloc suivant, et le mot du document
+        qui contient un fragment en tête de requête peut commencer au bloc
+        précédent (plus loin, il couvrirait un bloc entier et serait long).
+        """
+        candidates: set[int] | None = None
+        for term, partial in terms:
+            if partial:
+                if len(term) < MIN_PARTIAL_LENGTH:
+                    continue
+                blocks = set(self.long_blocks)
+                for token, postings in self.postings.items():
+                    if term in token:
+                        blocks.update(postings)
+            elif len(term) <= MAX_TOKEN_LENGTH:
+                blocks = set(self.postings.get(term, ()))
+            else:
+                continue
+
+            near = blocks.union([block - 1 for block in blocks], [block + 1 for block in blocks])
+            candidates = near if candidates is None else candidates & near
+        return candidates
+
+    def memory(self) -> int:
+        """Empreinte approximative de l'index en octets"""
+        return (
+            sys.getsizeof(self.postings)
+            + sum(sys.getsizeof(token) + sys.getsizeof(blocks) for token, blocks in self.postings.items())
+            + sys.getsizeof(self.long_blocks)
+        )
+
+
+class TextSnapshot:
+    """Morceaux du document relevés sur le thread GUI : le texte peut ensuite être lu depuis un autre thread
+
+    Les tampons ne sont jamais modifiés (celui d'ajout ne fait que grandir) :
+    seule la liste des morceaux doit être figée.
+    """
+
+    def __init__(self, text: PieceTable) -> None:
+        self.buffers = text.buffers
+        self.offsets: list[int] = []
+        self.pieces: list[tuple[int, int, int]] = []
+        offset = 0
+        for piece in text.pieces():
+            self.offsets.append(offset)
+            self.pieces.append((piece.buffer, piece.start, piece.length))
+            offset += piece.length
+        self.size = offset
+
+    def read(self, start: int, end: int) -> bytes:
+        end = min(end, self.size)
+        parts = []
+        index = bisect_right(self.offsets, start) - 1
+        while start < end:
+            buffer, piece_start, length = self.pieces[index]
+            delta = start - self.offsets[index]
+            count = min(length - delta, end - start)
+            parts.append(self.buffers[buffer][piece_start + delta : piece_start + delta + count])
+            start += count
+            index += 1
+        return b"".join(parts)
+
+
+class SearchIndex:
+    """Index de recherche plein texte d'un document : un index inversé par tampon de la table de morceaux
+
+    Le tampon d'origine est indexé une fois, par blocs, en arrière-plan
+    (``SearchIndexWorker``) ; le tampon d'ajout, qui ne fait que grandir, est
+    complété avant chaque recherche à partir de son dernier bloc. Une
+    modification n'invalide donc rien : un mot supprimé ne donne qu'un bloc
+    candidat de trop, écarté à la vérification.
+
+    Une recherche ne lit que les blocs candidats et les jonctions entre
+    morceaux (occurrence à cheval sur une insertion), puis vérifie chaque
+    occurrence dans le texte : les résultats sont exacts même pendant la
+    construction de l'index, dont les blocs restants sont tous candidats.
+    """
+
+    def __init__(self, text: PieceTable, block_size: int = SEARCH_BLOCK_SIZE) -> None:
+        self.text = text
+        self.block_size = block_size
+        self.indexes = [BufferIndex(block_size), BufferIndex(block_size)]
+        self.lock = threading.Lock()
+        # Document fermé : la construction en cours s'arrête
+        self.closed = False
+
+    @property
+    def complete(self) -> bool:
+        return self.indexes[ORIGINAL].indexed >= len(self.text.buffers[ORIGINAL])
+
+    def close(self) -> None:
+        self.closed = True
+
+    def index_original(self, worker: FileIOWorker | None = None) -> None:
+        """Indexe le tampon d'origine bloc par bloc (à exécuter hors du thread GUI pour un gros fichier)"""
+        if self.closed:
+            raise FileIOCancelled
+        buffer = self.text.buffers[ORIGINAL]
+        index = self.indexes[ORIGINAL]
+        size = len(buffer)
+        if index.indexed >= size:
+            return
+
+        for block in range(index.indexed // self.block_size, -(-size // self.block_size)):
+            if self.closed:
+                raise FileIOCancelled
+            if worker is not None:
+                worker.check_cancelled()
+            start = block * self.block_size
+            end = min(size, start + self.block_size)
+            tokens = block_tokens(buffer, start, end)
+            with self.lock:
+                index.add(block, tokens, end)
+            if worker is not None:
+                worker.report_progress(end, size)
+
+    def index_added(self) -> None:
+        """Complète l'index du tampon d'ajout depuis son dernier bloc, en partie indexé (verrou tenu)"""
+        added = self.text.added
+        index = self.indexes[ADDED]
+        if index.indexed >= (size := len(added)):
+            return
+
+        for block in range(index.indexed // self.block_size, -(-size // self.block_size)):
+            start = block * self.block_size
+            end = min(size, start + self.block_size)
+            index.add(block, block_tokens(added, start, end), end)
+
+    def ranges(self, query: bytes, snapshot: TextSnapshot, scan_size: int = SEARCH_SCAN_SIZE) -> list[tuple[int, int]]:
+        """Plages ``[début, fin)`` du document où une occurrence peut commencer, triées et disjointes"""
+        terms = query_terms(query) if len(query) < self.block_size else []
+        with self.lock:
+            self.index_added()
+            candidates = [index.candidate_blocks(terms) for index in self.indexes]
+            indexed = [index.indexed for index in self.indexes]
+
+        ranges = []
+        for offset, (buffer, start, length) in zip(snapshot.offsets, snapshot.pieces, strict=True):
+            if offset:
+                # Occurrence à cheval sur le morceau précédent
+                ranges.append((max(0, offset - len(query) + 1), offset))
+            if (blocks := candidates[buffer]) is None:
+                ranges.append((offset, offset + length))
+                continue
+
+            end = start + length
+            for block in range(start // self.block_size, (end - 1) // self.block_size + 1):
+                block_start = block * self.block_size
+                if block in blocks or block_start >= indexed[buffer]:
+                    first = max(start, block_start)
+                    last = min(end, block_start + self.block_size)
+                    ranges.append((offset + first - start, offset + last - start))
+
+        merged: list[tuple[int, int]] = []
+        for start, end in sorted(ranges):
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        return [
+            (position, min(end, position + scan_size))
+            for start, end in merged
+            for position in range(start, end, scan_size)
+        ]
+
+    def search(self, query: bytes, snapshot: TextSnapshot) -> Iterator[list[int]]:
+        """Positions des occurrences de ``query`` (éventuellement chevauchantes), par lots croissants"""
+        if not query:
+            return
+        for start, end in self.ranges(query, snapshot):
+            data = snapshot.read(start, end + len(query) - 1)
+            matches = []
+            position = data.find(query)
+            while position != -1 and position < end - start:
+                matches.append(start + position)
+                position = data.find(query, position + 1)
+            yield matches
+
+    def memory(self) -> int:
+        """Empreinte approximative des index en octets"""
+        with self.lock:
+            return sum(index.memory() for index in self.indexes)
+
+
+class SearchIndexWorker(FileIOWorker):
+    """Construit l'index de recherche du tampon d'origine d'un document dans le pool de threads"""
+
+    def __init__(self, path: Path, index: SearchIndex) -> None:
+        super().__init__(path)
+        self.index = index
+
+    def work(self) -> SearchIndex:
+        self.index.index_original(self)
+        return self.index
+
+
+class SearchSignals(FileIOSignals):
+    found = pyqtSignal(object)  # lot de positions d'occurrences (list[int])
+
+
+class SearchWorker(FileIOWorker):
+    """Recherche dans le pool de threads ; les occurrences sont transmises par lots au fil du parcours
+
+    Les morceaux du document sont relevés à la création du worker, sur le
+    thread GUI. Le premier lot part dès la première occurrence trouvée, les
+    suivants au plus toutes les ``batch_interval`` ms ; le résultat final est
+    le nombre d'occurrences.
+    """
+
+    signals: SearchSignals
+
+    def __init__(
+        self, path: Path, index: SearchIndex, query: bytes, batch_interval: int = SEARCH_BATCH_INTERVAL
+    ) -> None:
+        super().__init__(path)
+        self.signals = SearchSignals()
+        self.index = index
+        self.query = query
+        self.snapshot = TextSnapshot(index.text)
+        self.batch_interval = batch_interval
+
+    def work(self) -> int:
+        count = 0
+        batch: list[int] = []
+        last_emit = 0.0
+        for matches in self.index.search(self.query, self.snapshot):
+            self.check_cancelled()
+            batch.extend(matches)
+            if batch and (not count or (time.perf_counter() - last_emit) * 1000 >= self.batch_interval):
+                count += len(batch)
+                self.signals.found.emit(batch)
+                batch = []
+                last_emit = time.perf_counter()
+
+        if batch:
+            count += len(batch)
+            self.signals.found.emit(batch)
+        return count
@@ -0,0 +1,147 @@
+import logging
+import os
+import struct
+from enum import IntFlag
+from pathlib import Path
+
+from src.document_tabs import ViewPosition
+from src.theme_manager import Theme
+
+logger = logging.getLogger(__name__)
+
+SESSION_MAGIC = b"TPS\x01"
+# Signature et version, drapeaux, compteur d'actions, onglet courant, taille de la géométrie, nombre de documents
+HEADER = struct.Struct("<4sBQIII")
+# Par document : position de la vue, puis taille du chemin (encodage du système de fichiers) qui suit
+DOCUMENT = struct.Struct("<QQQQI")
+
+
+class SessionFlag(IntFlag):
+    NONE = 0
+    TOOLBAR_VISIBLE = 1
+    STATUSBAR_VISIBLE = 2
+    BOLD = 4
+    ITALIC = 8
+    DARK_THEME = 16
+
+
+class SessionState:
+    """État de la fenêtre conservé d'une session à l'autre
+
+    Les documents ne sont gardés que par leur chemin et la position de la vue
+    (le contenu non sauvegardé relève de la sauvegarde automatique).
+    """
+
+    def __init__(
+        self,
+        geometry: bytes = b"",
+        theme: Theme = "light",
+        toolbar_visible: bool = True,
+        statusbar_visible: bool = True,
+        bold: bool = False,
+        italic: bool = False,
+        action_counter: int = 0,
+        documents: list[tuple[Path, ViewPosition]] | None = None,
+        current: int = 0,
+    ) -> None:
+        self.geometry = geometry
+        self.theme: Theme = theme
+        self.toolbar_visible = toolbar_visible
+        self.statusbar_visible = statusbar_visible
+        self.bold = bold
+        self.italic = italic
+        self.action_counter = action_counter
+        self.documents = documents if documents is not None else []
+        self.current = current
+
+    def to_bytes(self) -> bytes:
+        flags = SessionFlag.NONE
+        for enabled, flag in (
+            (self.toolbar_visible, SessionFlag.TOOLBAR_VISIBLE),
+            (self.statusbar_visible, SessionFlag.STATUSBAR_VISIBLE),
+            (self.bold, SessionFlag.BOLD),
+            (self.italic, SessionFlag.ITALIC),
+            (self.theme == "dark", SessionFlag.DARK_THEME),
+        ):
+            if enabled:
+                flags |= flag
+
+        parts = [
+            HEADER.pack(
+                SESSION_MAGIC, flags, self.action_counter, self.current, len(self.geometry), len(self.documents)
+            ),
+            self.geometry,
+        ]
+        for path, position in self.documents:
+            encoded = os.fsencode(path)
+            parts.append(DOCUMENT.pack(*position, len(encoded)))
+            parts.append(encoded)
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "SessionState":
+        """Décode une session, ValueError si les données sont tronquées ou d'un autre format"""
+        try:
+            magic, flags, action_counter, current, geometry_size, count = HEADER.unpack_from(data)
+            if magic != SESSION_MAGIC:
+                raise ValueError("format de session inconnu")
+            offset = HEADER.size
+            geometry = data[offset : offset + geometry_size]
+            offset += geometry_size
+
+            documents: list[tuple[Path, ViewPosition]] = []
+            for _ in range(count):
+                anchor, caret, first_line, first_column, path_size = DOCUMENT.unpack_from(data, offset)
+                offset += DOCUMENT.size
+                if offset + path_size > len(data):
+                    raise ValueError("session tronquée")
+                documents.append(
+                    (Path(os.fsdecode(data[offset : offset + path_size])), (anchor, caret, first_line, first_column))
+                )
+                offset += path_size
+        except struct.error as e:
+            raise ValueError(f"session tronquée : {e}") from e
+
+        flags = SessionFlag(flags)
+        return cls(
+            geometry=geometry,
+            theme="dark" if SessionFlag.DARK_THEME in flags else "light",
+            toolbar_visible=SessionFlag.TOOLBAR_VISIBLE in flags,
+            statusbar_visible=SessionFlag.STATUSBAR_VISIBLE in flags,
+            bold=SessionFlag.BOLD in flags,
+            italic=SessionFlag.ITALIC in flags,
+            action_counter=action_counter,
+            documents=documents,
+            current=min(current, max(0, count - 1)),
+        )
+
+
+class SessionStore:
+    """Fichier de session binaire : écrit à la fermeture, lu d'un bloc au démarrage"""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def load(self) -> SessionState | None:
+        """Session précédente, None au premier lancement ou si le fichier est illisible"""
+        try:
+            return SessionState.from_bytes(self.path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("session précédente ignorée : %s", e)
+            return None
+
+    def save(self, state: SessionState) -> bool:
+        """Remplace le fichier de session (fichier temporaire puis renommage), False en cas d'échec"""
+        temporary_path = self.path.with_name(f".{self.path.name}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temporary_path.write_bytes(state.to_bytes())
+            temporary_path.replace(self.path)
+        except OSError as e:
+            # La session ne doit jamais empêcher la fermeture
+            logger.warning("session non écrite : %s", e)
+            temporary_path.unlink(missing_ok=True)
+            return False
+        return True
@@ -0,0 +1,55 @@
+import time
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QFont, QPainter, QPixmap
+from PyQt6.QtWidgets import QApplication, QLabel
+
+from src.domain.constants import SPLASH_EXPOSE_TIMEOUT, SPLASH_SIZE
+
+
+def show_splash(title: str) -> QLabel:
+    """Écran de démarrage peint aussitôt, avant l'import de la fenêtre principale
+
+    Dessiné en mémoire (ni fichier ni feuille de style à charger) : il ne
+    dépend que de QtWidgets, déjà importé pour QApplication. Un simple label
+    plutôt que QSplashScreen, dont l'affichage attend l'exposition de la
+    fenêtre (jusqu'à une seconde sur certaines plateformes).
+
+    La boucle d'événements tourne jusqu'à l'exposition de la fenêtre par le
+    système de fenêtrage (au plus ``SPLASH_EXPOSE_TIMEOUT`` ms) : sans cela
+    l'écran serait fermé avant d'avoir jamais été visible.
+    """
+    width, height = SPLASH_SIZE
+    pixmap = QPixmap(width, height)
+    pixmap.fill(QColor("#2b2b2b"))
+    painter = QPainter(pixmap)
+    font = QFont()
+    font.setPointSize(16)
+    painter.setFont(font)
+    painter.setPen(QColor("#f0f0f0"))
+    painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, title)
+    font.setPointSize(9)
+    painter.setFont(font)
+    painter.setPen(QColor("#a0a0a0"))
+    painter.drawText(
+        pixmap.rect().adjusted(0, 0, 0, -12),
+        Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignHCenter,
+        "Chargement…",
+    )
+    painter.end()
+
+    splash = QLabel()
+    splash.setWindowFlags(Qt.WindowType.SplashScreen | Qt.WindowType.FramelessWindowHint)
+    splash.setPixmap(pixmap)
+    splash.show()
+    deadline = time.perf_counter() + SPLASH_EXPOSE_TIMEOUT / 1000
+    while not is_exposed(splash) and time.perf_counter() < deadline:
+        QApplication.processEvents()
+        time.sleep(0.001)
+    splash.repaint()
+    QApplication.processEvents()
+    return splash
+
+
+def is_exposed(widget: QLabel) -> bool:
+    return (window := widget.windowHandle()) is not None and window.isExposed()
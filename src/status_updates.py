@@ -0,0 +1,49 @@
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QLabel, QStatusBar
+
+
+class StatusUpdateBatcher:
+    """Regroupe les mises à jour de la barre de statut et ne publie que l'état final
+
+    Les textes de labels et les messages temporaires sont enregistrés sans
+    toucher aux widgets, puis appliqués une seule fois au tour suivant de la
+    boucle d'événements (ou immédiatement via ``flush()``).
+    """
+
+    def __init__(self, status_bar: QStatusBar) -> None:
+        self.status_bar = status_bar
+        self.pending_texts: dict[QLabel, str] = {}
+        self.pending_message: tuple[str, int] | None = None
+
+        self.flush_timer = QTimer(status_bar)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(0)
+        self.flush_timer.timeout.connect(self.flush)
+
+    def set_text(self, label: QLabel, text: str) -> None:
+        """Enregistre le texte à afficher dans un label permanent"""
+        self.pending_texts[label] = text
+        self._schedule_flush()
+
+    def show_message(self, message: str, timeout: int = 0) -> None:
+        """Enregistre le message temporaire, seul le dernier du tour sera affiché"""
+        self.pending_message = (message, timeout)
+        self._schedule_flush()
+
+    def flush(self) -> None:
+        """Applique immédiatement les mises à jour en attente"""
+        self.flush_timer.stop()
+
+        for label, text in self.pending_texts.items():
+            if label.text() != text:
+                label.setText(text)
+        self.pending_texts.clear()
+
+        if self.pending_message is not None:
+            message, timeout = self.pending_message
+            self.pending_message = None
+            self.status_bar.showMessage(message, timeout)
+
+    def _schedule_flush(self) -> None:
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
@@ -0,0 +1,318 @@
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from PyQt6.QtCore import QObject, QThreadPool, QTimer, pyqtSignal
+
+from src.domain.constants import (
+    TELEMETRY_BATCH_SIZE,
+    TELEMETRY_FLUSH_INTERVAL,
+    TELEMETRY_MAX_PENDING,
+    TELEMETRY_MAX_SEGMENTS,
+    TELEMETRY_SEGMENT_SIZE,
+)
+from src.file_io import FileIOWorker
+
+logger = logging.getLogger(__name__)
+
+# Utilisation d'une action : (horodatage, nom de l'action, latence en ms)
+UsageEvent = tuple[float, str, float]
+
+CURRENT_FILE = "usage.log"
+SUMMARY_FILE = "usage-summary.json"
+
+
+class UsageStats:
+    """Statistiques agrégées par action : utilisations, latence cumulée (ms) et dernière utilisation"""
+
+    def __init__(self) -> None:
+        self.counts: dict[str, int] = {}
+        self.latencies: dict[str, float] = {}
+        self.last_used: dict[str, float] = {}
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def add(self, timestamp: float, name: str, latency: float) -> None:
+        self.counts[name] = self.counts.get(name, 0) + 1
+        self.latencies[name] = self.latencies.get(name, 0.0) + latency
+        self.last_used[name] = max(self.last_used.get(name, 0.0), timestamp)
+
+    def mean_latency(self, name: str) -> float:
+        return self.latencies.get(name, 0.0) / count if (count := self.counts.get(name)) else 0.0
+
+    def merge(self, other: "UsageStats") -> None:
+        for name, count in other.counts.items():
+            self.counts[name] = self.counts.get(name, 0) + count
+            self.latencies[name] = self.latencies.get(name, 0.0) + other.latencies.get(name, 0.0)
+            self.last_used[name] = max(self.last_used.get(name, 0.0), other.last_used.get(name, 0.0))
+
+    def to_json(self) -> dict[str, Any]:
+        return {"counts": self.counts, "latencies": self.latencies, "last_used": self.last_used}
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> "UsageStats":
+        stats = cls()
+        stats.counts = {name: int(count) for name, count in data.get("counts", {}).items()}
+        stats.latencies = {name: float(latency) for name, latency in data.get("latencies", {}).items()}
+        stats.last_used = {name: float(timestamp) for name, timestamp in data.get("last_used", {}).items()}
+        return stats
+
+
+class UsageLog:
+    """Journal d'usage en ajout seul, une ligne ``horodatage<TAB>action<TAB>latence`` par événement
+
+    Les lots sont ajoutés à la fin de ``usage.log``. Au-delà de ``segment_size``
+    octets, le fichier devient un segment numéroté ; au-delà de
+    ``max_segments`` segments, les plus anciens sont agrégés dans
+    ``usage-summary.json`` puis supprimés. Le chargement ne lit donc jamais plus
+    que le résumé et quelques segments, quelle que soit la durée d'utilisation.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        segment_size: int = TELEMETRY_SEGMENT_SIZE,
+        max_segments: int = TELEMETRY_MAX_SEGMENTS,
+    ) -> None:
+        self.directory = directory
+        self.segment_size = segment_size
+        self.max_segments = max_segments
+        # Écritures du pool de threads et écriture finale à la fermeture
+        self._lock = threading.Lock()
+
+    @property
+    def current_path(self) -> Path:
+        return self.directory / CURRENT_FILE
+
+    @property
+    def summary_path(self) -> Path:
+        return self.directory / SUMMARY_FILE
+
+    def segments(self) -> list[Path]:
+        """Segments du plus ancien au plus récent"""
+        return sorted(self.directory.glob("usage-*.log"), key=lambda path: int(path.stem.removeprefix("usage-")))
+
+    def append(self, events: list[UsageEvent]) -> None:
+        if not events:
+            return
+
+        lines = "".join(f"{timestamp:.3f}\t{name}\t{latency:.3f}\n" for timestamp, name, latency in events)
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(self.current_path, "a", encoding="utf-8") as file:
+                file.write(lines)
+                size = file.tell()
+            if size >= self.segment_size:
+                self._rotate()
+
+    def load(self) -> UsageStats:
+        """Agrège le résumé, les segments et le fichier courant"""
+        with self._lock:
+            stats = self._read_summary()
+            for path in [*self.segments(), self.current_path]:
+                self._aggregate(path, stats)
+        return stats
+
+    def _rotate(self) -> None:
+        segments = self.segments()
+        number = int(segments[-1].stem.removeprefix("usage-")) + 1 if segments else 1
+        segments.append(self.current_path.replace(self.directory / f"usage-{number}.log"))
+
+        if len(segments) <= self.max_segments:
+            return
+
+        summary = self._read_summary()
+        expired = segments[: len(segments) - self.max_segments]
+        for path in expired:
+            self._aggregate(path, summary)
+        # Résumé remplacé atomiquement avant de supprimer les segments qu'il contient
+        temporary_path = self.summary_path.with_name(f".{SUMMARY_FILE}.tmp")
+        temporary_path.write_text(json.dumps(summary.to_json()), encoding="utf-8")
+        temporary_path.replace(self.summary_path)
+        for path in expired:
+            path.unlink()
+
+    def _read_summary(self) -> UsageStats:
+        if not self.summary_path.exists():
+            return UsageStats()
+        try:
+            return UsageStats.from_json(json.loads(self.summary_path.read_text(encoding="utf-8")))
+        except (ValueError, AttributeError):
+            return UsageStats()
+
+    @staticmethod
+    def _aggregate(path: Path, stats: UsageStats) -> None:
+        if not path.exists():
+            return
+
+        # Boucle directe sur les dictionnaires : le chargement se fait une fois par démarrage
+        counts, latencies, last_used = stats.counts, stats.latencies, stats.last_used
+        with open(path, encoding="utf-8") as file:
+            for line in file:
+                try:
+                    timestamp, name, latency = line.split("\t")
+                    moment, duration = float(timestamp), float(latency)
+                except ValueError:
+                    # Ligne tronquée par un arrêt brutal
+                    continue
+                counts[name] = counts.get(name, 0) + 1
+                latencies[name] = latencies.get(name, 0.0) + duration
+                if moment > last_used.get(name, 0.0):
+                    last_used[name] = moment
+
+
+class UsageFlushWorker(FileIOWorker):
+    """Ajoute un lot d'événements au journal depuis le pool de threads"""
+
+    def __init__(self, log: UsageLog, events: list[UsageEvent]) -> None:
+        super().__init__(log.current_path)
+        self.log = log
+        self.events = events
+
+    def work(self) -> int:
+        self.log.append(self.events)
+        return len(self.events)
+
+
+class UsageLoadWorker(FileIOWorker):
+    """Charge l'historique d'usage depuis le pool de threads"""
+
+    def __init__(self, log: UsageLog) -> None:
+        super().__init__(log.directory)
+        self.log = log
+
+    def work(self) -> UsageStats:
+        return self.log.load()
+
+
+class UsageRecorder(QObject):
+    """Statistiques d'usage des actions, persistées d'une session à l'autre
+
+    ``record`` ne fait qu'ajouter un événement en mémoire : aucune écriture
+    disque sur le chemin d'une action. Les événements sont écrits par lots,
+    dans le pool de threads, dès ``batch_size`` événements ou au plus tard
+    ``flush_interval`` ms après le premier. Écritures et chargement passent
+    par un seul worker à la fois : l'historique chargé contient exactement
+    les lots déjà écrits, auxquels s'ajoutent les événements en attente.
+
+    Un historique illisible n'est pas rechargé : seules les statistiques de la
+    session sont émises. Si les écritures ne suivent pas, au plus
+    ``max_pending`` événements restent en attente, les plus récents.
+    """
+
+    loaded = pyqtSignal(object)  # UsageStats : historique et session en cours
+
+    def __init__(
+        self,
+        log: UsageLog,
+        thread_pool: QThreadPool | None = None,
+        batch_size: int = TELEMETRY_BATCH_SIZE,
+        flush_interval: int = TELEMETRY_FLUSH_INTERVAL,
+        max_pending: int = TELEMETRY_MAX_PENDING,
+        parent: QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self.log = log
+        self.thread_pool = thread_pool or QThreadPool.globalInstance()
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self.pending: list[UsageEvent] = []
+        # Session seule jusqu'au chargement, puis historique et session
+        self.stats = UsageStats()
+        self.history_loaded = False
+        # Faux après un échec du chargement : l'historique n'est plus demandé
+        self.history_available = True
+        self.load_requested = False
+        # Worker en cours, gardé en vie jusqu'à sa fin
+        self.worker: FileIOWorker | None = None
+
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(flush_interval)
+        self.flush_timer.timeout.connect(self.flush)
+
+    def record(self, name: str, latency: float) -> None:
+        timestamp = time.time()
+        self.pending.append((timestamp, name, latency))
+        if len(self.pending) > self.max_pending:
+            del self.pending[: len(self.pending) - self.max_pending]
+        self.stats.add(timestamp, name, latency)
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+        elif not self.flush_timer.isActive():
+            self.flush_timer.start()
+
+    def flush(self) -> None:
+        """Confie les événements en attente au pool de threads (après le worker en cours s'il y en a un)"""
+        self.flush_timer.stop()
+        if not self.pending or self.worker is not None or self.thread_pool is None:
+            return
+
+        events, self.pending = self.pending, []
+        worker = UsageFlushWorker(self.log, events)
+        worker.signals.finished.connect(self.on_worker_done)
+        worker.signals.failed.connect(self.on_worker_done)
+        self.start_worker(worker)
+
+    def load(self) -> None:
+        """Charge l'historique en arrière-plan, ``loaded`` est émis à la fin"""
+        if self.history_loaded or not self.history_available:
+            self.loaded.emit(self.stats)
+            return
+
+        self.load_requested = True
+        if self.worker is not None or self.thread_pool is None:
+            return
+
+        worker = UsageLoadWorker(self.log)
+        worker.signals.finished.connect(self.on_loaded)
+        worker.signals.failed.connect(self.on_load_failed)
+        self.start_worker(worker)
+
+    def start_worker(self, worker: FileIOWorker) -> None:
+        if self.thread_pool is None:
+            return
+        self.worker = worker
+        self.thread_pool.start(worker)
+
+    def on_loaded(self, history: UsageStats) -> None:
+        self.load_requested = False
+        self.history_loaded = True
+        for event in self.pending:
+            history.add(*event)
+        self.stats = history
+        self.loaded.emit(self.stats)
+        self.on_worker_done()
+
+    def on_load_failed(self, message: str) -> None:
+        """Historique illisible : pas de nouvelle tentative, statistiques de la session seules"""
+        logger.warning("historique d'usage indisponible : %s", message)
+        self.load_requested = False
+        self.history_available = False
+        self.loaded.emit(self.stats)
+        self.on_worker_done()
+
+    def on_worker_done(self) -> None:
+        """Enchaîne le chargement demandé ou les événements arrivés pendant le worker précédent"""
+        self.worker = None
+        if self.load_requested and not self.history_loaded:
+            self.load()
+        elif len(self.pending) >= self.batch_size:
+            self.flush()
+        elif self.pending and not self.flush_timer.isActive():
+            self.flush_timer.start()
+
+    def close(self) -> None:
+        """Écrit les derniers événements sur le thread appelant (fermeture de l'application)"""
+        self.flush_timer.stop()
+        events, self.pending = self.pending, []
+        try:
+            self.log.append(events)
+        except OSError as e:
+            # Les statistiques ne doivent jamais empêcher la fermeture
+            logger.warning("statistiques d'usage non écrites : %s", e)
@@ -0,0 +1,111 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
+from enum import IntFlag
+
+
+class TextStyle(IntFlag):
+    NONE = 0
+    BOLD = 1
+    ITALIC = 2
+
+
+class StyleRuns:
+    """Styles du document stockés par plages (run-length)
+
+    ``starts[i]`` est la position du premier octet du run ``i`` et
+    ``styles[i]`` son style ; le dernier run s'étend jusqu'à la fin du
+    document. Deux runs voisins ont toujours des styles différents, si bien
+    que la mémoire dépend du nombre de changements de style et non de la
+    taille du texte. Formater une plage coûte O(log n) pour la localiser
+    plus O(k) pour les k runs qu'elle recouvre.
+    """
+
+    def __init__(self) -> None:
+        self.starts = array("q", [0])
+        self.styles = array("B", [TextStyle.NONE])
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def style_at(self, offset: int) -> TextStyle:
+        return TextStyle(self.styles[bisect_right(self.starts, offset) - 1])
+
+    def runs(self, start: int, end: int) -> Iterator[tuple[int, int, TextStyle]]:
+        """Runs (début, fin, style) qui recouvrent ``[start, end)``, bornés à cette plage"""
+        index = bisect_right(self.starts, start) - 1
+        while index < len(self.starts) and self.starts[index] < end:
+            run_end = self.starts[index + 1] if index + 1 < len(self.starts) else end
+            yield max(start, self.starts[index]), min(end, run_end), TextStyle(self.styles[index])
+            index += 1
+
+    def has_style(self, start: int, end: int, style: TextStyle) -> bool:
+        """Vrai si toute la plage porte le style"""
+        return all(run_style & style for _, _, run_style in self.runs(start, end))
+
+    def toggle(self, start: int, end: int, style: TextStyle) -> bool:
+        """Ajoute le style à la plage, ou le retire si elle le porte déjà entièrement ; retourne le nouvel état"""
+        enabled = not self.has_style(start, end, style)
+        self.apply(start, end, style, enabled)
+        return enabled
+
+    def apply(self, start: int, end: int, style: TextStyle, enabled: bool) -> None:
+        if start >= end:
+            return
+
+        first = self._split(start)
+        last = self._split(end)
+        for index in range(first, last):
+            self.styles[index] = self.styles[index] | style if enabled else self.styles[index] & ~style
+        self._merge(max(0, first - 1), last + 1)
+
+    def set_style(self, start: int, end: int, style: TextStyle) -> None:
+        """Remplace le style de toute la plage (restauration d'un état antérieur)"""
+        if start >= end:
+            return
+
+        first = self._split(start)
+        last = self._split(end)
+        for index in range(first, last):
+            self.styles[index] = style
+        self._merge(max(0, first - 1), last + 1)
+
+    def insert(self, offset: int, length: int) -> None:
+        """Décale les runs après une insertion ; le texte inséré prend le style du caractère précédent"""
+        self._shift(max(1, bisect_left(self.starts, offset)), length)
+
+    def delete(self, start: int, end: int) -> None:
+        """Retire les runs de la plage supprimée et décale les suivants"""
+        if start >= end:
+            return
+
+        first = self._split(start)
+        last = self._split(end)
+        del self.starts[first:last]
+        del self.styles[first:last]
+        self._shift(first, start - end)
+        self._merge(max(0, first - 1), first + 1)
+
+    def _shift(self, first: int, delta: int) -> None:
+        """Décale les débuts de run à partir de l'indice ``first``"""
+        if first < len(self.starts):
+            self.starts[first:] = array("q", [start + delta for start in self.starts[first:]])
+
+    def _split(self, offset: int) -> int:
+        """Indice du run qui commence à ``offset``, en coupant le run qui le contient si besoin"""
+        index = bisect_right(self.starts, offset) - 1
+        if self.starts[index] == offset:
+            return index
+
+        self.starts.insert(index + 1, offset)
+        self.styles.insert(index + 1, self.styles[index])
+        return index + 1
+
+    def _merge(self, first: int, last: int) -> None:
+        """Fusionne les runs voisins de même style entre les indices ``first`` et ``last``"""
+        index = min(last, len(self.starts) - 1)
+        while index > first:
+            if self.styles[index] == self.styles[index - 1]:
+                del self.starts[index]
+                del self.styles[index]
+            index -= 1
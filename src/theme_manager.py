@@ -0,0 +1,82 @@
+from collections.abc import Callable
+from pathlib import Path
+from typing import Literal
+
+from PyQt6.QtWidgets import QWidget
+
+from src.domain.constants import CSS_DARK_FILE_PATH, CSS_LIGHT_FILE_PATH
+from src.utils import load_css
+
+Theme = Literal["light", "dark"]
+
+THEME_FILES: dict[Theme, Path] = {
+    "light": CSS_LIGHT_FILE_PATH,
+    "dark": CSS_DARK_FILE_PATH,
+}
+
+
+class ThemeManager:
+    """Charge les feuilles de style une seule fois et les applique sans travail inutile"""
+
+    def __init__(
+        self,
+        theme_files: dict[Theme, Path] | None = None,
+        extra_stylesheet: Callable[[], str] | None = None,
+    ) -> None:
+        self.theme_files = dict(THEME_FILES if theme_files is None else theme_files)
+        # Règles ajoutées à chaque thème (ex: styles des notifications)
+        self.extra_stylesheet = extra_stylesheet
+        # Cache des feuilles de style : chemin -> (mtime, contenu validé)
+        self._cache: dict[Path, tuple[int, str]] = {}
+        # Feuilles complètes (règles supplémentaires comprises) par fichier de thème : chemin -> (mtime, contenu)
+        self._full_cache: dict[Path, tuple[int, str]] = {}
+        self.current_theme: Theme | None = None
+
+    def stylesheet(self, theme: Theme) -> str:
+        """Retourne la feuille de style du thème, relue uniquement si le fichier a changé"""
+        path = self.theme_files[theme]
+        mtime = path.stat().st_mtime_ns
+
+        if (cached := self._cache.get(path)) is not None and cached[0] == mtime:
+            return cached[1]
+
+        css = load_css(path)
+        self._cache[path] = (mtime, css)
+        return css
+
+    def full_stylesheet(self, theme: Theme) -> str:
+        """Feuille du thème suivie des règles supplémentaires, reconstruite uniquement si le fichier a changé"""
+        path = self.theme_files[theme]
+        mtime = path.stat().st_mtime_ns
+
+        if (cached := self._full_cache.get(path)) is not None and cached[0] == mtime:
+            return cached[1]
+
+        css = self.stylesheet(theme)
+        if self.extra_stylesheet is not None:
+            css += self.extra_stylesheet()
+        self._full_cache[path] = (mtime, css)
+        return css
+
+    def apply(self, widget: QWidget, theme: Theme) -> bool:
+        """Applique le thème au widget, retourne False si le thème était déjà actif"""
+        if theme == self.current_theme:
+            return False
+
+        widget.setStyleSheet(self.full_stylesheet(theme))
+        self.current_theme = theme
+        return True
+
+    def refresh(self, widget: QWidget) -> bool:
+        """Réapplique le thème actif (règles supplémentaires modifiées), False si aucun thème n'est actif"""
+        self._full_cache.clear()
+        if (theme := self.current_theme) is None:
+            return False
+        self.current_theme = None
+        return self.apply(widget, theme)
+
+    def invalidate(self) -> None:
+        """Vide le cache et force la prochaine application du thème"""
+        self._cache.clear()
+        self._full_cache.clear()
+        self.current_theme = None
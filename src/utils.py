@@ -10,3 +10,13 @@ def load_css(path: Path) -> str:
 
     with open(path, "r") as file:
         return file.read()
+
+
+def format_size(size: int) -> str:
+    """Taille lisible en octets, Kio, Mio ou Gio"""
+    value = float(size)
+    for unit in ("o", "Kio", "Mio"):
+        if value < 1024:
+            return f"{value:.0f} {unit}" if unit == "o" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} Gio"
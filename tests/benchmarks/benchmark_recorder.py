@@ -0,0 +1,26 @@
+import pytest
+
+
+class BenchmarkRecorder:
+    """Collecte les mesures et les compare à la référence enregistrée"""
+
+    def __init__(self, baseline: dict[str, float], threshold: float, require_baseline: bool = True) -> None:
+        self.baseline = baseline
+        self.threshold = threshold
+        # Une mesure sans référence ne détecterait aucune régression (sauf à l'enregistrement de la référence)
+        self.require_baseline = require_baseline
+        self.results: dict[str, dict[str, float | str]] = {}
+
+    def record(self, name: str, value: float, unit: str, floor: float = 0.0) -> None:
+        """Enregistre une mesure et échoue si elle dépasse la référence au-delà du seuil"""
+        self.results[name] = {"value": value, "unit": unit}
+        print(f"\n[benchmark] {name}: {value:.3f} {unit}")
+
+        if (reference := self.baseline.get(name)) is None:
+            if self.require_baseline:
+                pytest.fail(f"Pas de référence pour {name} : l'ajouter avec --benchmark-save-baseline")
+            return
+
+        limit = max(reference * self.threshold, floor)
+        if value > limit:
+            pytest.fail(f"Régression {name}: {value:.3f} {unit} > {limit:.3f} {unit} (référence {reference:.3f})")
@@ -0,0 +1,48 @@
+import json
+import platform
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from benchmark_recorder import BenchmarkRecorder
+from PyQt6.QtCore import PYQT_VERSION_STR, QT_VERSION_STR
+
+
+def load_baseline(path: Path) -> dict[str, float]:
+    if not path.exists():
+        return {}
+
+    data = json.loads(path.read_text())
+    return {name: float(metric["value"]) for name, metric in data["metrics"].items()}
+
+
+@pytest.fixture(scope="session")
+def benchmark_recorder(
+    request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory
+) -> Iterator[BenchmarkRecorder]:
+    config = request.config
+    baseline_path = Path(config.getoption("--benchmark-baseline"))
+    if (results_option := config.getoption("--benchmark-json")) is not None:
+        results_path = Path(results_option)
+    else:
+        results_path = tmp_path_factory.mktemp("benchmarks") / "results.json"
+
+    save_baseline = config.getoption("--benchmark-save-baseline")
+    recorder = BenchmarkRecorder(
+        load_baseline(baseline_path), config.getoption("--benchmark-threshold"), require_baseline=not save_baseline
+    )
+    yield recorder
+
+    report = {
+        "python": platform.python_version(),
+        "qt": QT_VERSION_STR,
+        "pyqt": PYQT_VERSION_STR,
+        "platform": platform.platform(),
+        "metrics": recorder.results,
+    }
+    results_path.parent.mkdir(parents=True, exist_ok=True)
+    results_path.write_text(json.dumps(report, indent=2) + "\n")
+    print(f"\n[benchmark] résultats : {results_path}")
+
+    if save_baseline:
+        baseline_path.write_text(json.dumps(report, indent=2) + "\n")
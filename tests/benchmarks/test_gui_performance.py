@@ -0,0 +1,208 @@
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+
+import pytest
+from benchmark_recorder import BenchmarkRecorder
+from PyQt6.QtCore import QPoint
+from PyQt6.QtWidgets import QApplication
+
+from benchmarks.bench_startup import run as run_startup
+from src.document import Document
+from src.domain.constants import STARTUP_FIRST_FRAME_BUDGET
+from src.main_windows import MainWindow
+from src.search_index import TextSnapshot
+from src.telemetry import UsageLog
+from src.text_styles import TextStyle
+
+# Mesures de temps réel : exclues de l'exécution par défaut (voir ``addopts``), lancées par ``-m benchmark``
+pytestmark = pytest.mark.benchmark
+
+
+def test_window_construction(qapp: QApplication, benchmark_recorder: BenchmarkRecorder) -> None:
+    timings = []
+    for _ in range(10):
+        start = time.perf_counter()
+        window = MainWindow()
+        window.show()
+        qapp.processEvents()
+        timings.append((time.perf_counter() - start) * 1000)
+        window.close()
+        window.deleteLater()
+
+    benchmark_recorder.record("window_construction", statistics.median(timings), "ms", floor=50)
+
+
+def test_theme_switch_latency(qapp: QApplication, benchmark_recorder: BenchmarkRecorder) -> None:
+    window = MainWindow()
+    window.show()
+    qapp.processEvents()
+
+    iterations = 200
+    start = time.perf_counter()
+    for i in range(iterations):
+        window.theme_manager.apply(window, ("dark", "light")[i % 2])
+    elapsed = time.perf_counter() - start
+
+    benchmark_recorder.record("theme_switch", elapsed / iterations * 1e6, "us", floor=10_000)
+    window.close()
+
+
+def test_notification_throughput(qapp: QApplication, benchmark_recorder: BenchmarkRecorder) -> None:
+    window = MainWindow()
+    window.show()
+    qapp.processEvents()
+    window.setup_notifications()
+    pool = window.notification_pool
+    assert pool is not None
+
+    iterations = 2000
+    start = time.perf_counter()
+    for i in range(iterations):
+        window.display_notification(f"Message {i}", ("info", "success", "warning", "error")[i % 4])
+        # Expiration immédiate pour mesurer le cycle affichage/suppression
+        if (latest := pool.latest()) is not None:
+            pool.release(latest)
+    qapp.processEvents()
+    elapsed = time.perf_counter() - start
+
+    benchmark_recorder.record("notification_cycle", elapsed / iterations * 1e6, "us", floor=1000)
+    window.close()
+
+
+def test_action_trigger_latency(qapp: QApplication, benchmark_recorder: BenchmarkRecorder) -> None:
+    window = MainWindow()
+    window.show()
+    qapp.processEvents()
+
+    iterations = 2000
+    start = time.perf_counter()
+    for _ in range(iterations):
+        window.copy_action.trigger()
+    qapp.processEvents()
+    elapsed = time.perf_counter() - start
+
+    benchmark_recorder.record("action_trigger", elapsed / iterations * 1e6, "us", floor=500)
+    window.close()
+
+
+def test_memory_growth(qapp: QApplication, benchmark_recorder: BenchmarkRecorder) -> None:
+    window = MainWindow()
+    window.show()
+    qapp.processEvents()
+    # Chaque nouvel onglet est refermé : seule une fuite ferait croître la mémoire
+    actions = [
+        window.copy_action,
+        window.cut_action,
+        window.paste_action,
+        window.bold_action,
+        window.new_action,
+        window.close_tab_action,
+    ]
+
+    # Échauffement : caches et menus construits avant la mesure
+    for action in actions:
+        action.trigger()
+    window.show_context_menu(QPoint(400, 300))
+    qapp.processEvents()
+
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    for i in range(5000):
+        actions[i % len(actions)].trigger()
+        if i % 100 == 0:
+            window.show_context_menu(QPoint(400, 300))
+            qapp.processEvents()
+    qapp.processEvents()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    growth_kib = (current - baseline) / 1024
+    benchmark_recorder.record("memory_growth", growth_kib, "KiB", floor=512)
+    window.close()
+
+
+def test_document_edit_throughput(benchmark_recorder: BenchmarkRecorder) -> None:
+    document = Document(content=b"ligne de journal assez longue pour un document de plusieurs Mo\n" * 100_000)
+    step = document.size // 1000
+
+    start = time.perf_counter()
+    for i in range(1000):
+        document.insert(i * step, b"x\n")
+        document.delete(i * step + 1, i * step + 3)
+    elapsed = time.perf_counter() - start
+
+    benchmark_recorder.record("document_edit", elapsed / 2000 * 1e6, "us", floor=1000)
+
+
+def test_format_toggle_latency(benchmark_recorder: BenchmarkRecorder) -> None:
+    document = Document(content=b"ligne de journal assez longue pour un document de plusieurs Mo\n" * 100_000)
+    step = document.size // 1000
+
+    start = time.perf_counter()
+    for i in range(1000):
+        document.toggle_style(i * step, document.size - i * step, (TextStyle.BOLD, TextStyle.ITALIC)[i % 2])
+    elapsed = time.perf_counter() - start
+
+    benchmark_recorder.record("format_toggle", elapsed / 1000 * 1e6, "us", floor=200)
+
+
+def test_usage_history_load(tmp_path: Path, benchmark_recorder: BenchmarkRecorder) -> None:
+    # Journal plein : segments conservés et fichier courant, environ 200 000 événements
+    log = UsageLog(tmp_path)
+    names = ["copy", "cut", "paste", "undo", "redo", "bold", "italic", "save"]
+    for batch in range(800):
+        log.append([(1.7e9 + batch, names[i % len(names)], 0.25) for i in range(256)])
+
+    start = time.perf_counter()
+    stats = log.load()
+    elapsed = time.perf_counter() - start
+
+    assert stats.total > 0
+    benchmark_recorder.record("usage_load", elapsed * 1000, "ms", floor=500)
+
+
+def test_tab_switch_latency(qapp: QApplication, benchmark_recorder: BenchmarkRecorder) -> None:
+    window = MainWindow()
+    window.show()
+    window.set_document(Document(content=b"ligne de journal\n" * 10_000))
+    for _ in range(199):
+        window.add_tab(Document(content=b"ligne de journal\n" * 10_000))
+    qapp.processEvents()
+
+    timings = []
+    for i in range(400):
+        start = time.perf_counter()
+        window.tab_bar.setCurrentIndex(i * 7 % 200)
+        qapp.processEvents()
+        timings.append((time.perf_counter() - start) * 1e6)
+
+    benchmark_recorder.record("tab_switch", statistics.median(timings), "us", floor=5000)
+    window.close()
+
+
+def test_search_query_latency(benchmark_recorder: BenchmarkRecorder) -> None:
+    # 16 Mio indexés, un mot rare : seuls quelques blocs sont relus
+    line = b"2024-01-01 12:00:00,000 INFO requete traitee en 12 ms pour /api/v1/documents\n"
+    document = Document(content=(line * 20_000 + b"erreur inattendue\n") * 10)
+    document.search_index.index_original()
+
+    timings = []
+    for _ in range(50):
+        start = time.perf_counter()
+        found = [
+            offset
+            for batch in document.search_index.search(b"inattendu", TextSnapshot(document.text))
+            for offset in batch
+        ]
+        timings.append((time.perf_counter() - start) * 1000)
+
+    assert len(found) == 10
+    benchmark_recorder.record("search_query", statistics.median(timings), "ms", floor=20)
+
+
+def test_startup_first_frame(benchmark_recorder: BenchmarkRecorder) -> None:
+    # Processus neufs : imports de PyQt, QApplication et écran de démarrage peint
+    timings = run_startup("splash", 5)
+    benchmark_recorder.record("startup_first_frame", statistics.median(timings), "ms", floor=STARTUP_FIRST_FRAME_BUDGET)
@@ -0,0 +1,65 @@
+import gc
+import os
+from collections.abc import Iterator
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+# Une icône manquante fait échouer les tests au lieu d'être remplacée par une icône vide
+os.environ.setdefault("PYQT_TP_STRICT_ICONS", "1")
+
+from PyQt6.QtWidgets import QApplication, QMessageBox  # noqa: E402
+
+from src.main_windows import MainWindow  # noqa: E402
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("benchmark", "Benchmarks GUI (tests/benchmarks)")
+    group.addoption(
+        "--benchmark-json",
+        default=None,
+        help="Fichier JSON où écrire les résultats des benchmarks (par défaut dans le répertoire temporaire de pytest)",
+    )
+    group.addoption(
+        "--benchmark-baseline",
+        default="tests/benchmarks/baseline.json",
+        help="Fichier JSON de référence auquel comparer les résultats",
+    )
+    group.addoption(
+        "--benchmark-threshold",
+        type=float,
+        default=3.0,
+        help="Échec si une mesure dépasse la référence multipliée par ce facteur",
+    )
+    group.addoption(
+        "--benchmark-save-baseline",
+        action="store_true",
+        help="Remplace la référence par les résultats de cette exécution",
+    )
+
+
+@pytest.fixture(scope="session")
+def qapp() -> QApplication:
+    app = QApplication.instance()
+    if not isinstance(app, QApplication):
+        app = QApplication([])
+    return app
+
+
+@pytest.fixture(autouse=True)
+def collect_windows() -> Iterator[None]:
+    """Libère les fenêtres du test dans le thread principal
+
+    Une fenêtre prise dans un cycle de références serait sinon détruite par le
+    ramasse-miettes à un moment quelconque, éventuellement dans un thread de
+    travail d'un test suivant : Qt interdit de détruire un widget hors du
+    thread de l'interface (plantage).
+    """
+    yield
+    gc.collect()
+
+
+@pytest.fixture(autouse=True)
+def discard_unsaved_changes(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Fermer une fenêtre aux documents modifiés ne doit pas ouvrir de boîte modale : modifications abandonnées"""
+    monkeypatch.setattr(MainWindow, "ask_unsaved_changes", lambda _self, _document: QMessageBox.StandardButton.Discard)
@@ -0,0 +1,12 @@
+import time
+from collections.abc import Callable
+
+from PyQt6.QtWidgets import QApplication
+
+
+def wait_until(qapp: QApplication, predicate: Callable[[], bool], timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "Délai dépassé"
+        qapp.processEvents()
+        time.sleep(0.001)
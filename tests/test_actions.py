@@ -0,0 +1,101 @@
+import pytest
+from PyQt6.QtGui import QGuiApplication
+from PyQt6.QtWidgets import QApplication
+
+from src.actions import ACTIONS, MENU_LAYOUT, TOOLBAR_LAYOUT, ActionFeedback, ActionSpec, register_action
+from src.document import Document
+from src.main_windows import MainWindow
+from src.text_styles import TextStyle
+
+
+def test_layouts_reference_registered_actions() -> None:
+    for layout in [*MENU_LAYOUT.values(), TOOLBAR_LAYOUT]:
+        for name in layout:
+            assert name is None or name in ACTIONS
+
+
+def test_dispatch_updates_counter_and_state(qapp: QApplication) -> None:
+    window = MainWindow()
+    window.set_document(Document(content=b"bonjour"))
+    window.document_view.select_all()
+    counter = window.action_counter
+
+    window.bold_action.trigger()
+    window.copy_action.trigger()
+    window.paste_action.trigger()
+    qapp.processEvents()
+
+    assert window.is_bold is True
+    assert window.document.read(0, window.document.size) == b"bonjour"
+    assert window.action_counter == counter + 3
+    assert window.action_counter_label.text() == f"Actions: {window.action_counter}"
+    window.close()
+
+
+@pytest.mark.usefixtures("qapp")
+def test_registered_action_is_created_by_window() -> None:
+    spec = register_action(
+        ActionSpec("hello", "Bonjour", lambda _window: ActionFeedback("Bonjour", "Bonjour !", "info"), "Ctrl+B")
+    )
+    try:
+        window = MainWindow()
+        action = window.actions_by_name["hello"]
+        assert action.shortcut().toString() == "Ctrl+B"
+        assert action in window.actions()
+
+        action.trigger()
+        assert window.notification_pool is not None
+        latest = window.notification_pool.latest()
+        assert latest is not None
+        assert latest.message == "Bonjour !"
+        window.close()
+    finally:
+        del ACTIONS[spec.name]
+
+
+@pytest.mark.usefixtures("qapp")
+def test_format_actions_apply_to_selection() -> None:
+    window = MainWindow()
+    window.set_document(Document(content=b"normal gras normal"))
+
+    window.document_view.set_selection(7, 11)
+    window.bold_action.trigger()
+    assert window.is_bold is True
+    assert list(window.document.styles.runs(0, window.document.size)) == [
+        (0, 7, TextStyle.NONE),
+        (7, 11, TextStyle.BOLD),
+        (11, 18, TextStyle.NONE),
+    ]
+
+    window.bold_action.trigger()
+    assert window.is_bold is False
+    assert len(window.document.styles) == 1
+
+    # Sans sélection, seul l'état de saisie change
+    window.document_view.set_caret(0)
+    window.italic_action.trigger()
+    assert window.is_italic is True
+    assert len(window.document.styles) == 1
+    window.close()
+
+
+@pytest.mark.usefixtures("qapp")
+def test_new_document_is_not_saveable_and_styles_wait_for_edits() -> None:
+    clipboard = QGuiApplication.clipboard()
+    assert clipboard is not None
+    clipboard.setText("x\n" * 1_000_000)
+    window = MainWindow()
+    window.new_action.trigger()
+    assert not window.save_action.isEnabled()
+
+    # Collage en cours : les styles ne changent pas, l'action garde l'état réel
+    window.set_document(Document(content=b"texte"))
+    window.document_view.set_selection(0, 5)
+    assert window.paste_clipboard() is not None
+    assert window.is_busy()
+    window.bold_action.trigger()
+    window.italic_action.trigger()
+    assert not window.is_bold and not window.bold_action.isChecked()
+    assert not window.is_italic and not window.italic_action.isChecked()
+    window.close()
+    clipboard.clear()
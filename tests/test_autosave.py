@@ -0,0 +1,166 @@
+from pathlib import Path
+
+import pytest
+from PyQt6.QtWidgets import QApplication
+
+from src.autosave import Autosave, AutosaveSnapshot, AutosaveStore
+from src.document import Document
+from src.main_windows import MainWindow
+from src.text_styles import TextStyle
+from helpers import wait_until
+
+
+def text(document: Document) -> bytes:
+    return document.read(0, document.size)
+
+
+def test_modified_follows_undo_and_saves() -> None:
+    document = Document(content=b"abc")
+    assert not document.modified
+
+    document.insert(3, b"d")
+    assert document.modified
+    document.undo()
+    assert not document.modified
+    document.redo()
+
+    # Sauvegarde de l'état courant, modifiée pendant l'écriture : la frappe suivante ne fusionne pas
+    position = document.history.checkpoint()
+    document.insert(4, b"e", merge=True)
+    document.history.set_clean(position)
+    assert document.modified
+    document.undo()
+    assert not document.modified
+
+    # L'état sauvegardé est abandonné par une nouvelle branche
+    document.undo()
+    document.insert(0, b"z")
+    document.undo()
+    assert document.modified
+
+
+def test_store_writes_only_new_text(tmp_path: Path) -> None:
+    store = AutosaveStore(tmp_path)
+    document = Document(content=b"ligne\n" * 10_000)
+    document.insert(6, b"nouvelle ")
+    document.toggle_style(0, 5, TextStyle.BOLD)
+
+    first = store.write(AutosaveSnapshot("doc", document, 0, first=True))
+    assert first > document.size
+    assert store.read("doc") == text(document)
+
+    document.insert(0, b"debut ")
+    document.delete(100, 200)
+    second = store.write(AutosaveSnapshot("doc", document, len(b"nouvelle "), first=False))
+    assert second < 1024
+    assert store.read("doc") == text(document)
+    assert not list(tmp_path.glob(".*.tmp"))
+
+
+def test_failed_replace_leaves_no_temporary_file(tmp_path: Path) -> None:
+    # Erreur autre qu'une erreur d'entrée/sortie pendant l'écriture du fichier temporaire
+    with pytest.raises(TypeError):
+        AutosaveStore._replace(tmp_path / "doc.json", "pas des octets")  # type: ignore[arg-type]
+    assert not list(tmp_path.iterdir())
+
+
+def test_store_links_opened_file(tmp_path: Path) -> None:
+    source = tmp_path / "journal.log"
+    source.write_bytes(b"entree\n" * 100_000)
+    store = AutosaveStore(tmp_path / "autosave")
+    document = Document.open(source)
+    document.insert(0, b"tete\n")
+
+    assert store.write(AutosaveSnapshot("doc", document, 0, first=True)) < 1024
+    expected = text(document)
+    # Sauvegarde par renommage : le lien garde le contenu projeté
+    replacement = tmp_path / "journal.tmp"
+    replacement.write_bytes(b"autre contenu")
+    replacement.replace(source)
+    assert store.read("doc") == expected
+    document.close()
+
+
+def test_bursts_are_coalesced(qapp: QApplication, tmp_path: Path) -> None:
+    autosave = Autosave(AutosaveStore(tmp_path), idle_interval=50)
+    saves: list[int] = []
+    autosave.saved.connect(lambda written, _duration: saves.append(written))
+    document = Document(content=b"")
+
+    for i in range(100):
+        document.insert(i, b"x")
+        autosave.schedule(document)
+    wait_until(qapp, lambda: bool(saves) and autosave.worker is None)
+    qapp.processEvents()
+
+    assert len(saves) == 1
+    assert (key := autosave.key(document)) is not None
+    assert AutosaveStore(tmp_path).read(key) == b"x" * 100
+
+
+def test_closed_document_is_skipped_and_errors_are_reported(qapp: QApplication, tmp_path: Path) -> None:
+    source = tmp_path / "journal.log"
+    source.write_bytes(b"entree\n" * 1000)
+    store = AutosaveStore(tmp_path / "autosave")
+    autosave = Autosave(store, idle_interval=10_000)
+    failures: list[str] = []
+    autosave.failed.connect(failures.append)
+
+    def broken_write(_snapshot: AutosaveSnapshot) -> int:
+        raise ValueError("bogue")
+
+    document = Document(content=b"")
+    document.insert(0, b"x")
+    store.write = broken_write  # type: ignore[method-assign]
+    autosave.schedule(document)
+    autosave.save()
+    wait_until(qapp, lambda: autosave.worker is None)
+    assert failures == ["ValueError : bogue"]
+
+    # Document fermé avant le démarrage de l'écriture : annulée sans rien écrire
+    document = Document.open(source)
+    document.insert(0, b"tete\n")
+    autosave.schedule(document)
+    document.close()
+    autosave.save()
+    wait_until(qapp, lambda: autosave.worker is None)
+    assert failures == ["ValueError : bogue"]
+    assert not store.directory.exists()
+
+
+@pytest.mark.usefixtures("qapp")
+def test_stop_writes_changes_still_waiting(tmp_path: Path) -> None:
+    store = AutosaveStore(tmp_path)
+    autosave = Autosave(store, idle_interval=60_000)
+    document = Document(content=b"brouillon")
+    document.insert(0, b"dernier ")
+    autosave.schedule(document)
+    assert not list(tmp_path.iterdir())
+
+    # Fermeture avant la fin du délai d'inactivité : la modification est tout de même écrite
+    autosave.stop()
+    assert (key := autosave.key(document)) is not None
+    assert store.read(key) == b"dernier brouillon"
+    assert not autosave.timer.isActive()
+
+
+def test_window_autosaves_then_discards_after_save(qapp: QApplication, tmp_path: Path) -> None:
+    store = AutosaveStore(tmp_path / "autosave")
+    window = MainWindow(autosave=Autosave(store, idle_interval=10))
+    window.set_document(Document(content=b"bonjour"))
+    assert not window.save_action.isEnabled()
+
+    window.document_view.set_selection(0, 7)
+    window.bold_action.trigger()
+    assert window.save_action.isEnabled()
+    wait_until(qapp, lambda: list(store.directory.glob("*.json")) != [])
+    wait_until(qapp, lambda: window.autosave_label is not None and window.autosave_label.text() != "Auto : -")
+    assert window.autosave_label is not None
+    assert window.autosave_label.text().startswith("Auto : ")
+
+    assert window.save_file(tmp_path / "bonjour.txt")
+    wait_until(qapp, lambda: window.io_worker is None)
+    assert not window.document.modified
+    assert not window.save_action.isEnabled()
+    wait_until(qapp, lambda: not list(store.directory.glob("*.json")))
+    window.close()
@@ -0,0 +1,153 @@
+import time
+from collections.abc import Iterator
+
+import pytest
+from PyQt6.QtCore import QTimer
+from PyQt6.QtGui import QClipboard, QGuiApplication
+from PyQt6.QtWidgets import QApplication
+
+from src.clipboard import ClipboardMonitor, IncrementalInsert
+from src.document import Document
+from src.main_windows import MainWindow
+from helpers import wait_until
+
+
+@pytest.fixture
+def clipboard(qapp: QApplication) -> Iterator[QClipboard]:
+    clipboard = QGuiApplication.clipboard()
+    assert clipboard is not None
+    clipboard.clear()
+    qapp.processEvents()
+    yield clipboard
+    clipboard.clear()
+
+
+def test_monitor_caches_clipboard_state(clipboard: QClipboard) -> None:
+    monitor = ClipboardMonitor(clipboard)
+    changes: list[bool] = []
+    monitor.changed.connect(changes.append)
+    assert monitor.has_text is False
+
+    clipboard.setText("bonjour")
+    assert monitor.has_text is True
+    assert monitor.text() == "bonjour"
+    clipboard.setText("déjà collé")
+    assert monitor.data() == "déjà collé".encode()
+
+    clipboard.clear()
+    assert monitor.has_text is False
+    assert not monitor.data()
+    assert changes == [True, False]
+
+
+def test_paste_action_follows_clipboard(clipboard: QClipboard) -> None:
+    window = MainWindow()
+    assert not window.paste_action.isEnabled()
+
+    clipboard.setText("bonjour")
+    assert window.paste_action.isEnabled()
+    assert window.has_clipboard_content()
+    window.close()
+
+
+@pytest.mark.usefixtures("clipboard")
+def test_copy_cut_paste_round_trip() -> None:
+    window = MainWindow()
+    window.set_document(Document(content=b"un\ndeux\ntrois"))
+
+    window.document_view.set_selection(3, 8)
+    window.cut_action.trigger()
+    assert window.document.read(0, window.document.size) == b"un\ntrois"
+    assert window.document.line_count == 2
+    assert window.document_view.caret == 3
+
+    window.document_view.set_caret(window.document.size)
+    window.paste_action.trigger()
+    assert window.document.read(0, window.document.size) == b"un\ntroisdeux\n"
+    assert window.document.line_count == 3
+    assert window.save_action.isEnabled()
+
+    window.document_view.set_caret(0)
+    window.copy_action.trigger()
+    latest = window.notification_pool.latest() if window.notification_pool is not None else None
+    assert latest is not None
+    assert latest.message == "Aucun texte sélectionné"
+    window.close()
+
+
+def test_large_paste_is_incremental(qapp: QApplication, clipboard: QClipboard) -> None:
+    line = "ligne de journal collée depuis le presse-papier\n"
+    text = line * (20 * 1024 * 1024 // len(line))
+    clipboard.setText(text)
+    window = MainWindow()
+    jobs: list[IncrementalInsert | None] = []
+
+    gaps: list[float] = []
+    last_beat = time.perf_counter()
+
+    def beat() -> None:
+        nonlocal last_beat
+        now = time.perf_counter()
+        gaps.append(now - last_beat)
+        last_beat = now
+
+    heartbeat = QTimer()
+    heartbeat.setInterval(10)
+    heartbeat.timeout.connect(beat)
+    heartbeat.start()
+
+    # Collage lancé depuis la boucle d'événements : lecture du presse-papier comprise dans la mesure
+    QTimer.singleShot(0, lambda: jobs.append(window.paste_clipboard()))
+    wait_until(qapp, lambda: bool(jobs))
+    assert jobs[0] is not None
+    assert window.is_busy()
+    wait_until(qapp, lambda: window.edit_job is None)
+    heartbeat.stop()
+
+    # La boucle d'événements reste disponible entre deux blocs
+    assert len(gaps) > 10
+    # Lecture du presse-papier (~30 ms pour 20 Mo) et premier bloc compris
+    assert max(gaps) < 0.08
+    assert window.document.size == len(text.encode())
+    assert window.document.line_count == text.count("\n") + 1
+    assert window.document_view.caret == window.document.size
+    window.close()
+
+
+def test_cancelled_insert_restores_document(qapp: QApplication) -> None:
+    document = Document(content=b"avant|apres")
+    job = IncrementalInsert(document, 6, b"x\n" * 1000, chunk_size=100)
+    job.start()
+    qapp.processEvents()
+    assert job.is_running()
+
+    job.cancel()
+    assert not job.is_running()
+    assert document.read(0, document.size) == b"avant|apres"
+    assert document.line_count == 1
+
+
+@pytest.mark.parametrize("merge", [False, True])
+def test_cancelled_insert_keeps_previous_history(qapp: QApplication, merge: bool) -> None:
+    document = Document(content=b"douze octets")
+    document.insert(12, b" et plus")
+    document.delete(0, 6)
+    before = document.read(0, document.size)
+    commands = list(document.history.commands)
+    position = document.history.position
+
+    # Premier bloc fusionné ou non avec la suppression précédente
+    job = IncrementalInsert(document, 0, "ligne collée\n".encode() * 50_000, chunk_size=64 * 1024, merge=merge)
+    job.start()
+    qapp.processEvents()
+    assert job.is_running()
+    job.cancel()
+
+    assert document.read(0, document.size) == before
+    assert document.line_count == 1
+    assert list(document.history.commands) == commands
+    assert document.history.position == position
+    document.undo()
+    assert document.read(0, document.size) == b"douze octets et plus"
+    document.undo()
+    assert document.read(0, document.size) == b"douze octets"
@@ -0,0 +1,115 @@
+import mmap
+from pathlib import Path
+
+import pytest
+from PyQt6.QtWidgets import QApplication
+
+from src.document import Document
+from src.document_view import DocumentView
+from src.line_index import LineIndex, LineIndexWorker
+from src.main_windows import MainWindow
+from helpers import wait_until
+
+
+def test_in_memory_document_lines() -> None:
+    document = Document(content=b"premiere\r\ndeuxieme\n\nquatrieme")
+
+    assert document.line_count == 4
+    assert [document.line_text(line) for line in range(4)] == ["premiere", "deuxieme", "", "quatrieme"]
+    assert document.line_text(0, max_bytes=4) == "prem"
+
+
+def test_index_is_built_by_chunks(tmp_path: Path) -> None:
+    path = tmp_path / "log.txt"
+    path.write_bytes(b"".join(f"ligne {i}\n".encode() for i in range(10_000)))
+    document = Document.open(path)
+    assert document.line_count == 1
+
+    progress: list[int] = []
+    worker = LineIndexWorker(path, document.content, document.index, chunk_size=4096)
+    worker.signals.progress.connect(lambda done, _total: progress.append(done))
+    worker.run()
+
+    assert document.index.complete
+    assert len(progress) > 1
+    # Dernière ligne vide après le saut de ligne final
+    assert document.line_count == 10_001
+    assert document.line_text(9_999) == "ligne 9999"
+    document.close()
+
+
+def test_empty_file(tmp_path: Path) -> None:
+    path = tmp_path / "vide.txt"
+    path.write_bytes(b"")
+    document = Document.open(path)
+
+    assert document.index.complete
+    assert document.line_count == 1
+    assert document.line_text(0) == ""
+
+
+def test_partial_index_exposes_scanned_lines() -> None:
+    index = LineIndex(20)
+    index.scan_chunk(b"abc\ndef\ngh", 0)
+
+    assert len(index) == 3
+    assert index.line_range(1) == (4, 7)
+    assert index.line_range(2) == (8, 10)
+
+
+@pytest.mark.usefixtures("qapp")
+def test_view_only_reads_visible_lines() -> None:
+    document = Document(content=b"".join(f"ligne {i}\n".encode() for i in range(100_000)))
+    view = DocumentView(document)
+    view.resize(400, 300)
+    view.show()
+
+    visible = view.visible_lines()
+    assert visible.start == 0
+    assert len(visible) <= view.visible_line_count() + 1
+
+    scroll_bar = view.verticalScrollBar()
+    assert scroll_bar is not None
+    scroll_bar.setValue(50_000)
+    assert view.visible_lines().start == 50_000
+
+
+def test_open_updates_view_and_line_count(qapp: QApplication, tmp_path: Path) -> None:
+    path = tmp_path / "log.txt"
+    path.write_bytes(b"".join(f"ligne {i}\n".encode() for i in range(50_000)))
+    window = MainWindow()
+
+    assert window.open_file(path)
+    assert window.document_view.document is window.document
+    wait_until(qapp, lambda: window.io_worker is None)
+    qapp.processEvents()
+
+    assert window.document.line_count == 50_001
+    assert window.line_count_label.text() == "Lignes: 50001"
+    window.close()
+
+
+def test_edits_keep_line_index_in_sync() -> None:
+    document = Document(content=b"un\ndeux\ntrois")
+
+    document.insert(3, b"a\nb\n")
+    assert document.read(0, document.size) == b"un\na\nb\ndeux\ntrois"
+    assert [document.line_text(line) for line in range(document.line_count)] == ["un", "a", "b", "deux", "trois"]
+
+    document.delete(2, 9)
+    assert [document.line_text(line) for line in range(document.line_count)] == ["unux", "trois"]
+    assert document.position_of(document.offset_at(1, 2)) == (1, 2)
+
+
+def test_mapped_document_is_edited_without_copy(tmp_path: Path) -> None:
+    path = tmp_path / "log.txt"
+    path.write_bytes(b"abc\n")
+    document = Document.open(path)
+    LineIndexWorker(path, document.content, document.index).run()
+
+    document.insert(0, b"\xc3\xa9")
+    assert document.edited
+    assert isinstance(document.content, mmap.mmap)
+    assert document.line_text(0) == "éabc"
+    assert document.offset_at(0, 1) == 2
+    assert path.read_bytes() == b"abc\n"
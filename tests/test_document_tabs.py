@@ -0,0 +1,166 @@
+from pathlib import Path
+
+import pytest
+from PyQt6.QtWidgets import QApplication, QMessageBox
+
+from src.autosave import Autosave, AutosaveStore
+from src.document import Document
+from src.main_windows import MainWindow
+from src.session import SessionStore
+from helpers import wait_until
+
+
+@pytest.mark.usefixtures("qapp")
+def test_tabs_keep_their_document_and_position() -> None:
+    window = MainWindow()
+    window.set_document(Document(content=b"premier document"))
+    window.document_view.set_selection(0, 7)
+    first = window.document
+
+    window.new_action.trigger()
+    assert len(window.tabs) == 2
+    assert window.document is not first
+    assert window.document_view.document is window.document
+    assert not window.document_view.has_selection()
+
+    window.tab_bar.setCurrentIndex(0)
+    assert window.document is first
+    assert window.document_view.selection() == (0, 7)
+    window.close()
+
+
+@pytest.mark.usefixtures("qapp")
+def test_tab_title_marks_modified_documents() -> None:
+    window = MainWindow()
+    window.set_document(Document(content=b"texte"))
+    assert window.tab_bar.tabText(0) == "Sans titre"
+
+    window.document_view.set_selection(0, 5)
+    window.cut_action.trigger()
+    assert window.tab_bar.tabText(0) == "Sans titre *"
+    window.undo_action.trigger()
+    assert window.tab_bar.tabText(0) == "Sans titre"
+    window.close()
+
+
+@pytest.mark.usefixtures("qapp")
+def test_closing_tabs() -> None:
+    window = MainWindow()
+    window.new_action.trigger()
+    window.new_action.trigger()
+    second = window.tabs[1].document
+
+    window.tab_bar.moveTab(1, 2)
+    assert window.tabs[2].document is second
+    assert window.close_tab(2)
+    assert second not in [tab.document for tab in window.tabs]
+    assert window.tab_bar.count() == len(window.tabs) == 2
+
+    window.close_tab_action.trigger()
+    window.close_tab_action.trigger()
+    # Le dernier onglet est remplacé par un document vide
+    assert len(window.tabs) == 1
+    assert window.document is window.tabs[0].document
+    assert window.document.size == 0
+    window.close()
+
+
+def test_open_replaces_pristine_tab_and_freezes_tabs_while_busy(qapp: QApplication, tmp_path: Path) -> None:
+    path = tmp_path / "notes.txt"
+    path.write_bytes(b"une ligne\n" * 1000)
+    window = MainWindow()
+
+    assert window.open_file(path)
+    assert not window.tab_bar.isEnabled()
+    assert not window.close_tab(0)
+    wait_until(qapp, lambda: window.io_worker is None)
+
+    assert window.tab_bar.isEnabled()
+    assert len(window.tabs) == 1
+    assert window.tab_bar.tabText(0) == "notes.txt"
+
+    # Onglet quitté : pages projetées rendues au système, relues au retour
+    window.new_action.trigger()
+    window.tab_bar.setCurrentIndex(0)
+    assert window.document.line_text(999) == "une ligne"
+    window.close()
+
+
+def test_closing_modified_tab_asks_first(qapp: QApplication, tmp_path: Path) -> None:
+    store = AutosaveStore(tmp_path / "autosave")
+    window = MainWindow(autosave=Autosave(store, idle_interval=10))
+    window.set_document(Document(content=b"texte modifie"))
+    window.document_view.set_selection(0, 5)
+    window.cut_action.trigger()
+    modified = window.document
+    window.new_action.trigger()
+    wait_until(qapp, lambda: list(store.directory.glob("*.json")) != [])
+
+    answers: list[QMessageBox.StandardButton] = []
+    window.ask_unsaved_changes = lambda _document: answers.pop(0)  # type: ignore[method-assign]
+
+    # Annuler : l'onglet et sa sauvegarde automatique restent
+    answers.append(QMessageBox.StandardButton.Cancel)
+    assert not window.close_tab(0)
+    assert window.tabs[0].document is modified
+    assert list(store.directory.glob("*.json")) != []
+
+    # Enregistrer : l'onglet n'est fermé qu'une fois la sauvegarde réussie
+    answers.append(QMessageBox.StandardButton.Save)
+    window.ask_save_path = lambda: tmp_path / "modifie.txt"  # type: ignore[method-assign]
+    assert window.close_tab(0)
+    assert window.tabs[0].document is modified
+    wait_until(qapp, lambda: window.io_worker is None)
+    assert modified not in [tab.document for tab in window.tabs]
+    assert (tmp_path / "modifie.txt").read_bytes() == b" modifie"
+    wait_until(qapp, lambda: not list(store.directory.glob("*.json")))
+
+    # Abandonner : fermé sans sauvegarde
+    window.set_document(Document(content=b"brouillon"))
+    window.document_view.set_selection(0, 3)
+    window.cut_action.trigger()
+    answers.append(QMessageBox.StandardButton.Discard)
+    assert window.close_tab(0)
+    assert not answers
+    assert len(window.tabs) == 1 and not window.document.modified
+    window.close()
+
+
+def test_closing_window_asks_for_each_modified_tab(qapp: QApplication, tmp_path: Path) -> None:
+    store = AutosaveStore(tmp_path / "autosave")
+    session = SessionStore(tmp_path / "session.bin")
+    window = MainWindow(autosave=Autosave(store, idle_interval=10), session=session)
+    window.show()
+    for content in (b"premier texte", b"second texte"):
+        window.set_document(Document(content=content))
+        window.document_view.set_selection(0, 7)
+        window.cut_action.trigger()
+        window.new_action.trigger()
+    window.close_tab(2)
+    wait_until(qapp, lambda: len(list(store.directory.glob("*.json"))) == 2)
+
+    answers: list[QMessageBox.StandardButton] = []
+    asked: list[str] = []
+
+    def ask(document: Document) -> QMessageBox.StandardButton:
+        asked.append(document.read(0, document.size).decode())
+        return answers.pop(0)
+
+    window.ask_unsaved_changes = ask  # type: ignore[method-assign]
+    window.ask_save_path = lambda: tmp_path / "second.txt"  # type: ignore[method-assign]
+
+    # Annuler : rien n'est fermé, ni la session enregistrée
+    answers.append(QMessageBox.StandardButton.Cancel)
+    assert not window.close()
+    assert window.isVisible() and len(window.tabs) == 2
+    assert not session.path.exists()
+
+    # Abandonner le premier, enregistrer le second : fermeture à la fin de la sauvegarde
+    answers.extend([QMessageBox.StandardButton.Discard, QMessageBox.StandardButton.Save])
+    assert not window.close()
+    wait_until(qapp, lambda: not window.isVisible())
+    assert asked == [" texte", " texte", "texte"]
+    assert not answers
+    assert (tmp_path / "second.txt").read_bytes() == b"texte"
+    assert session.path.exists()
+    wait_until(qapp, lambda: not list(store.directory.glob("*.json")))
@@ -0,0 +1,147 @@
+import time
+from pathlib import Path
+
+import pytest
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QApplication
+
+from src.document import Document
+from src.file_io import FileIOWorker
+from src.main_windows import MainWindow
+from helpers import wait_until
+
+LARGE_FILE_SIZE = 256 * 1024 * 1024
+
+
+def make_large_file(path: Path) -> Path:
+    with open(path, "wb") as file:
+        file.write(b"debut\n")
+        file.truncate(LARGE_FILE_SIZE)
+    return path
+
+
+def test_large_file_open_keeps_event_loop_responsive(qapp: QApplication, tmp_path: Path) -> None:
+    path = make_large_file(tmp_path / "large.log")
+    window = MainWindow()
+
+    gaps: list[float] = []
+    last_beat = time.perf_counter()
+
+    def beat() -> None:
+        nonlocal last_beat
+        now = time.perf_counter()
+        gaps.append(now - last_beat)
+        last_beat = now
+
+    heartbeat = QTimer()
+    heartbeat.setInterval(10)
+    heartbeat.timeout.connect(beat)
+    heartbeat.start()
+
+    assert window.open_file(path)
+    assert not window.save_action.isEnabled()
+    wait_until(qapp, lambda: window.io_worker is None)
+    heartbeat.stop()
+
+    assert window.document.path == path
+    assert window.document.size == LARGE_FILE_SIZE
+    assert bytes(window.document.content[:6]) == b"debut\n"
+    # Document ouvert non modifié : rien à sauvegarder
+    assert not window.document.modified
+    assert not window.save_action.isEnabled()
+    assert max(gaps) < 0.25
+    window.close()
+
+
+def test_save_round_trip(qapp: QApplication, tmp_path: Path) -> None:
+    source = tmp_path / "source.txt"
+    source.write_bytes(b"ligne 1\nligne 2\n" * 1000)
+    target = tmp_path / "copie.txt"
+    window = MainWindow()
+
+    window.open_file(source)
+    wait_until(qapp, lambda: window.io_worker is None)
+    assert window.save_file(target)
+    wait_until(qapp, lambda: window.io_worker is None)
+
+    assert target.read_bytes() == source.read_bytes()
+    assert not window.save_action.isEnabled()
+    assert window.document.path == target
+    window.close()
+
+
+def test_cancelled_open_keeps_previous_state(qapp: QApplication, tmp_path: Path) -> None:
+    path = make_large_file(tmp_path / "large.log")
+    window = MainWindow()
+    previous_document = window.document
+
+    assert window.open_file(path)
+    assert not window.open_file(path)
+    window.cancel_io_action.trigger()
+    wait_until(qapp, lambda: window.io_worker is None)
+
+    assert window.document is previous_document
+    assert not window.save_action.isEnabled()
+    window.close()
+
+
+def test_failed_save_leaves_destination_intact(qapp: QApplication, tmp_path: Path) -> None:
+    target = tmp_path / "absent" / "document.txt"
+    window = MainWindow()
+    window.set_document(Document(content=b"texte"))
+    window.document_view.set_selection(0, 2)
+    window.cut_action.trigger()
+    assert window.save_action.isEnabled()
+
+    assert window.save_file(target)
+    wait_until(qapp, lambda: window.io_worker is None)
+
+    assert not target.exists()
+    assert window.save_action.isEnabled()
+    window.close()
+
+
+class BrokenWorker(FileIOWorker):
+    def work(self) -> object:
+        raise ValueError("bogue du worker")
+
+
+def test_unexpected_worker_error_releases_busy_state(qapp: QApplication, tmp_path: Path) -> None:
+    window = MainWindow()
+    failures: list[str] = []
+    worker = BrokenWorker(tmp_path / "document.txt")
+    worker.signals.failed.connect(failures.append)
+
+    assert window.start_io(worker, "Traitement")
+    assert window.is_busy()
+    wait_until(qapp, lambda: window.io_worker is None)
+    assert failures == ["ValueError : bogue du worker"]
+    assert not window.is_busy()
+    assert window.tab_bar.isEnabled()
+    window.close()
+
+
+def test_worker_without_work_cannot_be_created(tmp_path: Path) -> None:
+    class IncompleteWorker(FileIOWorker):
+        pass
+
+    # Erreur à la création, pas dans un thread du pool
+    with pytest.raises(TypeError, match="work"):
+        IncompleteWorker(tmp_path)  # type: ignore[abstract]
+
+
+def test_closing_window_finishes_running_save(qapp: QApplication, tmp_path: Path) -> None:
+    window = MainWindow()
+    window.show()
+    window.set_document(Document(content=b"ligne\n" * 2_000_000))
+    window.document_view.set_selection(0, 6)
+    window.cut_action.trigger()
+    destination = tmp_path / "sauvegarde.txt"
+
+    # Fermeture demandée pendant la sauvegarde : reportée jusqu'à son terme
+    assert window.save_file(destination)
+    assert not window.close()
+    assert window.isVisible()
+    wait_until(qapp, lambda: not window.isVisible())
+    assert destination.stat().st_size == 6 * 1_999_999
+    assert not window.document.modified
@@ -0,0 +1,161 @@
+import random
+import sys
+
+import pytest
+from PyQt6.QtWidgets import QApplication
+
+from src.clipboard import IncrementalInsert
+from src.document import Document
+from src.history import EditHistory, StyleEdit, TextEdit
+from src.main_windows import MainWindow
+from src.piece_table import Piece
+from src.text_styles import TextStyle
+
+
+def text(document: Document) -> bytes:
+    return document.read(0, document.size)
+
+
+def retained_size(history: EditHistory) -> int:
+    """Taille réelle des objets retenus par l'historique (entrées, listes, morceaux, runs, entiers)"""
+    seen: set[int] = set()
+    total = 0
+    stack: list[object] = list(history.commands)
+    while stack:
+        if id(item := stack.pop()) in seen:
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, TextEdit | StyleEdit | Piece):
+            stack.extend(getattr(item, name) for name in type(item).__slots__)
+        elif isinstance(item, list | tuple):
+            stack.extend(item)
+    return total
+
+
+def test_undo_redo_text_and_styles() -> None:
+    document = Document(content=b"un\ndeux\ntrois")
+    document.toggle_style(3, 7, TextStyle.BOLD)
+    document.delete(2, 8)
+    document.insert(2, b" et ")
+    assert text(document) == b"un et trois"
+
+    assert document.undo() is not None
+    assert document.undo() is not None
+    assert text(document) == b"un\ndeux\ntrois"
+    assert document.line_count == 3
+    # Le style du texte supprimé est restauré avec lui
+    assert document.styles.style_at(5) == TextStyle.BOLD
+    assert document.styles.style_at(8) == TextStyle.NONE
+
+    assert document.undo() is not None
+    assert len(document.styles) == 1
+    assert document.undo() is None
+
+    for _ in range(3):
+        assert document.redo() is not None
+    assert text(document) == b"un et trois"
+    assert document.redo() is None
+
+
+def test_new_edit_drops_redo() -> None:
+    document = Document(content=b"abc")
+    document.insert(3, b"d")
+    document.undo()
+    assert document.history.can_redo()
+
+    document.insert(0, b"z")
+    assert not document.history.can_redo()
+    assert text(document) == b"zabc"
+
+
+def test_repeated_toggles_are_merged() -> None:
+    document = Document(content=b"du texte en gras")
+    for _ in range(10):
+        document.toggle_style(12, 16, TextStyle.BOLD)
+
+    assert len(document.history) == 1
+    command = document.history.commands[0]
+    assert isinstance(command, StyleEdit)
+    document.undo()
+    assert document.styles.style_at(12) == TextStyle.NONE
+
+
+def test_incremental_paste_is_one_entry(qapp: QApplication) -> None:
+    document = Document(content=b"[selection]")
+    document.delete(1, 10)
+    job = IncrementalInsert(document, 1, b"ligne\n" * 1000, chunk_size=100, merge=True)
+    job.start()
+    while job.is_running():
+        qapp.processEvents()
+
+    # Remplacement de la sélection et tous les blocs : une seule entrée, sans copie du texte
+    assert len(document.history) == 1
+    assert document.history.memory < 1024
+    document.undo()
+    assert text(document) == b"[selection]"
+
+
+def test_budget_evicts_oldest_entries() -> None:
+    history = EditHistory(budget=2000)
+    document = Document(content=b"")
+    document.history = history
+    for i in range(100):
+        document.insert(i, b"x")
+
+    assert history.memory <= history.budget
+    assert history.evicted > 0
+    assert len(history) == history.index
+
+    undone = 0
+    while document.undo() is not None:
+        undone += 1
+    assert undone == len(history)
+    assert document.size == 100 - undone
+
+
+def test_long_session_stays_under_budget() -> None:
+    rng = random.Random(1)  # noqa: S311
+    budget = 2 * 1024 * 1024
+    document = Document(content=b"ligne de texte\n" * 10_000)
+    document.history.set_budget(budget)
+
+    caret = 0
+    for i in range(100_000):
+        if i % 100 == 0:
+            caret = rng.randrange(document.size)
+        if i % 10 == 9:
+            document.delete(caret - 1, caret)
+            caret -= 1
+        elif i % 50 == 25:
+            document.toggle_style(max(0, caret - 20), caret, TextStyle.BOLD)
+        else:
+            document.insert(caret, b"a")
+            caret += 1
+        assert document.history.memory <= budget
+
+    assert document.history.evicted > 0
+    # L'estimation tenue par l'historique majore son empreinte réelle
+    assert retained_size(document.history) <= document.history.memory
+
+
+@pytest.mark.usefixtures("qapp")
+def test_window_undo_redo_actions() -> None:
+    window = MainWindow(undo_budget=4096)
+    window.set_document(Document(content=b"bonjour tout le monde"))
+    assert not window.undo_action.isEnabled()
+    assert window.history_label.text().endswith("/ 4.0 Kio")
+
+    window.document_view.set_selection(7, 21)
+    window.cut_action.trigger()
+    assert window.undo_action.isEnabled()
+    assert text(window.document) == b"bonjour"
+
+    window.undo_action.trigger()
+    assert text(window.document) == b"bonjour tout le monde"
+    assert window.redo_action.isEnabled()
+
+    window.redo_action.trigger()
+    assert text(window.document) == b"bonjour"
+    assert window.document_view.caret == 7
+    window.close()
@@ -0,0 +1,33 @@
+from pathlib import Path
+
+import pytest
+
+from src.icons import IconRegistry
+
+
+@pytest.mark.usefixtures("qapp")
+def test_icons_are_resolved_from_workspace_and_cached(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    registry = IconRegistry()
+
+    icon = registry.icon("new")
+    assert not icon.isNull()
+    assert registry.icon("new") is icon
+    assert registry.pixmap("new", 16) is registry.pixmap("new", 16)
+    assert registry.pixmap("new", 16).width() <= 16
+
+
+@pytest.mark.usefixtures("qapp")
+def test_missing_icon_is_empty_unless_strict(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    (tmp_path / "corrompue.png").write_bytes(b"pas une image")
+    registry = IconRegistry(icons_dir=tmp_path, resource_file=tmp_path / "icons.rcc")
+
+    assert registry.icon("absent").isNull()
+    assert registry.pixmap("corrompue", 16).isNull()
+    assert [record.levelname for record in caplog.records] == ["WARNING", "WARNING"]
+
+    strict = IconRegistry(icons_dir=tmp_path, resource_file=tmp_path / "icons.rcc", strict=True)
+    with pytest.raises(FileNotFoundError):
+        strict.icon("absent")
+    with pytest.raises(ValueError, match="décodée"):
+        strict.icon("corrompue")
@@ -0,0 +1,65 @@
+import json
+import time
+from pathlib import Path
+
+import pytest
+from PyQt6.QtWidgets import QApplication
+
+from src.instrumentation import Instrumentation, LatencyHistogram
+from src.main_windows import MainWindow
+
+
+def test_histogram_percentiles() -> None:
+    histogram = LatencyHistogram()
+    for value in range(1, 101):
+        histogram.add(float(value))
+
+    summary = histogram.summary()
+    assert summary["count"] == 100
+    assert summary["p50"] == 50
+    assert summary["p95"] == 95
+    assert summary["p99"] == 99
+    assert summary["max"] == 100
+
+
+def test_window_slots_are_timed(qapp: QApplication, tmp_path: Path) -> None:
+    instrumentation = Instrumentation(heartbeat_interval=5)
+    window = MainWindow(instrumentation=instrumentation)
+    window.show()
+
+    window.copy_action.trigger()
+    window.dark_theme_action.trigger()
+    window.get_edit_context_menu()
+
+    # Bloquer le thread GUI pour que le battement mesure un retard
+    time.sleep(0.05)
+    qapp.processEvents()
+
+    histograms = instrumentation.snapshot()["histograms"]
+    # Thème par défaut appliqué au démarrage + les deux actions déclenchées
+    assert histograms["dispatch_action"]["count"] == 3
+    assert histograms["display_notification"]["count"] >= 2
+    assert histograms["increment_action_counter"]["count"] >= 2
+    assert histograms["theme_apply"]["count"] >= 1
+    assert histograms["get_edit_context_menu"]["count"] == 1
+    assert histograms["event_loop_lag"]["max"] > 20
+
+    window.instrumentation_panel.refresh()
+    assert window.instrumentation_panel.table.rowCount() == len(histograms)
+
+    dump = tmp_path / "metrics.json"
+    instrumentation.dump_json(dump)
+    assert json.loads(dump.read_text())["histograms"]["dispatch_action"]["count"] == 3
+
+    instrumentation.stop()
+    window.close()
+
+
+@pytest.mark.usefixtures("qapp")
+def test_disabled_instrumentation_leaves_slots_untouched() -> None:
+    window = MainWindow()
+
+    assert window.instrumentation is None
+    assert "dispatch_action" not in vars(window)
+    assert not hasattr(window, "instrumentation_panel")
+    window.close()
@@ -0,0 +1,69 @@
+from PyQt6.QtCore import QPoint
+from PyQt6.QtWidgets import QApplication, QMenu
+
+from src.main_windows import MainWindow
+
+
+def menus_by_title(window: MainWindow) -> dict[str, QMenu]:
+    menu_bar = window.menuBar()
+    assert menu_bar is not None
+    return {menu.title(): menu for menu in menu_bar.findChildren(QMenu) if menu.title()}
+
+
+def test_lazy_window_defers_menus_and_notifications(qapp: QApplication) -> None:
+    window = MainWindow(lazy=True)
+    window.show()
+    qapp.processEvents()
+
+    menus = menus_by_title(window)
+    assert menus["&Fichier"].actions() == []
+    assert menus["&Thème"].actions() == []
+    assert window.notification_pool is None
+    assert window.theme_manager.current_theme == "light"
+
+    menus["&Fichier"].aboutToShow.emit()
+    menus["&Fichier"].aboutToShow.emit()
+    assert window.new_action in menus["&Fichier"].actions()
+    assert len(menus["&Fichier"].actions()) == 8
+
+    window.copy_action.trigger()
+    assert window.notification_pool is not None
+    assert window.notification_pool.visible_count() == 1
+    window.close()
+
+
+def test_eager_window_builds_everything(qapp: QApplication) -> None:
+    window = MainWindow()
+    window.show()
+    qapp.processEvents()
+
+    menus = menus_by_title(window)
+    assert window.light_theme_action in menus["&Thème"].actions()
+    assert window.notification_pool is not None
+    window.close()
+
+
+def test_context_menus_are_reused(qapp: QApplication) -> None:
+    window = MainWindow()
+    window.show()
+    qapp.processEvents()
+    assert window.toolbar is not None
+
+    central_position = QPoint(400, 300)
+    toolbar_position = window.toolbar.geometry().center()
+    window.show_context_menu(central_position)
+    window.show_context_menu(toolbar_position)
+    children_count = len(window.children())
+
+    for _ in range(2000):
+        window.show_context_menu(central_position)
+        window.show_context_menu(toolbar_position)
+    qapp.processEvents()
+
+    assert len(window.children()) == children_count
+
+    window.is_bold = True
+    assert window.get_edit_context_menu() is window.edit_context_menu
+    assert window.bold_action is not None
+    assert window.bold_action.isChecked()
+    window.close()
@@ -0,0 +1,179 @@
+import tracemalloc
+
+import pytest
+from PyQt6.QtWidgets import QApplication, QLabel, QMainWindow, QStatusBar
+
+from src.instrumentation import PaintEventCounter
+from src.main_windows import MainWindow
+
+from src.notifications import (
+    NOTIFICATION_PROPERTY,
+    NotificationPool,
+    NotificationScheduler,
+    PoolPolicy,
+    notification_stylesheet,
+    register_notification_type,
+    unregister_notification_type,
+)
+
+
+def make_pool(size: int, policy: PoolPolicy) -> tuple[QMainWindow, NotificationPool]:
+    window = QMainWindow()
+    status_bar = window.statusBar()
+    assert isinstance(status_bar, QStatusBar)
+    return window, NotificationPool(status_bar, size, policy)
+
+
+def visible_messages(pool: NotificationPool) -> list[str]:
+    return [slot.message for slot in pool.active_slots.values()]
+
+
+@pytest.mark.usefixtures("qapp")
+def test_labels_are_recycled() -> None:
+    _window, pool = make_pool(2, "drop_oldest")
+    labels = {id(slot.label) for slot in pool.slots}
+
+    for i in range(50):
+        pool.show(f"message {i}", "info")
+
+    assert {id(slot.label) for slot in pool.active_slots.values()} <= labels
+    assert pool.visible_count() == 2
+
+
+@pytest.mark.usefixtures("qapp")
+def test_drop_oldest_policy() -> None:
+    _window, pool = make_pool(2, "drop_oldest")
+    for message in ("a", "b", "c"):
+        pool.show(message, "info")
+
+    assert visible_messages(pool) == ["b", "c"]
+
+
+@pytest.mark.usefixtures("qapp")
+def test_drop_oldest_keeps_higher_priority() -> None:
+    _window, pool = make_pool(2, "drop_oldest")
+    pool.show("erreur", "error")
+    pool.show("a", "info")
+    pool.show("b", "info")
+
+    assert visible_messages(pool) == ["erreur", "b"]
+
+
+@pytest.mark.usefixtures("qapp")
+def test_coalesce_policy() -> None:
+    _window, pool = make_pool(2, "coalesce")
+    for message in ("a", "b", "a", "c"):
+        pool.show(message, "info")
+
+    assert visible_messages(pool) == ["a", "c"]
+
+
+@pytest.mark.usefixtures("qapp")
+def test_queue_policy() -> None:
+    _window, pool = make_pool(1, "queue")
+    pool.show("a", "info")
+    pool.show("b", "warning")
+
+    assert visible_messages(pool) == ["a"]
+
+    pool.release(next(iter(pool.active_slots.values())))
+    assert visible_messages(pool) == ["b"]
+
+    pool.release(next(iter(pool.active_slots.values())))
+    assert pool.visible_count() == 0
+    assert len(pool.free_slots) == 1
+
+
+@pytest.mark.usefixtures("qapp")
+def test_registered_type_is_styled_by_property() -> None:
+    register_notification_type("debug", "#eeeeee", "#616161", "#bdbdbd", duration=1000)
+    try:
+        assert 'QLabel[notificationType="debug"]' in notification_stylesheet()
+
+        _window, pool = make_pool(1, "drop_oldest")
+        pool.show("trace", "debug")
+        slot = next(iter(pool.active_slots.values()))
+
+        assert slot.label.property(NOTIFICATION_PROPERTY) == "debug"
+        assert slot.label.styleSheet() == ""
+        assert slot.timer.interval() == 1000
+    finally:
+        unregister_notification_type("debug")
+
+    assert "debug" not in notification_stylesheet()
+
+
+@pytest.mark.usefixtures("qapp")
+def test_type_registered_after_startup_restyles_window() -> None:
+    window = MainWindow()
+    assert window.theme_manager.current_theme == "light"
+    register_notification_type("trace", "#fafafa", "#424242", "#e0e0e0", duration=1000)
+    try:
+        assert 'QLabel[notificationType="trace"]' in window.styleSheet()
+    finally:
+        unregister_notification_type("trace")
+    assert "trace" not in window.styleSheet()
+
+    # Fenêtre fermée : plus restylée
+    window.close()
+    register_notification_type("trace", "#fafafa", "#424242", "#e0e0e0", duration=1000)
+    try:
+        assert "trace" not in window.styleSheet()
+    finally:
+        unregister_notification_type("trace")
+
+
+@pytest.mark.usefixtures("qapp")
+def test_scheduler_merges_consecutive_repeats() -> None:
+    _window, pool = make_pool(3, "drop_oldest")
+    scheduler = NotificationScheduler(pool, pool.show)
+
+    for _ in range(37):
+        scheduler.submit("Contenu copié", "success")
+    scheduler.submit("Contenu collé", "success")
+    scheduler.submit("Contenu copié", "success")
+
+    assert visible_messages(pool) == ["Contenu copié ×37", "Contenu collé", "Contenu copié"]
+
+
+def test_stress_notifications_stay_bounded(qapp: QApplication) -> None:
+    window = MainWindow(notification_pool_size=5)
+    window.show()
+    qapp.processEvents()
+    label_count = len(window.findChildren(QLabel))
+
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    for i in range(10_000):
+        window.show_notification.emit("Contenu copié" if i % 3 else f"Message {i}", ("info", "success", "error")[i % 3])
+        if i % 500 == 0:
+            qapp.processEvents()
+    qapp.processEvents()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert window.notification_pool is not None
+    assert window.notification_pool.visible_count() <= 5
+    assert len(window.findChildren(QLabel)) == label_count
+    assert current - baseline < 1_000_000
+    window.close()
+
+
+def test_notification_burst_is_painted_once(qapp: QApplication) -> None:
+    window = MainWindow(notification_pool_size=5)
+    window.show()
+    qapp.processEvents()
+    assert window.notification_pool is not None
+
+    counter = PaintEventCounter()
+    window.notification_pool.watch_paint_events(counter)
+    shown_before = window.notification_pool.shown_count
+
+    for i in range(50):
+        window.show_notification.emit(f"Message {i}", "info")
+    qapp.processEvents()
+
+    notifications = window.notification_pool.shown_count - shown_before
+    assert notifications == 50
+    assert counter.count / notifications < 1
+    window.close()
@@ -0,0 +1,133 @@
+import random
+
+import pytest
+
+from src.line_index import LineIndex
+from src import piece_table
+from src.piece_table import PieceTable
+from src.text_styles import StyleRuns, TextStyle
+
+
+def make_table(content: bytes) -> PieceTable:
+    index = LineIndex(len(content))
+    index.scan_chunk(content, 0)
+    index.complete = True
+    return PieceTable(content, index)
+
+
+def expected_lines(content: bytes) -> list[tuple[int, int]]:
+    ranges = []
+    start = 0
+    for line in content.split(b"\n"):
+        ranges.append((start, start + len(line)))
+        start += len(line) + 1
+    return ranges
+
+
+def test_random_edits_match_reference(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Petits blocs pour exercer les coupes et fusions de blocs
+    monkeypatch.setattr(piece_table, "BLOCK_SIZE", 4)
+    rng = random.Random(42)  # noqa: S311
+    reference = bytearray(b"".join(f"ligne {i}\n".encode() for i in range(200)))
+    table = make_table(bytes(reference))
+
+    for _ in range(3000):
+        if reference and rng.random() < 0.1:
+            # Déplacement d'une plage par ses morceaux (annuler/rétablir)
+            start = rng.randrange(len(reference))
+            end = min(len(reference), start + rng.randrange(1, 200))
+            moved = reference[start:end]
+            pieces = table.remove(start, end)
+            del reference[start:end]
+            offset = rng.randrange(len(reference) + 1)
+            table.insert_pieces(offset, pieces)
+            reference[offset:offset] = moved
+        elif reference and rng.random() < 0.4:
+            start = rng.randrange(len(reference))
+            end = min(len(reference), start + rng.randrange(1, 40))
+            assert table.delete(start, end) == reference[start:end]
+            del reference[start:end]
+        else:
+            offset = rng.randrange(len(reference) + 1)
+            data = rng.choice([b"x", b"\n", b"abc\ndef", b"\n\n", b"insertion"])
+            table.insert(offset, data)
+            reference[offset:offset] = data
+
+    assert table.blocks is not None
+    assert len(table.blocks) > 2
+    assert len(table) == len(reference)
+    assert table.read(0, len(table)) == reference
+    assert b"".join(table.chunks(7)) == reference
+
+    ranges = expected_lines(bytes(reference))
+    assert table.line_count == len(ranges)
+    for line, (start, end) in enumerate(ranges):
+        assert table.line_range(line) == (start, end)
+        assert table.line_of(start) == line
+        assert table.line_of(end) == line
+
+
+def test_original_buffer_is_never_modified() -> None:
+    original = b"debut\nfin"
+    table = make_table(original)
+    assert not table.edited
+
+    table.insert(6, b"milieu\n")
+    table.delete(0, 6)
+    assert table.edited
+    assert table.read(0, len(table)) == b"milieu\nfin"
+    assert original == b"debut\nfin"
+
+
+def test_sequential_inserts_extend_one_piece() -> None:
+    table = make_table(b"")
+    for i in range(1000):
+        table.insert(len(table), f"{i}\n".encode())
+
+    assert table.piece_count == 1
+    assert table.line_count == 1001
+
+
+def test_style_runs_toggle_and_merge() -> None:
+    runs = StyleRuns()
+    assert runs.toggle(10, 20, TextStyle.BOLD) is True
+    assert runs.toggle(15, 30, TextStyle.ITALIC) is True
+    assert list(runs.runs(0, 40)) == [
+        (0, 10, TextStyle.NONE),
+        (10, 15, TextStyle.BOLD),
+        (15, 20, TextStyle.BOLD | TextStyle.ITALIC),
+        (20, 30, TextStyle.ITALIC),
+        (30, 40, TextStyle.NONE),
+    ]
+
+    # Une plage déjà entièrement en gras redevient normale
+    assert runs.toggle(10, 20, TextStyle.BOLD) is False
+    assert runs.toggle(15, 30, TextStyle.ITALIC) is False
+    assert len(runs) == 1
+
+
+def test_style_runs_follow_text_edits() -> None:
+    runs = StyleRuns()
+    runs.apply(10, 20, TextStyle.BOLD, enabled=True)
+
+    runs.insert(20, 5)
+    assert runs.style_at(24) == TextStyle.BOLD
+    assert runs.style_at(25) == TextStyle.NONE
+
+    runs.insert(0, 5)
+    assert list(runs.runs(0, 40)) == [(0, 15, TextStyle.NONE), (15, 30, TextStyle.BOLD), (30, 40, TextStyle.NONE)]
+
+    runs.delete(10, 20)
+    assert list(runs.runs(0, 40)) == [(0, 10, TextStyle.NONE), (10, 20, TextStyle.BOLD), (20, 40, TextStyle.NONE)]
+
+    runs.delete(5, 25)
+    assert len(runs) == 1
+
+
+def test_huge_selection_toggle_does_not_scale_with_size() -> None:
+    runs = StyleRuns()
+    runs.toggle(0, 10**12, TextStyle.BOLD)
+    runs.toggle(5, 10**11, TextStyle.ITALIC)
+
+    assert len(runs) == 4
+    assert runs.style_at(10**10) == TextStyle.BOLD | TextStyle.ITALIC
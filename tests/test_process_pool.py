@@ -0,0 +1,95 @@
+import mmap
+from collections.abc import Iterator
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+
+from PyQt6.QtWidgets import QApplication
+
+from src.document import Document
+from src.main_windows import MainWindow
+from src.process_pool import ProcessPool, ProcessTaskWorker
+from src.process_tasks import TextStatistics, merge_statistics, text_statistics
+from helpers import wait_until
+
+TEXT = "première ligne\n  deux  mots\n\ncafé au lait\tfin de ligne".encode()
+
+
+def test_statistics_of_parts_add_up() -> None:
+    shared = SharedMemory(create=True, size=len(TEXT))
+    try:
+        assert shared.buf is not None
+        shared.buf[: len(TEXT)] = TEXT
+        whole = text_statistics(shared.name, 0, len(TEXT))
+        assert whole == TextStatistics(len(TEXT), 3, 10, len(TEXT.decode()))
+
+        # Coupures au milieu d'un mot et d'un caractère multi-octet
+        for cut in range(1, len(TEXT)):
+            parts = [text_statistics(shared.name, 0, cut), text_statistics(shared.name, cut, len(TEXT))]
+            assert merge_statistics(parts) == whole
+    finally:
+        shared.close()
+        shared.unlink()
+
+
+def test_worker_spreads_parts_over_processes(tmp_path: Path) -> None:
+    pool = ProcessPool(max_workers=2)
+    text = b"ligne de journal\n" * 300_000
+    chunks = [text[start : start + 1_000_000] for start in range(0, len(text), 1_000_000)]
+    worker = ProcessTaskWorker(tmp_path, pool, chunks, len(text), text_statistics, merge_statistics)
+    try:
+        assert len(worker.parts()) == 5
+        result = worker.work()
+    finally:
+        pool.shutdown()
+    assert result == TextStatistics(len(text), 300_000, 900_000, len(text))
+
+
+def test_closed_document_cancels_copy_and_errors_fail(qapp: QApplication, tmp_path: Path) -> None:
+    path = tmp_path / "journal.log"
+    path.write_bytes(b"ligne de journal\n" * 300_000)
+    document = Document.open(path)
+    pool = ProcessPool(max_workers=1)
+    events: list[object] = []
+
+    def run(chunks: Iterator[bytes]) -> None:
+        worker = ProcessTaskWorker(path, pool, chunks, document.size, text_statistics, merge_statistics)
+        worker.lease = document.lease
+        worker.signals.finished.connect(events.append)
+        worker.signals.failed.connect(events.append)
+        worker.signals.cancelled.connect(lambda: events.append("annulé"))
+        worker.run()
+        qapp.processEvents()
+
+    # Erreur pendant la copie : un échec, pas une annulation
+    def broken_chunks() -> Iterator[bytes]:
+        raise ValueError("bogue")
+        yield b""
+
+    run(broken_chunks())
+    assert events == ["ValueError : bogue"]
+
+    # Document fermé pendant la copie : annulée, projection fermée une fois le worker terminé
+    def closing_chunks() -> Iterator[bytes]:
+        for chunk in document.chunks(1_000_000):
+            document.close()
+            assert isinstance(document.content, mmap.mmap) and not document.content.closed
+            yield chunk
+
+    events.clear()
+    run(closing_chunks())
+    pool.shutdown()
+    assert events == ["annulé"]
+    assert isinstance(document.content, mmap.mmap) and document.content.closed
+
+
+def test_window_reports_statistics(qapp: QApplication) -> None:
+    window = MainWindow(lazy=True, process_pool=ProcessPool(max_workers=1))
+    window.document.insert(0, TEXT)
+    messages: list[str] = []
+    window.show_notification.connect(lambda message, _type: messages.append(message))
+
+    window.statistics_action.trigger()
+    wait_until(qapp, lambda: not window.process_workers)
+    assert messages[-1] == f"4 lignes, 10 mots, {len(TEXT.decode())} caractères ({len(TEXT)} o)"
+    window.close()
+    assert window.process_pool.pool is None
@@ -0,0 +1,186 @@
+import mmap
+import random
+from collections.abc import Iterator
+from pathlib import Path
+
+from PyQt6.QtWidgets import QApplication
+
+from src.document import Document
+from src.main_windows import MainWindow
+from src.piece_table import ADDED
+from src.search_index import SearchIndex, SearchIndexWorker, SearchWorker, TextSnapshot
+from helpers import wait_until
+
+WORDS = [b"alpha", b"beta", b"gamma", b"x" * 80, "café".encode(), b"12", b"--", b"delta_epsilon", b"req-42abc"]
+QUERIES = [
+    b"alpha",
+    b"lph",
+    b"ta gam",
+    b"x" * 70,
+    b"caf",
+    "é".encode(),
+    b"a.",
+    b"epsilon",
+    b"mma\nbe",
+    b"12 ",
+    b"2abc",
+    b"q-4",
+    b"42abc beta",
+]
+
+
+def occurrences(text: bytes, query: bytes) -> list[int]:
+    found = []
+    position = text.find(query)
+    while position != -1:
+        found.append(position)
+        position = text.find(query, position + 1)
+    return found
+
+
+def search(document: Document, query: bytes) -> list[int]:
+    return [offset for batch in document.search_index.search(query, TextSnapshot(document.text)) for offset in batch]
+
+
+def test_search_matches_plain_scan_after_edits() -> None:
+    rng = random.Random(7)  # noqa: S311
+
+    def words(count: int) -> bytes:
+        return b"".join(rng.choice(WORDS) + rng.choice([b" ", b"\n", b"", b"."]) for _ in range(count))
+
+    for _ in range(100):
+        document = Document(content=words(rng.randint(0, 300)))
+        # Petits blocs : occurrences et mots à cheval sur deux blocs ; index parfois encore à construire
+        document.search_index = SearchIndex(document.text, block_size=rng.choice([16, 64, 256]))
+        if rng.random() < 0.7:
+            document.search_index.index_original()
+
+        for _ in range(10):
+            if rng.random() < 0.6 or not document.size:
+                document.insert(rng.randint(0, document.size), words(rng.randint(1, 5)))
+            else:
+                start = rng.randrange(document.size)
+                document.delete(start, min(document.size, start + rng.randint(1, 30)))
+            text = document.read(0, document.size)
+            for query in QUERIES:
+                assert search(document, query) == occurrences(text, query)
+
+
+def test_index_limits_the_scanned_blocks() -> None:
+    line = b"2024-01-01 12:00:00,000 INFO requete traitee en 12 ms\n"
+    content = line * 20_000 + b"erreur inattendue\n" + line * 20_000
+    document = Document(content=content)
+    index = document.search_index
+    index.index_original()
+
+    for query in (b"erreur", b"inattendu", b"rreur inat"):
+        ranges = index.ranges(query, TextSnapshot(document.text))
+        assert sum(end - start for start, end in ranges) <= 3 * index.block_size
+        assert search(document, query) == [content.index(query)]
+
+    # Texte inséré : seul le nouveau texte est indexé, à la recherche suivante
+    document.insert(0, b"erreur initiale\n")
+    assert search(document, b"erreur") == [0, content.index(b"erreur") + 16]
+    assert index.indexes[ADDED].indexed == 16
+
+
+def test_closing_document_stops_indexing(qapp: QApplication, tmp_path: Path) -> None:
+    path = tmp_path / "journal.log"
+    path.write_bytes(b"une ligne de journal\n" * 200_000)
+    document = Document.open(path)
+    worker = SearchIndexWorker(path, document.search_index)
+    cancelled: list[bool] = []
+    worker.signals.cancelled.connect(lambda: cancelled.append(True))
+    worker.signals.finished.connect(lambda _index: cancelled.append(False))
+
+    document.close()
+    worker.run()
+    qapp.processEvents()
+    assert cancelled == [True]
+
+
+def test_closing_window_waits_for_indexing(qapp: QApplication, tmp_path: Path) -> None:
+    path = tmp_path / "journal.log"
+    path.write_bytes(b"une ligne de journal\n" * 500_000)
+    window = MainWindow()
+    assert window.open_file(path)
+    wait_until(qapp, lambda: window.io_worker is None)
+    assert (worker := window.index_workers[0]).lease is window.document.lease
+
+    # Indexation annulée et attendue ; ses signaux en attente ne visent plus la fenêtre détruite ensuite
+    window.close()
+    assert window.thread_pool.activeThreadCount() == 0
+    assert worker.signals.receivers(worker.signals.cancelled) == 0
+
+
+def test_search_keeps_mapping_open_until_done_and_reports_bugs(qapp: QApplication, tmp_path: Path) -> None:
+    path = tmp_path / "journal.log"
+    path.write_bytes(b"une ligne de journal\n" * 200_000)
+    document = Document.open(path)
+    search = document.search_index.search
+    events: list[object] = []
+
+    def run(worker: SearchWorker) -> None:
+        worker.lease = document.lease
+        worker.signals.finished.connect(events.append)
+        worker.signals.failed.connect(events.append)
+        worker.signals.cancelled.connect(lambda: events.append("annulé"))
+        worker.run()
+        qapp.processEvents()
+
+    # Erreur de la recherche elle-même : signalée comme un échec, pas comme une annulation
+    def broken_search(_query: bytes, _snapshot: TextSnapshot) -> Iterator[list[int]]:
+        raise ValueError("bogue")
+        yield []
+
+    document.search_index.search = broken_search  # type: ignore[method-assign]
+    run(SearchWorker(path, document.search_index, b"ligne"))
+    assert events == ["ValueError : bogue"]
+
+    # Document fermé pendant la recherche : la projection reste ouverte jusqu'à la fin du worker
+    def closing_search(query: bytes, snapshot: TextSnapshot) -> Iterator[list[int]]:
+        for matches in search(query, snapshot):
+            document.close()
+            assert isinstance(document.content, mmap.mmap) and not document.content.closed
+            yield matches
+
+    document.search_index.search = closing_search  # type: ignore[method-assign]
+    events.clear()
+    run(SearchWorker(path, document.search_index, b"ligne"))
+    assert events == ["annulé"]
+    assert isinstance(document.content, mmap.mmap) and document.content.closed
+
+    # Worker démarré après la fermeture : annulé sans lire
+    events.clear()
+    run(SearchWorker(path, document.search_index, b"ligne"))
+    assert events == ["annulé"]
+
+
+def test_window_streams_results_and_cycles_through_them(qapp: QApplication, tmp_path: Path) -> None:
+    path = tmp_path / "journal.log"
+    path.write_bytes((b"ligne ordinaire\n" * 5000 + b"ligne avec erreur\n") * 40)
+    window = MainWindow()
+    window.resize(800, 600)
+    assert window.open_file(path)
+    wait_until(qapp, lambda: window.io_worker is None and not window.index_workers)
+    assert window.document.search_index.complete
+
+    window.ask_search_text = lambda: "erreur"  # type: ignore[method-assign]
+    window.find_action.trigger()
+    wait_until(qapp, lambda: window.search_worker is None)
+    assert len(window.search_results) == 40
+    first = window.search_results[0]
+    assert window.document_view.selection() == (first, first + len(b"erreur"))
+    assert window.document.position_of(first)[0] in window.document_view.visible_lines()
+
+    window.find_next_action.trigger()
+    assert window.document_view.selection()[0] == window.search_results[1]
+
+    # Une modification périme les positions : « Suivant » relance la recherche
+    window.document_view.set_selection(0, 5)
+    window.cut_action.trigger()
+    assert not window.search_results
+    window.find_next_action.trigger()
+    wait_until(qapp, lambda: window.search_worker is None)
+    assert window.search_results[0] == first - 5
+    window.close()
@@ -0,0 +1,78 @@
+from pathlib import Path
+
+from PyQt6.QtWidgets import QApplication
+
+from src.main_windows import MainWindow
+from src.session import SessionState, SessionStore
+from helpers import wait_until
+
+
+def test_session_round_trip_and_unreadable_files(tmp_path: Path) -> None:
+    store = SessionStore(tmp_path / "session.bin")
+    assert store.load() is None
+
+    state = SessionState(
+        geometry=b"\x01\x02geometrie",
+        theme="dark",
+        statusbar_visible=False,
+        italic=True,
+        action_counter=42,
+        documents=[(tmp_path / "a.txt", (1, 3, 0, 0)), (tmp_path / "dossier é" / "b.log", (10, 10, 200, 4))],
+        current=1,
+    )
+    assert store.save(state)
+    loaded = store.load()
+    assert loaded is not None
+    assert loaded.to_bytes() == state.to_bytes()
+    assert (loaded.theme, loaded.toolbar_visible, loaded.statusbar_visible) == ("dark", True, False)
+    assert loaded.documents == state.documents
+
+    # Session tronquée ou d'un autre format : ignorée
+    store.path.write_bytes(state.to_bytes()[:-3])
+    assert store.load() is None
+    store.path.write_bytes(b"autre chose")
+    assert store.load() is None
+
+
+def test_window_restores_session_and_defers_documents(qapp: QApplication, tmp_path: Path) -> None:
+    first, second = tmp_path / "premier.txt", tmp_path / "second.txt"
+    first.write_bytes(b"ligne\n" * 5000)
+    second.write_bytes(b"autre ligne\n" * 100)
+    store = SessionStore(tmp_path / "session.bin")
+
+    window = MainWindow(session=store)
+    window.resize(800, 600)
+    window.show()
+    window.dark_theme_action.trigger()
+    window.toolbar_view_action.trigger()
+    window.bold_action.trigger()
+    assert window.open_file(first)
+    wait_until(qapp, lambda: window.io_worker is None)
+    window.document_view.set_document(window.document, (6, 6, 4000, 0))
+    assert window.open_file(second)
+    wait_until(qapp, lambda: window.io_worker is None)
+    window.tab_bar.setCurrentIndex(0)
+    counter = window.action_counter
+    window.close()
+
+    restored = MainWindow(session=store)
+    restored.resize(800, 600)
+    assert restored.theme_manager.current_theme == "dark"
+    assert not restored.toolbar_view_action.isChecked()
+    assert restored.toolbar is not None and restored.toolbar.isHidden()
+    assert restored.is_bold and restored.bold_action.isChecked()
+    assert restored.action_counter == counter
+    assert [restored.tab_bar.tabText(index) for index in range(restored.tab_bar.count())] == [first.name, second.name]
+
+    # Seul l'onglet courant est rouvert, à sa position une fois indexé
+    assert restored.tab_bar.currentIndex() == 0
+    assert restored.document.path == first
+    assert restored.tabs[1].pending == second
+    wait_until(qapp, lambda: restored.io_worker is None)
+    assert restored.document_view.position()[:3] == (6, 6, 4000)
+
+    restored.tab_bar.setCurrentIndex(1)
+    assert restored.tabs[1].pending is None
+    assert restored.document.path == second
+    wait_until(qapp, lambda: restored.io_worker is None)
+    restored.close()
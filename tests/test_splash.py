@@ -0,0 +1,29 @@
+import subprocess
+import sys
+
+import pytest
+
+from src.domain.constants import SPLASH_SIZE, WORKSPACE_DIR
+from src.splash import is_exposed, show_splash
+
+
+@pytest.mark.usefixtures("qapp")
+def test_splash_is_painted_before_the_event_loop() -> None:
+    splash = show_splash("pyqt_tp_chap2")
+    assert splash.isVisible()
+    assert is_exposed(splash)
+    assert (splash.width(), splash.height()) == SPLASH_SIZE
+    assert not splash.grab().toImage().isNull()
+    splash.close()
+
+
+def test_entry_point_defers_heavy_imports() -> None:
+    # Le point d'entrée n'importe que Qt avant l'écran de démarrage ; la fenêtre n'importe pas multiprocessing
+    script = (
+        "import sys, main; loaded = set(sys.modules); import src.main_windows; "
+        "print('src.main_windows' in loaded, 'src.document' in loaded, 'multiprocessing' in sys.modules)"
+    )
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True, cwd=WORKSPACE_DIR
+    )
+    assert output.stdout.split() == ["False", "False", "False"]
@@ -0,0 +1,53 @@
+import pytest
+from PyQt6.QtWidgets import QApplication, QLabel, QStatusBar
+
+from src.document import Document
+from src.main_windows import MainWindow
+from src.status_updates import StatusUpdateBatcher
+
+
+class CountingLabel(QLabel):
+    def __init__(self) -> None:
+        super().__init__()
+        self.set_text_calls = 0
+
+    def setText(self, text: str | None) -> None:  # noqa: N802
+        self.set_text_calls += 1
+        super().setText(text)
+
+
+@pytest.mark.usefixtures("qapp")
+def test_only_final_state_is_flushed() -> None:
+    status_bar = QStatusBar()
+    label = CountingLabel()
+    batcher = StatusUpdateBatcher(status_bar)
+
+    for i in range(100):
+        batcher.set_text(label, f"Actions: {i}")
+        batcher.show_message(f"Message {i}", 1000)
+
+    assert label.set_text_calls == 0
+
+    batcher.flush()
+    assert label.set_text_calls == 1
+    assert label.text() == "Actions: 99"
+    assert status_bar.currentMessage() == "Message 99"
+
+
+def test_action_burst_updates_counter_once(qapp: QApplication) -> None:
+    window = MainWindow()
+    window.set_document(Document(content=b"bonjour"))
+    window.document_view.select_all()
+    window.show()
+    qapp.processEvents()
+
+    for _ in range(30):
+        window.copy_action.trigger()
+    assert window.action_counter_label.text() != f"Actions: {window.action_counter}"
+
+    qapp.processEvents()
+    assert window.action_counter_label.text() == f"Actions: {window.action_counter}"
+    status_bar = window.statusBar()
+    assert status_bar is not None
+    assert status_bar.currentMessage() == "Contenu copié"
+    window.close()
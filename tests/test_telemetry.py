@@ -0,0 +1,130 @@
+from pathlib import Path
+
+from PyQt6.QtWidgets import QApplication
+
+from src.file_io import FileIOWorker
+from src.main_windows import MainWindow
+from src.telemetry import UsageFlushWorker, UsageLoadWorker, UsageLog, UsageRecorder, UsageStats
+from helpers import wait_until
+
+
+def loaded_stats(qapp: QApplication, recorder: UsageRecorder) -> UsageStats:
+    received: list[UsageStats] = []
+    recorder.loaded.connect(received.append)
+    recorder.load()
+    wait_until(qapp, lambda: bool(received))
+    return received[0]
+
+
+def test_log_round_trip_skips_truncated_lines(tmp_path: Path) -> None:
+    log = UsageLog(tmp_path / "telemetry")
+    log.append([(1.0, "copy", 0.5), (2.0, "paste", 1.5), (3.0, "copy", 1.5)])
+    with open(log.current_path, "a", encoding="utf-8") as file:
+        file.write("4.0\tcop")
+
+    stats = log.load()
+    assert stats.counts == {"copy": 2, "paste": 1}
+    assert stats.mean_latency("copy") == 1.0
+    assert stats.last_used["copy"] == 3.0
+
+
+def test_rotation_folds_old_segments_into_summary(tmp_path: Path) -> None:
+    log = UsageLog(tmp_path, segment_size=100, max_segments=2)
+    for batch in range(20):
+        log.append([(float(batch), "save", 2.0)] * 3)
+
+    assert len(log.segments()) == 2
+    assert log.summary_path.exists()
+    stats = log.load()
+    assert stats.counts == {"save": 60}
+    assert stats.latencies["save"] == 120.0
+
+
+def test_recorder_writes_in_batches(qapp: QApplication, tmp_path: Path) -> None:
+    log = UsageLog(tmp_path)
+    recorder = UsageRecorder(log, batch_size=3, flush_interval=60_000)
+    recorder.record("copy", 0.1)
+    recorder.record("copy", 0.1)
+    qapp.processEvents()
+    # Aucune écriture disque avant un lot complet
+    assert not log.current_path.exists()
+
+    recorder.record("cut", 0.2)
+    wait_until(qapp, lambda: recorder.worker is None and log.current_path.exists())
+    assert log.load().counts == {"copy": 2, "cut": 1}
+
+
+def test_recorder_flushes_after_interval(qapp: QApplication, tmp_path: Path) -> None:
+    log = UsageLog(tmp_path)
+    recorder = UsageRecorder(log, batch_size=100, flush_interval=10)
+    recorder.record("undo", 0.3)
+
+    wait_until(qapp, lambda: log.current_path.exists() and recorder.worker is None)
+    assert log.load().counts == {"undo": 1}
+
+
+def test_loaded_history_counts_each_event_once(qapp: QApplication, tmp_path: Path) -> None:
+    log = UsageLog(tmp_path)
+    log.append([(1.0, "open", 10.0)] * 5)
+    recorder = UsageRecorder(log, batch_size=2, flush_interval=60_000)
+    for _ in range(3):
+        recorder.record("open", 10.0)
+
+    stats = loaded_stats(qapp, recorder)
+    wait_until(qapp, lambda: recorder.worker is None)
+    assert stats.counts == {"open": 8}
+
+    recorder.close()
+    assert log.load().counts == {"open": 8}
+
+
+def test_unreadable_history_is_not_reloaded(qapp: QApplication, tmp_path: Path) -> None:
+    log = UsageLog(tmp_path)
+    # Un répertoire à la place du journal : chargement et écritures échouent
+    log.current_path.mkdir()
+    recorder = UsageRecorder(log, batch_size=2, flush_interval=60_000, max_pending=3)
+    started: list[FileIOWorker] = []
+    start_worker = recorder.start_worker
+
+    def count(worker: FileIOWorker) -> None:
+        started.append(worker)
+        start_worker(worker)
+
+    recorder.start_worker = count  # type: ignore[method-assign]
+    recorder.record("copy", 0.1)
+
+    stats = loaded_stats(qapp, recorder)
+    assert stats.counts == {"copy": 1}
+    assert not recorder.load_requested and not recorder.history_available
+
+    # Le chargement n'est pas relancé, les lots suivants sont bien confiés au pool
+    recorder.record("copy", 0.1)
+    wait_until(qapp, lambda: recorder.worker is None and not recorder.pending)
+    assert [type(worker) for worker in started] == [UsageLoadWorker, UsageFlushWorker]
+    assert loaded_stats(qapp, recorder) is recorder.stats
+    assert len(started) == 2
+
+
+def test_pending_events_are_capped(tmp_path: Path) -> None:
+    recorder = UsageRecorder(UsageLog(tmp_path), batch_size=100, flush_interval=60_000, max_pending=3)
+    # Worker bloqué : les événements s'accumulent
+    recorder.worker = UsageLoadWorker(recorder.log)
+    for index in range(10):
+        recorder.record(f"action-{index}", 0.1)
+
+    assert [name for _, name, _ in recorder.pending] == ["action-7", "action-8", "action-9"]
+    assert recorder.stats.total == 10
+
+
+def test_window_persists_usage_across_sessions(qapp: QApplication, tmp_path: Path) -> None:
+    window = MainWindow(lazy=True, usage=UsageRecorder(UsageLog(tmp_path)))
+    window.bold_action.trigger()
+    window.bold_action.trigger()
+    window.close()
+
+    recorder = UsageRecorder(UsageLog(tmp_path))
+    window = MainWindow(lazy=True, usage=recorder)
+    wait_until(qapp, lambda: recorder.history_loaded)
+    assert recorder.stats.counts == {"bold": 2}
+    assert "bold : 2" in window.action_counter_label.toolTip()
+    window.close()
@@ -0,0 +1,68 @@
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from PyQt6.QtWidgets import QWidget
+
+from src.theme_manager import ThemeManager
+from src.utils import load_css
+
+
+def write_css(path: Path, content: str, mtime_ns: int) -> None:
+    path.write_text(content)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_stylesheet_is_cached_until_file_changes(tmp_path: Path) -> None:
+    light = tmp_path / "light.css"
+    write_css(light, "QWidget { color: black; }", 1_000_000_000)
+    manager = ThemeManager({"light": light, "dark": light})
+
+    assert manager.stylesheet("light") == "QWidget { color: black; }"
+
+    # Même mtime : le contenu en cache est réutilisé
+    light.write_text("QWidget { color: red; }")
+    os.utime(light, ns=(1_000_000_000, 1_000_000_000))
+    assert manager.stylesheet("light") == "QWidget { color: black; }"
+
+    # Nouveau mtime : le fichier est relu
+    write_css(light, "QWidget { color: blue; }", 2_000_000_000)
+    assert manager.stylesheet("light") == "QWidget { color: blue; }"
+
+
+@pytest.mark.usefixtures("qapp")
+def test_apply_skips_active_theme(tmp_path: Path) -> None:
+    light = tmp_path / "light.css"
+    dark = tmp_path / "dark.css"
+    write_css(light, "QWidget { color: black; }", 1_000_000_000)
+    write_css(dark, "QWidget { color: white; }", 1_000_000_000)
+    manager = ThemeManager({"light": light, "dark": dark})
+    widget = QWidget()
+
+    assert manager.apply(widget, "light") is True
+    assert manager.apply(widget, "light") is False
+    assert manager.apply(widget, "dark") is True
+    assert widget.styleSheet() == "QWidget { color: white; }"
+
+
+@pytest.mark.usefixtures("qapp")
+def test_alternating_themes_reuse_full_stylesheets(tmp_path: Path) -> None:
+    light = tmp_path / "light.css"
+    dark = tmp_path / "dark.css"
+    write_css(light, "QWidget { color: black; }", 1_000_000_000)
+    write_css(dark, "QWidget { color: white; }", 1_000_000_000)
+    extra = ["QLabel { color: red; }"]
+    manager = ThemeManager({"light": light, "dark": dark}, extra_stylesheet=lambda: extra[0])
+    widget = QWidget()
+
+    with patch("src.theme_manager.load_css", wraps=load_css) as loads:
+        for theme in ("light", "dark") * 3:
+            manager.apply(widget, theme)
+    assert loads.call_count == 2
+    assert widget.styleSheet() == "QWidget { color: white; }QLabel { color: red; }"
+
+    # Règles supplémentaires modifiées : refresh reconstruit la feuille sans relire le fichier
+    extra[0] = "QLabel { color: green; }"
+    assert manager.refresh(widget)
+    assert widget.styleSheet() == "QWidget { color: white; }QLabel { color: green; }"